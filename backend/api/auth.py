@@ -2,20 +2,31 @@
 Authentication utilities for Open Feis.
 Handles password hashing and JWT token management.
 """
+import base64
+import hashlib
+import hmac
 import logging
 import os
 import secrets
-from datetime import datetime, timedelta
+import threading
+import time
+from dataclasses import dataclass
+from datetime import timedelta
+from functools import lru_cache
 from typing import Optional
 from uuid import UUID
-from passlib.context import CryptContext
-from jose import JWTError, jwt
-from fastapi import Depends, HTTPException, status
+import anyio
+import bcrypt
+import orjson
+from cachetools import TTLCache
+from jwt import InvalidTokenError, api_jws
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import OAuth2PasswordBearer
-from sqlmodel import Session, select
+from sqlalchemy.orm import make_transient_to_detached, raiseload
+from sqlmodel import Session, func, select
 
 from backend.db.database import get_session
-from backend.scoring_engine.models_platform import User, RoleType
+from backend.scoring_engine.models_platform import User, RoleType, FeisOrganizer
 
 logger = logging.getLogger(__name__)
 
@@ -36,60 +47,359 @@ if not SECRET_KEY:
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_HOURS = 24
 
+# Encoded once so signing/verification don't re-encode the key on every call.
+_SECRET_BYTES = SECRET_KEY.encode("utf-8")
+_ALGS = [ALGORITHM]
+
+# Number of verified tokens whose claims are kept in memory.
+TOKEN_CACHE_SIZE = 4096
+
+# Key for the PIN lookup digest. Day-of PINs only have 10^6 values, so the
+# digest stored next to the bcrypt hash must be keyed with a secret that
+# never lives in the database. Falls back to the JWT secret.
+PIN_PEPPER = (os.getenv("OPENFEIS_PIN_PEPPER") or SECRET_KEY).encode("utf-8")
+# With neither secret set the pepper is random per process, so lookup digests
+# stored before a restart stop matching and PIN login falls back to bcrypt.
+PIN_PEPPER_IS_EPHEMERAL = not (os.getenv("OPENFEIS_PIN_PEPPER") or os.getenv("OPENFEIS_JWT_SECRET"))
+if PIN_PEPPER_IS_EPHEMERAL:
+    logger.warning(
+        "OPENFEIS_PIN_PEPPER is not set; day-of PIN lookups written before a restart "
+        "will be re-derived on each adjudicator's next login. Set OPENFEIS_PIN_PEPPER "
+        "(or OPENFEIS_JWT_SECRET) to keep them stable."
+    )
+
+# ============= User Cache =============
+
+USER_CACHE_SIZE = 10_000
+USER_CACHE_TTL = 60  # seconds a looked-up user row is reused
+
+_user_cache: TTLCache = TTLCache(maxsize=USER_CACHE_SIZE, ttl=USER_CACHE_TTL)
+# Email -> user id for the login paths; shares _user_cache_lock. Only emails
+# that belong to a user are kept, so a new registration is never shadowed.
+_user_email_cache: TTLCache = TTLCache(maxsize=USER_CACHE_SIZE, ttl=USER_CACHE_TTL)
+_user_cache_lock = threading.Lock()
+
+# Whether a user co-organizes any feis, keyed by user id
+_co_organizer_cache: TTLCache = TTLCache(maxsize=USER_CACHE_SIZE, ttl=USER_CACHE_TTL)
+_co_organizer_cache_lock = threading.Lock()
+
 # ============= Password Hashing =============
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# bcrypt work factor (2^rounds iterations). Raise it as hardware gets faster.
+BCRYPT_ROUNDS = int(os.getenv("OPENFEIS_BCRYPT_ROUNDS", "12"))
+_BCRYPT_PREFIX = f"$2b${BCRYPT_ROUNDS:02d}$"
 
 def hash_password(plain_password: str) -> str:
     """Hash a password using bcrypt."""
-    return pwd_context.hash(plain_password)
+    return bcrypt.hashpw(
+        plain_password.encode("utf-8"), bcrypt.gensalt(rounds=BCRYPT_ROUNDS)
+    ).decode("utf-8")
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verify a password against its hash."""
-    return pwd_context.verify(plain_password, hashed_password)
+    # Anything that isn't a bcrypt hash can't match; skip the native call.
+    if not hashed_password or not hashed_password.startswith("$2"):
+        return False
+    try:
+        return bcrypt.checkpw(plain_password.encode("utf-8"), hashed_password.encode("utf-8"))
+    except ValueError:
+        return False
+
+def pin_lookup(feis_id: UUID, pin: str) -> str:
+    """
+    Keyed digest of a feis-scoped PIN. Stored alongside the bcrypt hash so
+    PIN login can find the adjudicator with one indexed query and a single
+    bcrypt verify, instead of trying every adjudicator's hash in turn.
+    """
+    return hmac.new(PIN_PEPPER, f"{feis_id}:{pin}".encode("utf-8"), hashlib.sha256).hexdigest()
+
+def password_needs_rehash(hashed_password: str) -> bool:
+    """
+    True if a hash was made with a different bcrypt variant or cost than
+    BCRYPT_ROUNDS, so it can be upgraded the next time the password is known.
+    """
+    return not hashed_password.startswith(_BCRYPT_PREFIX)
+
+async def ahash_password(plain_password: str) -> str:
+    """Hash a password in a worker thread so the event loop isn't blocked."""
+    return await anyio.to_thread.run_sync(hash_password, plain_password)
+
+async def averify_password(plain_password: str, hashed_password: str) -> bool:
+    """Verify a password in a worker thread so the event loop isn't blocked."""
+    return await anyio.to_thread.run_sync(verify_password, plain_password, hashed_password)
 
 # ============= JWT Token Management =============
 
+def _encode_sub(user_id: UUID) -> str:
+    """Encode a user id as the 22-char unpadded URL-safe base64 of its bytes."""
+    return base64.urlsafe_b64encode(user_id.bytes).rstrip(b"=").decode("ascii")
+
+def _decode_sub(sub: str) -> UUID:
+    """Reverse _encode_sub; also accepts the 36-char form used by older tokens."""
+    if len(sub) == 22:
+        return UUID(bytes=base64.urlsafe_b64decode(sub + "=="))
+    return UUID(sub)
+
 def create_access_token(user_id: UUID, role: RoleType, expires_delta: Optional[timedelta] = None) -> str:
     """Create a JWT access token."""
     if expires_delta:
-        expire = datetime.utcnow() + expires_delta
+        lifetime = int(expires_delta.total_seconds())
     else:
-        expire = datetime.utcnow() + timedelta(hours=ACCESS_TOKEN_EXPIRE_HOURS)
+        lifetime = ACCESS_TOKEN_EXPIRE_HOURS * 3600
     
+    # Short claim keys (subject, role, expiry): tokens ride on every request.
     to_encode = {
-        "sub": str(user_id),
-        "role": role.value,
-        "exp": expire
+        "s": _encode_sub(user_id),
+        "r": role.value,
+        "e": int(time.time()) + lifetime
     }
-    encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
+    encoded_jwt = api_jws.encode(orjson.dumps(to_encode), _SECRET_BYTES, algorithm=ALGORITHM)
     return encoded_jwt
 
-def decode_access_token(token: str) -> dict:
-    """Decode and verify a JWT access token."""
+@dataclass(frozen=True, slots=True)
+class TokenClaims:
+    """Verified claims of an access token, with the subject already parsed."""
+    sub: UUID
+    role: Optional[str]
+    exp: int
+
+@lru_cache(maxsize=TOKEN_CACHE_SIZE)
+def _verify_and_decode(token: str) -> TokenClaims:
+    """
+    Verify a token's signature and return its parsed claims.
+    Cached on the raw token string so repeat requests skip the HMAC check
+    and UUID parse; expiry is enforced by the caller on every use.
+    """
+    payload = orjson.loads(api_jws.decode(token, _SECRET_BYTES, algorithms=_ALGS))
+    if "s" not in payload:
+        # Issued before the short claim keys; accepted until they expire.
+        return TokenClaims(
+            sub=_decode_sub(payload["sub"]),
+            role=payload.get("role"),
+            exp=int(payload["exp"]),
+        )
+    return TokenClaims(
+        sub=_decode_sub(payload["s"]),
+        role=payload.get("r"),
+        exp=int(payload["e"]),
+    )
+
+def _valid_claims(token: str) -> Optional[TokenClaims]:
+    """Return the verified, unexpired claims of a token, or None."""
     try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        return payload
-    except JWTError:
+        claims = _verify_and_decode(token)
+    except (InvalidTokenError, KeyError, TypeError, ValueError):
+        return None
+    if claims.exp <= int(time.time()):
+        return None
+    return claims
+
+def decode_access_token(token: str) -> TokenClaims:
+    """Decode and verify a JWT access token."""
+    claims = _valid_claims(token)
+    if claims is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Could not validate credentials",
             headers={"WWW-Authenticate": "Bearer"},
         )
+    return claims
 
 # ============= OAuth2 Scheme =============
 
-oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/v1/auth/login", auto_error=False)
+class BearerTokenScheme(OAuth2PasswordBearer):
+    """
+    OAuth2PasswordBearer with a cheaper header parse.
+    Keeps the parent's OpenAPI metadata (the docs "Authorize" flow) but
+    reads the token with a prefix check instead of splitting the header.
+    Always behaves like auto_error=False: a missing token yields None.
+    """
+    async def __call__(self, request: Request) -> Optional[str]:
+        state = request.scope.get("state")
+        if state is not None and "bearer_token" in state:
+            return state["bearer_token"]
+        authorization = request.headers.get("authorization")
+        if authorization and authorization[:7].lower() == "bearer ":
+            return authorization[7:]
+        return None
+
+oauth2_scheme = BearerTokenScheme(
+    tokenUrl="/api/v1/auth/login", scheme_name="OAuth2PasswordBearer", auto_error=False
+)
+
+class TokenClaimsMiddleware:
+    """
+    Pure ASGI middleware that extracts and verifies the bearer token once,
+    before dependency resolution, and stores the outcome in request.state
+    (bearer_token, token_claims) for the auth dependencies to reuse.
+    token_claims is None when the token is missing, invalid or expired.
+    """
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http":
+            token = None
+            for name, value in scope["headers"]:
+                if name == b"authorization":
+                    if value[:7].lower() == b"bearer ":
+                        token = value[7:].decode("latin-1")
+                    break
+            state = scope.setdefault("state", {})
+            state["bearer_token"] = token
+            state["token_claims"] = _valid_claims(token) if token else None
+        await self.app(scope, receive, send)
+
+def _request_claims(request: Request, token: str) -> TokenClaims:
+    """
+    Claims for the request's bearer token. Reuses the middleware's result
+    when available; otherwise (or for a rejected token) decodes here, which
+    raises the appropriate 401.
+    """
+    state = request.scope.get("state")
+    claims = state.get("token_claims") if state is not None else None
+    return claims if claims is not None else decode_access_token(token)
 
 # ============= Dependencies =============
 
-async def get_current_user(
+@dataclass(frozen=True, slots=True)
+class Principal:
+    """
+    Lightweight view of the authenticated user for role-gated endpoints.
+    Carries the scalar fields handlers read without building an ORM row;
+    use get_current_user when the User itself must be modified.
+    """
+    id: UUID
+    role: RoleType
+    name: str
+    email: str
+    email_verified: bool
+
+def _user_data(session: Session, user_id: UUID) -> Optional[dict]:
+    """
+    Return the user's column values, cached for USER_CACHE_TTL seconds so
+    chatty clients don't hit the database on every call. On a miss the row
+    is loaded in a single SELECT with relationships set to raise on access,
+    so an accidental lazy load of dancers/feiseanna from an auth dependency
+    fails loudly in tests.
+    """
+    with _user_cache_lock:
+        data = _user_cache.get(user_id)
+    if data is None:
+        user = session.exec(
+            select(User).where(User.id == user_id).options(raiseload("*"))
+        ).first()
+        if user is None:
+            return None
+        data = {column.key: getattr(user, column.key) for column in User.__table__.columns}
+        with _user_cache_lock:
+            _user_cache[user_id] = data
+    return data
+
+def _load_user(session: Session, user_id: UUID) -> Optional[User]:
+    """
+    Fetch the user row for an authenticated request. Cached rows are
+    re-attached to the request session without SQL, so handlers can still
+    modify and commit current_user as usual.
+    """
+    data = _user_data(session, user_id)
+    if data is None:
+        return None
+    user = User(**data)
+    make_transient_to_detached(user)
+    return session.merge(user, load=False)
+
+def _load_principal(session: Session, user_id: UUID) -> Optional[Principal]:
+    """Build a Principal from the cached user row, without an ORM instance."""
+    data = _user_data(session, user_id)
+    if data is None:
+        return None
+    return Principal(
+        id=data["id"],
+        role=data["role"],
+        name=data["name"],
+        email=data["email"],
+        email_verified=data["email_verified"],
+    )
+
+def get_user_by_email(session: Session, email: str) -> Optional[User]:
+    """
+    Look up a user by email for login and verification emails. Addresses
+    match case-insensitively (through the ix_user_email_lower index), with
+    an exact match preferred. Repeat lookups of the same address (login
+    retries, resend clicks) are answered from the user cache; the returned
+    row is attached to the session either way.
+    """
+    # Keyed on the address as typed: legacy accounts can differ only in case,
+    # and each spelling must keep resolving to its own exact match
+    email = email.strip()
+    with _user_cache_lock:
+        user_id = _user_email_cache.get(email)
+    if user_id is not None:
+        user = _load_user(session, user_id)
+        if user is not None:
+            return user
+    user = session.exec(
+        select(User)
+        .where(func.lower(User.email) == func.lower(email))
+        .order_by((User.email == email).desc())
+        .limit(1)
+    ).first()
+    if user is None:
+        return None
+    data = {column.key: getattr(user, column.key) for column in User.__table__.columns}
+    with _user_cache_lock:
+        _user_cache[user.id] = data
+        _user_email_cache[email] = user.id
+    return user
+
+def invalidate_cached_user(user_id: UUID) -> None:
+    """Drop a user from the auth cache after their row has been modified."""
+    with _user_cache_lock:
+        _user_cache.pop(user_id, None)
+        # The old address may no longer be theirs (e.g. an email change)
+        for key in [key for key, cached_id in _user_email_cache.items() if cached_id == user_id]:
+            _user_email_cache.pop(key, None)
+
+def clear_user_cache() -> None:
+    """Drop every cached user (e.g. after bulk deletes)."""
+    with _user_cache_lock:
+        _user_cache.clear()
+        _user_email_cache.clear()
+
+def is_co_organizer(session: Session, user_id: UUID) -> bool:
+    """
+    Whether the user is a co-organizer (FeisOrganizer entry) of any feis,
+    cached for USER_CACHE_TTL seconds since /auth/me asks on every page load.
+    """
+    with _co_organizer_cache_lock:
+        cached = _co_organizer_cache.get(user_id)
+    if cached is not None:
+        return cached
+    co_org = session.exec(
+        select(FeisOrganizer.id).where(FeisOrganizer.user_id == user_id).limit(1)
+    ).first()
+    result = co_org is not None
+    with _co_organizer_cache_lock:
+        _co_organizer_cache[user_id] = result
+    return result
+
+def invalidate_cached_co_organizer(user_id: UUID) -> None:
+    """Drop a user's co-organizer flag after their FeisOrganizer rows change."""
+    with _co_organizer_cache_lock:
+        _co_organizer_cache.pop(user_id, None)
+
+def get_current_user(
+    request: Request,
     token: Optional[str] = Depends(oauth2_scheme),
     session: Session = Depends(get_session)
 ) -> User:
     """
     Dependency to get the current authenticated user from JWT token.
     Raises 401 if token is invalid or user not found.
+
+    Declared as a plain function so FastAPI runs it (and its blocking
+    SQLite lookup) in the threadpool instead of on the event loop.
     """
     if not token:
         raise HTTPException(
@@ -98,27 +408,50 @@ async def get_current_user(
             headers={"WWW-Authenticate": "Bearer"},
         )
     
-    payload = decode_access_token(token)
-    user_id = payload.get("sub")
+    claims = _request_claims(request, token)
+    user = _load_user(session, claims.sub)
+    if user is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="User not found",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
     
-    if user_id is None:
+    return user
+
+def get_current_principal(
+    request: Request,
+    token: Optional[str] = Depends(oauth2_scheme),
+    session: Session = Depends(get_session)
+) -> Principal:
+    """
+    Dependency to get the authenticated user as a Principal.
+    Same 401 behaviour as get_current_user, but served from the user cache
+    without constructing or attaching an ORM row. The role comes from the
+    cached row rather than the token: changes made through the API invalidate
+    the cache and apply on the next request, while edits made directly in the
+    database show up within USER_CACHE_TTL seconds.
+    """
+    if not token:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Could not validate credentials",
+            detail="Not authenticated",
             headers={"WWW-Authenticate": "Bearer"},
         )
     
-    user = session.get(User, UUID(user_id))
-    if user is None:
+    claims = _request_claims(request, token)
+    principal = _load_principal(session, claims.sub)
+    if principal is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="User not found",
             headers={"WWW-Authenticate": "Bearer"},
         )
     
-    return user
+    return principal
 
-async def get_optional_user(
+def get_optional_user(
+    request: Request,
     token: Optional[str] = Depends(oauth2_scheme),
     session: Session = Depends(get_session)
 ) -> Optional[User]:
@@ -130,42 +463,43 @@ async def get_optional_user(
         return None
     
     try:
-        payload = decode_access_token(token)
-        user_id = payload.get("sub")
-        if user_id:
-            return session.get(User, UUID(user_id))
+        claims = _request_claims(request, token)
+        return _load_user(session, claims.sub)
     except HTTPException:
         pass
     
     return None
 
+# One bit per role so a checker tests membership with a single AND.
+_ROLE_BIT = {role: 1 << i for i, role in enumerate(RoleType)}
+
+@lru_cache(maxsize=None)
 def require_role(*allowed_roles: RoleType):
     """
     Dependency factory to require specific roles.
     Usage: Depends(require_role(RoleType.SUPER_ADMIN, RoleType.ORGANIZER))
+
+    Memoized, so every endpoint asking for the same roles shares one
+    checker; the role mask and error detail are built once per checker.
+    The checker yields a Principal, not an ORM User.
     """
-    async def role_checker(current_user: User = Depends(get_current_user)) -> User:
-        if current_user.role not in allowed_roles:
+    mask = 0
+    for role in allowed_roles:
+        mask |= _ROLE_BIT[role]
+    detail = f"Insufficient permissions. Required roles: {[r.value for r in allowed_roles]}"
+    
+    async def role_checker(current_user: Principal = Depends(get_current_principal)) -> Principal:
+        if not _ROLE_BIT[current_user.role] & mask:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
-                detail=f"Insufficient permissions. Required roles: {[r.value for r in allowed_roles]}"
+                detail=detail
             )
         return current_user
     return role_checker
 
-def require_admin():
-    """Shortcut for requiring super_admin role."""
-    return require_role(RoleType.SUPER_ADMIN)
-
-def require_organizer_or_admin():
-    """Shortcut for requiring organizer or super_admin role."""
-    return require_role(RoleType.SUPER_ADMIN, RoleType.ORGANIZER)
-
-def require_adjudicator():
-    """Shortcut for requiring adjudicator or super_admin role."""
-    return require_role(RoleType.ADJUDICATOR, RoleType.SUPER_ADMIN)
-
-def require_teacher():
-    """Shortcut for requiring teacher, organizer, or super_admin role."""
-    return require_role(RoleType.TEACHER, RoleType.ORGANIZER, RoleType.SUPER_ADMIN)
+# Shared checkers for the common role combinations; use as Depends(REQUIRE_ADMIN).
+REQUIRE_ADMIN = require_role(RoleType.SUPER_ADMIN)
+REQUIRE_ORG_OR_ADMIN = require_role(RoleType.SUPER_ADMIN, RoleType.ORGANIZER)
+REQUIRE_ADJUDICATOR = require_role(RoleType.ADJUDICATOR, RoleType.SUPER_ADMIN)
+REQUIRE_TEACHER = require_role(RoleType.TEACHER, RoleType.ORGANIZER, RoleType.SUPER_ADMIN)
 
@@ -0,0 +1,158 @@
+"""
+In-process rate limiting for Open Feis.
+Sliding-window limits for endpoints that are cheap to call but expensive to
+serve, such as password logins (bcrypt) and verification emails.
+"""
+import ipaddress
+import os
+import threading
+import time
+from collections import deque
+from typing import Callable, Optional
+
+from cachetools import TTLCache
+from fastapi import HTTPException, Request, status
+
+# Number of distinct keys (IPs, emails) tracked per limiter.
+RATE_LIMIT_MAX_KEYS = 10_000
+
+TOO_MANY_REQUESTS = "Too many requests. Please try again later."
+
+# Peers whose X-Forwarded-For header is believed, as comma-separated
+# addresses or CIDR ranges. Loopback only by default: a port published by
+# Docker reaches the app from the bridge gateway, so the bridge range is only
+# safe to trust where nothing but the proxy can connect (see
+# docker-compose.yml, which sets Caddy's network here).
+TRUSTED_PROXIES = [
+    ipaddress.ip_network(net.strip(), strict=False)
+    for net in os.getenv("OPENFEIS_TRUSTED_PROXIES", "127.0.0.0/8,::1").split(",")
+    if net.strip()
+]
+
+
+def _raise_if_limited(retry_after: float, detail: str) -> None:
+    if retry_after > 0:
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail=detail,
+            headers={"Retry-After": str(max(1, int(retry_after + 0.999)))},
+        )
+
+
+class SlidingWindowLimiter:
+    """
+    Allow at most `limit` hits per key in any `window_seconds` span.
+
+    Each key keeps the times of its recent hits; a key with no hits for a
+    whole window expires from the cache on its own.
+    """
+
+    def __init__(self, limit: int, window_seconds: float, max_keys: int = RATE_LIMIT_MAX_KEYS):
+        self.limit = limit
+        self.window_seconds = window_seconds
+        self._hits: TTLCache = TTLCache(maxsize=max_keys, ttl=window_seconds)
+        self._lock = threading.Lock()
+
+    def _recent_hits(self, key: str, now: float) -> deque:
+        """The key's hits inside the current window. Call with the lock held."""
+        hits = self._hits.get(key)
+        if hits is None:
+            hits = deque()
+        while hits and hits[0] <= now - self.window_seconds:
+            hits.popleft()
+        return hits
+
+    def retry_after(self, key: str) -> float:
+        """Seconds until `key` may hit again (0 if it may now), without recording a hit."""
+        now = time.monotonic()
+        with self._lock:
+            hits = self._recent_hits(key, now)
+            if len(hits) >= self.limit:
+                return hits[0] + self.window_seconds - now
+            return 0.0
+
+    def hit(self, key: str) -> float:
+        """
+        Record a hit for `key`. Returns 0 if it is allowed, otherwise the
+        number of seconds until the next hit would be. Rejected hits are not
+        recorded, so a blocked client is let back in once its window slides.
+        """
+        now = time.monotonic()
+        with self._lock:
+            hits = self._recent_hits(key, now)
+            if len(hits) >= self.limit:
+                return hits[0] + self.window_seconds - now
+            hits.append(now)
+            self._hits[key] = hits
+            return 0.0
+
+    def check(self, key: str, detail: str = TOO_MANY_REQUESTS) -> None:
+        """Record a hit for `key`, raising 429 with Retry-After if over the limit."""
+        _raise_if_limited(self.hit(key), detail)
+
+    def ensure_allowed(self, key: str, detail: str = TOO_MANY_REQUESTS) -> None:
+        """
+        Raise 429 if `key` is already at its limit, without recording a hit.
+        For limits that only count failures, recorded with hit() as they happen.
+        """
+        _raise_if_limited(self.retry_after(key), detail)
+
+    def clear(self) -> None:
+        """Forget every recorded hit."""
+        with self._lock:
+            self._hits.clear()
+
+
+# Password logins, per client IP and per account. The IP limit is the looser
+# of the two since a venue's devices often share one address. The account
+# limit only counts failed logins, so knowing an email can't lock its owner
+# out and busy shared accounts don't throttle themselves.
+LOGIN_IP_LIMITER = SlidingWindowLimiter(limit=30, window_seconds=60)
+LOGIN_EMAIL_LIMITER = SlidingWindowLimiter(limit=10, window_seconds=60)
+
+# Verification emails: requests per client IP, and sends per account per day
+# on top of the 60-second spacing enforced by can_resend_verification.
+RESEND_IP_LIMITER = SlidingWindowLimiter(limit=10, window_seconds=60)
+RESEND_DAILY_LIMITER = SlidingWindowLimiter(limit=5, window_seconds=24 * 60 * 60)
+
+
+def _is_trusted_proxy(host: str) -> bool:
+    try:
+        address = ipaddress.ip_address(host)
+    except ValueError:
+        return False
+    return any(address in network for network in TRUSTED_PROXIES)
+
+
+def client_ip(request: Request) -> str:
+    """
+    Best-effort client address. Behind a trusted proxy (Caddy) this is the
+    right-most X-Forwarded-For entry that is not itself a trusted proxy;
+    otherwise the header is ignored, so clients cannot spoof it.
+    """
+    host = request.client.host if request.client else "unknown"
+    if not _is_trusted_proxy(host):
+        return host
+    forwarded = request.headers.get("x-forwarded-for", "")
+    for candidate in reversed([part.strip() for part in forwarded.split(",")]):
+        if not candidate:
+            continue
+        if not _is_trusted_proxy(candidate):
+            return candidate
+        host = candidate
+    return host
+
+
+def rate_limit(limiter: SlidingWindowLimiter, scope: str) -> Callable[[Request], None]:
+    """
+    Dependency factory that limits a route per client IP, e.g.
+    `dependencies=[Depends(rate_limit(LOGIN_IP_LIMITER, "login"))]`.
+    """
+    def dependency(request: Request) -> None:
+        limiter.check(f"{scope}:{client_ip(request)}")
+    return dependency
+
+
+def email_key(email: Optional[str]) -> str:
+    """Normalize an email address for use as a rate limit key."""
+    return (email or "").strip().lower()
@@ -13,13 +13,17 @@ Routes:
 """
 from fastapi import APIRouter, HTTPException, Depends
 from typing import List, Optional
-from uuid import UUID
+from uuid import UUID, uuid4
 from datetime import datetime, timedelta
-from sqlmodel import Session, select
+from sqlalchemy import or_
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import joinedload
+from sqlmodel import Session, delete, func, select, update
 from backend.db.database import get_session
 from backend.api.auth import (
-    get_current_user, get_optional_user, require_organizer_or_admin,
-    hash_password, verify_password, create_access_token
+    get_current_user, get_optional_user, REQUIRE_ORG_OR_ADMIN,
+    ahash_password, averify_password, create_access_token, get_user_by_email,
+    invalidate_cached_user, pin_lookup, Principal, PIN_PEPPER_IS_EPHEMERAL
 )
 from backend.scoring_engine.models_platform import (
     User, Feis, Competition, RoleType,
@@ -34,31 +38,94 @@ from backend.api.schemas import (
     GeneratePinResponse, PinLoginRequest, PinLoginResponse,
     UserResponse
 )
-from backend.services.email import get_site_settings
+from backend.services.email import get_cached_site_settings
+from cachetools import TTLCache
 import secrets
-import random
+import threading
 
 router = APIRouter()
 
+PIN_FEIS_CACHE_TTL = 300  # seconds a feis's "has any PINs" answer is reused
 
-# ============= Adjudicator CRUD =============
+# feis_id -> whether any adjudicator on the roster has a PIN. Lets PIN guesses
+# against a feis that never issued PINs fail without touching the database.
+_feis_has_pins: TTLCache = TTLCache(maxsize=1024, ttl=PIN_FEIS_CACHE_TTL)
+_feis_has_pins_lock = threading.Lock()
 
-@router.get("/adjudicators/{adjudicator_id}", response_model=AdjudicatorResponse)
-async def get_adjudicator(
-    adjudicator_id: str,
-    session: Session = Depends(get_session)
-):
-    """Get a specific adjudicator by ID."""
-    adjudicator = session.get(FeisAdjudicator, UUID(adjudicator_id))
-    if not adjudicator:
-        raise HTTPException(status_code=404, detail="Adjudicator not found")
-    
-    school_name = None
-    if adjudicator.school_affiliation_id:
-        school = session.get(User, adjudicator.school_affiliation_id)
-        if school:
-            school_name = school.name
-    
+# Adjudicators whose access_pin_lookup was written with this process's
+# PIN_PEPPER. Only consulted when the pepper is ephemeral, to tell lookups
+# from before a restart (which need the bcrypt fallback) from current ones.
+_current_pepper_pins: set = set()
+_current_pepper_pins_lock = threading.Lock()
+
+
+def _adjudicator_with_school(session: Session, adjudicator_id: UUID):
+    """Load an adjudicator and their school's name in one query (None if missing)."""
+    return session.exec(
+        select(FeisAdjudicator, User.name)
+        .outerjoin(User, User.id == FeisAdjudicator.school_affiliation_id)
+        .where(FeisAdjudicator.id == adjudicator_id)
+    ).first()
+
+
+def _get_adjudicator_with_feis(session: Session, adjudicator_id: UUID) -> Optional[FeisAdjudicator]:
+    """Load an adjudicator together with its feis (for organizer checks) in one query."""
+    return session.exec(
+        select(FeisAdjudicator)
+        .options(joinedload(FeisAdjudicator.feis))
+        .where(FeisAdjudicator.id == adjudicator_id)
+    ).first()
+
+
+def _organizer_adjudicator(action: str):
+    """
+    Dependency factory: load the path's adjudicator (with its feis) and check
+    that the caller organizes that feis or is a super admin.
+    """
+    async def dependency(
+        adjudicator_id: str,
+        session: Session = Depends(get_session),
+        current_user: Principal = Depends(REQUIRE_ORG_OR_ADMIN)
+    ) -> FeisAdjudicator:
+        adjudicator = _get_adjudicator_with_feis(session, UUID(adjudicator_id))
+        if not adjudicator:
+            raise HTTPException(status_code=404, detail="Adjudicator not found")
+        
+        if current_user.role != RoleType.SUPER_ADMIN and adjudicator.feis.organizer_id != current_user.id:
+            raise HTTPException(status_code=403, detail=f"Only the feis organizer can {action}")
+        return adjudicator
+    return dependency
+
+
+def _feis_issued_pins(session: Session, feis_id: UUID) -> bool:
+    """Whether any adjudicator on the feis roster has a day-of PIN (cached)."""
+    with _feis_has_pins_lock:
+        has_pins = _feis_has_pins.get(feis_id)
+    if has_pins is None:
+        has_pins = session.exec(
+            select(FeisAdjudicator.id)
+            .where(FeisAdjudicator.feis_id == feis_id)
+            .where(FeisAdjudicator.access_pin_hash.isnot(None))
+            .limit(1)
+        ).first() is not None
+        with _feis_has_pins_lock:
+            _feis_has_pins[feis_id] = has_pins
+    return has_pins
+
+
+_DUMMY_PIN_HASH: Optional[str] = None
+
+
+async def _dummy_pin_hash() -> str:
+    """A throwaway PIN hash at the configured bcrypt cost, made on first use."""
+    global _DUMMY_PIN_HASH
+    if _DUMMY_PIN_HASH is None:
+        _DUMMY_PIN_HASH = await ahash_password(secrets.token_urlsafe(16))
+    return _DUMMY_PIN_HASH
+
+
+def _serialize_adjudicator(adjudicator: FeisAdjudicator, school_name: Optional[str]) -> AdjudicatorResponse:
+    """Build the API response for an adjudicator."""
     return AdjudicatorResponse(
         id=str(adjudicator.id),
         feis_id=str(adjudicator.feis_id),
@@ -79,22 +146,30 @@ async def get_adjudicator(
     )
 
 
+# ============= Adjudicator CRUD =============
+
+@router.get("/adjudicators/{adjudicator_id}", response_model=AdjudicatorResponse)
+async def get_adjudicator(
+    adjudicator_id: str,
+    session: Session = Depends(get_session)
+):
+    """Get a specific adjudicator by ID."""
+    row = _adjudicator_with_school(session, UUID(adjudicator_id))
+    if not row:
+        raise HTTPException(status_code=404, detail="Adjudicator not found")
+    
+    adjudicator, school_name = row
+    return _serialize_adjudicator(adjudicator, school_name)
+
+
 @router.put("/adjudicators/{adjudicator_id}", response_model=AdjudicatorResponse)
 async def update_adjudicator(
     adjudicator_id: str,
     update_data: AdjudicatorUpdate,
     session: Session = Depends(get_session),
-    current_user: User = Depends(require_organizer_or_admin())
+    adjudicator: FeisAdjudicator = Depends(_organizer_adjudicator("update adjudicators"))
 ):
     """Update an adjudicator's details. Requires organizer or admin role."""
-    adjudicator = session.get(FeisAdjudicator, UUID(adjudicator_id))
-    if not adjudicator:
-        raise HTTPException(status_code=404, detail="Adjudicator not found")
-    
-    feis = session.get(Feis, adjudicator.feis_id)
-    if current_user.role != RoleType.SUPER_ADMIN and feis.organizer_id != current_user.id:
-        raise HTTPException(status_code=403, detail="Only the feis organizer can update adjudicators")
-    
     if update_data.name is not None:
         adjudicator.name = update_data.name
     if update_data.email is not None:
@@ -116,61 +191,33 @@ async def update_adjudicator(
     
     session.add(adjudicator)
     session.commit()
-    session.refresh(adjudicator)
     
-    school_name = None
-    if adjudicator.school_affiliation_id:
-        school = session.get(User, adjudicator.school_affiliation_id)
-        if school:
-            school_name = school.name
-    
-    return AdjudicatorResponse(
-        id=str(adjudicator.id),
-        feis_id=str(adjudicator.feis_id),
-        user_id=str(adjudicator.user_id) if adjudicator.user_id else None,
-        name=adjudicator.name,
-        email=adjudicator.email,
-        phone=adjudicator.phone,
-        credential=adjudicator.credential,
-        organization=adjudicator.organization,
-        school_affiliation_id=str(adjudicator.school_affiliation_id) if adjudicator.school_affiliation_id else None,
-        school_affiliation_name=school_name,
-        status=adjudicator.status,
-        invite_sent_at=adjudicator.invite_sent_at,
-        invite_expires_at=adjudicator.invite_expires_at,
-        has_access_pin=adjudicator.access_pin_hash is not None,
-        created_at=adjudicator.created_at,
-        confirmed_at=adjudicator.confirmed_at
-    )
+    # Reloads the committed row together with the (possibly new) school name
+    adjudicator, school_name = _adjudicator_with_school(session, adjudicator.id)
+    return _serialize_adjudicator(adjudicator, school_name)
 
 
 @router.delete("/adjudicators/{adjudicator_id}")
 async def delete_adjudicator(
     adjudicator_id: str,
     session: Session = Depends(get_session),
-    current_user: User = Depends(require_organizer_or_admin())
+    adjudicator: FeisAdjudicator = Depends(_organizer_adjudicator("remove adjudicators"))
 ):
     """Remove an adjudicator from the feis roster. Requires organizer or admin role."""
-    adjudicator = session.get(FeisAdjudicator, UUID(adjudicator_id))
-    if not adjudicator:
-        raise HTTPException(status_code=404, detail="Adjudicator not found")
-    
-    feis = session.get(Feis, adjudicator.feis_id)
-    if current_user.role != RoleType.SUPER_ADMIN and feis.organizer_id != current_user.id:
-        raise HTTPException(status_code=403, detail="Only the feis organizer can remove adjudicators")
-    
-    assigned_comps = session.exec(
-        select(Competition).where(Competition.adjudicator_id == adjudicator.user_id)
-    ).all() if adjudicator.user_id else []
+    assigned_count = session.exec(
+        select(func.count(Competition.id)).where(Competition.adjudicator_id == adjudicator.user_id)
+    ).one() if adjudicator.user_id else 0
     
-    if assigned_comps:
+    if assigned_count:
         raise HTTPException(
             status_code=400, 
-            detail=f"Cannot remove adjudicator who is assigned to {len(assigned_comps)} competition(s). Unassign them first."
+            detail=f"Cannot remove adjudicator who is assigned to {assigned_count} competition(s). Unassign them first."
         )
     
-    for block in session.exec(select(AdjudicatorAvailability).where(AdjudicatorAvailability.feis_adjudicator_id == UUID(adjudicator_id))).all():
-        session.delete(block)
+    session.exec(
+        delete(AdjudicatorAvailability)
+        .where(AdjudicatorAvailability.feis_adjudicator_id == adjudicator.id)
+    )
     
     session.delete(adjudicator)
     session.commit()
@@ -186,33 +233,21 @@ async def get_adjudicator_availability(
     session: Session = Depends(get_session)
 ):
     """Get all availability blocks for an adjudicator."""
-    adjudicator = session.get(FeisAdjudicator, UUID(adjudicator_id))
+    adjudicator = _get_adjudicator_with_feis(session, UUID(adjudicator_id))
     if not adjudicator:
         raise HTTPException(status_code=404, detail="Adjudicator not found")
     
-    feis = session.get(Feis, adjudicator.feis_id)
+    feis = adjudicator.feis
     
     blocks = session.exec(
         select(AdjudicatorAvailability)
-        .where(AdjudicatorAvailability.feis_adjudicator_id == UUID(adjudicator_id))
+        .where(AdjudicatorAvailability.feis_adjudicator_id == adjudicator.id)
         .order_by(AdjudicatorAvailability.feis_day, AdjudicatorAvailability.start_time)
     ).all()
     
     feis_dates = [feis.date]
     
-    block_responses = [
-        AvailabilityBlockResponse(
-            id=str(block.id),
-            feis_adjudicator_id=str(block.feis_adjudicator_id),
-            feis_day=block.feis_day,
-            start_time=block.start_time,
-            end_time=block.end_time,
-            availability_type=block.availability_type,
-            note=block.note,
-            created_at=block.created_at
-        )
-        for block in blocks
-    ]
+    block_responses = [AvailabilityBlockResponse.model_validate(block) for block in blocks]
     
     return AdjudicatorAvailabilityResponse(
         adjudicator_id=adjudicator_id,
@@ -228,22 +263,14 @@ async def create_availability_block(
     adjudicator_id: str,
     block_data: AvailabilityBlockCreate,
     session: Session = Depends(get_session),
-    current_user: User = Depends(require_organizer_or_admin())
+    adjudicator: FeisAdjudicator = Depends(_organizer_adjudicator("manage adjudicator availability"))
 ):
     """Create an availability block for an adjudicator. Requires organizer or admin role."""
-    adjudicator = session.get(FeisAdjudicator, UUID(adjudicator_id))
-    if not adjudicator:
-        raise HTTPException(status_code=404, detail="Adjudicator not found")
-    
-    feis = session.get(Feis, adjudicator.feis_id)
-    if current_user.role != RoleType.SUPER_ADMIN and feis.organizer_id != current_user.id:
-        raise HTTPException(status_code=403, detail="Only the feis organizer can manage adjudicator availability")
-    
     if block_data.start_time >= block_data.end_time:
         raise HTTPException(status_code=400, detail="End time must be after start time")
     
     block = AdjudicatorAvailability(
-        feis_adjudicator_id=UUID(adjudicator_id),
+        feis_adjudicator_id=adjudicator.id,
         feis_day=block_data.feis_day,
         start_time=block_data.start_time,
         end_time=block_data.end_time,
@@ -255,16 +282,7 @@ async def create_availability_block(
     session.commit()
     session.refresh(block)
     
-    return AvailabilityBlockResponse(
-        id=str(block.id),
-        feis_adjudicator_id=str(block.feis_adjudicator_id),
-        feis_day=block.feis_day,
-        start_time=block.start_time,
-        end_time=block.end_time,
-        availability_type=block.availability_type,
-        note=block.note,
-        created_at=block.created_at
-    )
+    return AvailabilityBlockResponse.model_validate(block)
 
 
 @router.post("/adjudicators/{adjudicator_id}/availability/bulk", response_model=List[AvailabilityBlockResponse])
@@ -272,60 +290,40 @@ async def create_bulk_availability(
     adjudicator_id: str,
     bulk_data: BulkAvailabilityCreate,
     session: Session = Depends(get_session),
-    current_user: User = Depends(require_organizer_or_admin())
+    adjudicator: FeisAdjudicator = Depends(_organizer_adjudicator("manage adjudicator availability"))
 ):
     """Create multiple availability blocks at once. Requires organizer or admin role."""
-    adjudicator = session.get(FeisAdjudicator, UUID(adjudicator_id))
-    if not adjudicator:
-        raise HTTPException(status_code=404, detail="Adjudicator not found")
-    
-    feis = session.get(Feis, adjudicator.feis_id)
-    if current_user.role != RoleType.SUPER_ADMIN and feis.organizer_id != current_user.id:
-        raise HTTPException(status_code=403, detail="Only the feis organizer can manage adjudicator availability")
+    # Reject the whole batch before anything is deleted or added
+    for block_data in bulk_data.blocks:
+        if block_data.start_time >= block_data.end_time:
+            raise HTTPException(status_code=400, detail=f"End time must be after start time for day {block_data.feis_day}")
     
     if bulk_data.replace_existing:
         days_to_replace = set(block.feis_day for block in bulk_data.blocks)
-        for day in days_to_replace:
-            existing = session.exec(
-                select(AdjudicatorAvailability)
-                .where(AdjudicatorAvailability.feis_adjudicator_id == UUID(adjudicator_id))
-                .where(AdjudicatorAvailability.feis_day == day)
-            ).all()
-            for existing_block in existing:
-                session.delete(existing_block)
+        session.exec(
+            delete(AdjudicatorAvailability)
+            .where(AdjudicatorAvailability.feis_adjudicator_id == adjudicator.id)
+            .where(AdjudicatorAvailability.feis_day.in_(days_to_replace))
+        )
     
     created_blocks = []
     for block_data in bulk_data.blocks:
-        if block_data.start_time >= block_data.end_time:
-            raise HTTPException(status_code=400, detail=f"End time must be after start time for day {block_data.feis_day}")
-        
         block = AdjudicatorAvailability(
-            feis_adjudicator_id=UUID(adjudicator_id),
+            feis_adjudicator_id=adjudicator.id,
             feis_day=block_data.feis_day,
             start_time=block_data.start_time,
             end_time=block_data.end_time,
             availability_type=block_data.availability_type,
             note=block_data.note
         )
-        session.add(block)
         created_blocks.append(block)
     
+    # id and created_at are generated client-side, so the response can be built
+    # before commit instead of refreshing every block afterwards.
+    responses = [AvailabilityBlockResponse.model_validate(block) for block in created_blocks]
+    session.add_all(created_blocks)
     session.commit()
     
-    responses = []
-    for block in created_blocks:
-        session.refresh(block)
-        responses.append(AvailabilityBlockResponse(
-            id=str(block.id),
-            feis_adjudicator_id=str(block.feis_adjudicator_id),
-            feis_day=block.feis_day,
-            start_time=block.start_time,
-            end_time=block.end_time,
-            availability_type=block.availability_type,
-            note=block.note,
-            created_at=block.created_at
-        ))
-    
     return responses
 
 
@@ -334,15 +332,18 @@ async def update_availability_block(
     block_id: str,
     update_data: AvailabilityBlockUpdate,
     session: Session = Depends(get_session),
-    current_user: User = Depends(require_organizer_or_admin())
+    current_user: Principal = Depends(REQUIRE_ORG_OR_ADMIN)
 ):
     """Update an availability block. Requires organizer or admin role."""
-    block = session.get(AdjudicatorAvailability, UUID(block_id))
+    block = session.exec(
+        select(AdjudicatorAvailability)
+        .options(joinedload(AdjudicatorAvailability.adjudicator).joinedload(FeisAdjudicator.feis))
+        .where(AdjudicatorAvailability.id == UUID(block_id))
+    ).first()
     if not block:
         raise HTTPException(status_code=404, detail="Availability block not found")
     
-    adjudicator = session.get(FeisAdjudicator, block.feis_adjudicator_id)
-    feis = session.get(Feis, adjudicator.feis_id)
+    feis = block.adjudicator.feis
     if current_user.role != RoleType.SUPER_ADMIN and feis.organizer_id != current_user.id:
         raise HTTPException(status_code=403, detail="Only the feis organizer can manage adjudicator availability")
     
@@ -364,31 +365,25 @@ async def update_availability_block(
     session.commit()
     session.refresh(block)
     
-    return AvailabilityBlockResponse(
-        id=str(block.id),
-        feis_adjudicator_id=str(block.feis_adjudicator_id),
-        feis_day=block.feis_day,
-        start_time=block.start_time,
-        end_time=block.end_time,
-        availability_type=block.availability_type,
-        note=block.note,
-        created_at=block.created_at
-    )
+    return AvailabilityBlockResponse.model_validate(block)
 
 
 @router.delete("/adjudicator-availability/{block_id}")
 async def delete_availability_block(
     block_id: str,
     session: Session = Depends(get_session),
-    current_user: User = Depends(require_organizer_or_admin())
+    current_user: Principal = Depends(REQUIRE_ORG_OR_ADMIN)
 ):
     """Delete an availability block. Requires organizer or admin role."""
-    block = session.get(AdjudicatorAvailability, UUID(block_id))
+    block = session.exec(
+        select(AdjudicatorAvailability)
+        .options(joinedload(AdjudicatorAvailability.adjudicator).joinedload(FeisAdjudicator.feis))
+        .where(AdjudicatorAvailability.id == UUID(block_id))
+    ).first()
     if not block:
         raise HTTPException(status_code=404, detail="Availability block not found")
     
-    adjudicator = session.get(FeisAdjudicator, block.feis_adjudicator_id)
-    feis = session.get(Feis, adjudicator.feis_id)
+    feis = block.adjudicator.feis
     if current_user.role != RoleType.SUPER_ADMIN and feis.organizer_id != current_user.id:
         raise HTTPException(status_code=403, detail="Only the feis organizer can manage adjudicator availability")
     
@@ -405,22 +400,15 @@ async def send_adjudicator_invite(
     adjudicator_id: str,
     request: AdjudicatorInviteRequest,
     session: Session = Depends(get_session),
-    current_user: User = Depends(require_organizer_or_admin())
+    adjudicator: FeisAdjudicator = Depends(_organizer_adjudicator("send invites"))
 ):
     """Send or resend an invitation to an adjudicator. Requires organizer or admin role."""
-    adjudicator = session.get(FeisAdjudicator, UUID(adjudicator_id))
-    if not adjudicator:
-        raise HTTPException(status_code=404, detail="Adjudicator not found")
-    
-    feis = session.get(Feis, adjudicator.feis_id)
-    if current_user.role != RoleType.SUPER_ADMIN and feis.organizer_id != current_user.id:
-        raise HTTPException(status_code=403, detail="Only the feis organizer can send invites")
-    
     invite_token = secrets.token_urlsafe(32)
-    expires_at = datetime.utcnow() + timedelta(days=7)
+    now = datetime.utcnow()
+    expires_at = now + timedelta(days=7)
     
     adjudicator.invite_token = invite_token
-    adjudicator.invite_sent_at = datetime.utcnow()
+    adjudicator.invite_sent_at = now
     adjudicator.invite_expires_at = expires_at
     adjudicator.status = AdjudicatorStatus.INVITED
     
@@ -428,7 +416,7 @@ async def send_adjudicator_invite(
     session.commit()
     session.refresh(adjudicator)
     
-    settings = get_site_settings(session)
+    settings = get_cached_site_settings(session)
     site_url = settings.site_url if settings else "http://localhost:5173"
     invite_link = f"{site_url}/adjudicator-invite?token={invite_token}"
     
@@ -448,33 +436,33 @@ async def accept_adjudicator_invite(
     current_user: Optional[User] = Depends(get_optional_user)
 ):
     """Accept an adjudicator invitation via magic link."""
+    now = datetime.utcnow()
     adjudicator = session.exec(
-        select(FeisAdjudicator).where(FeisAdjudicator.invite_token == request.token)
+        select(FeisAdjudicator)
+        .options(joinedload(FeisAdjudicator.feis))
+        .where(FeisAdjudicator.invite_token == request.token)
+        .where(or_(
+            FeisAdjudicator.invite_expires_at.is_(None),
+            FeisAdjudicator.invite_expires_at >= now
+        ))
     ).first()
     
     if not adjudicator:
+        # Only the failure path pays for telling an expired token from an unknown one
+        expired = session.exec(
+            select(FeisAdjudicator.id).where(FeisAdjudicator.invite_token == request.token)
+        ).first()
+        if expired:
+            raise HTTPException(status_code=400, detail="Invite token has expired. Please request a new invite.")
         raise HTTPException(status_code=404, detail="Invalid or expired invite token")
     
-    if adjudicator.invite_expires_at and adjudicator.invite_expires_at < datetime.utcnow():
-        raise HTTPException(status_code=400, detail="Invite token has expired. Please request a new invite.")
-    
-    feis = session.get(Feis, adjudicator.feis_id)
+    feis = adjudicator.feis
     
     if current_user:
-        adjudicator.user_id = current_user.id
-        adjudicator.status = AdjudicatorStatus.CONFIRMED
-        adjudicator.confirmed_at = datetime.utcnow()
-        adjudicator.invite_token = None
-        
-        if current_user.role == RoleType.PARENT:
-            current_user.role = RoleType.ADJUDICATOR
-            session.add(current_user)
-        
-        session.add(adjudicator)
-        session.commit()
-        session.refresh(adjudicator)
-        
-        return AdjudicatorAcceptInviteResponse(
+        role = RoleType.ADJUDICATOR if current_user.role == RoleType.PARENT else current_user.role
+        # Everything the response needs is already loaded; build it before the
+        # commit expires these objects so nothing has to be re-selected.
+        response = AdjudicatorAcceptInviteResponse(
             success=True,
             feis_id=str(feis.id),
             feis_name=feis.name,
@@ -485,10 +473,31 @@ async def accept_adjudicator_invite(
                 id=str(current_user.id),
                 email=current_user.email,
                 name=current_user.name,
-                role=current_user.role,
+                role=role,
                 email_verified=current_user.email_verified
             )
         )
+        
+        session.exec(
+            update(FeisAdjudicator)
+            .where(FeisAdjudicator.id == adjudicator.id)
+            .values(
+                user_id=current_user.id,
+                status=AdjudicatorStatus.CONFIRMED,
+                confirmed_at=now,
+                invite_token=None
+            )
+        )
+        if role != current_user.role:
+            session.exec(
+                update(User)
+                .where(User.id == current_user.id, User.role == RoleType.PARENT)
+                .values(role=role)
+            )
+        session.commit()
+        invalidate_cached_user(current_user.id)
+        
+        return response
     else:
         return AdjudicatorAcceptInviteResponse(
             success=True,
@@ -507,24 +516,32 @@ async def accept_adjudicator_invite(
 async def generate_adjudicator_pin(
     adjudicator_id: str,
     session: Session = Depends(get_session),
-    current_user: User = Depends(require_organizer_or_admin())
+    adjudicator: FeisAdjudicator = Depends(_organizer_adjudicator("generate PINs"))
 ):
     """Generate a 6-digit PIN for day-of access. The PIN is only shown once."""
-    adjudicator = session.get(FeisAdjudicator, UUID(adjudicator_id))
-    if not adjudicator:
-        raise HTTPException(status_code=404, detail="Adjudicator not found")
-    
-    feis = session.get(Feis, adjudicator.feis_id)
-    if current_user.role != RoleType.SUPER_ADMIN and feis.organizer_id != current_user.id:
-        raise HTTPException(status_code=403, detail="Only the feis organizer can generate PINs")
-    
-    pin = ''.join([str(random.randint(0, 9)) for _ in range(6)])
+    # Keep PINs unique within the feis so a PIN identifies exactly one judge
+    while True:
+        pin = f"{secrets.randbelow(1_000_000):06d}"
+        lookup = pin_lookup(adjudicator.feis_id, pin)
+        taken = session.exec(
+            select(FeisAdjudicator.id)
+            .where(FeisAdjudicator.access_pin_lookup == lookup)
+            .where(FeisAdjudicator.id != adjudicator.id)
+        ).first()
+        if not taken:
+            break
     
-    adjudicator.access_pin_hash = hash_password(pin)
+    adjudicator.access_pin_hash = await ahash_password(pin)
+    adjudicator.access_pin_lookup = lookup
     adjudicator.pin_generated_at = datetime.utcnow()
     
     session.add(adjudicator)
     session.commit()
+    with _feis_has_pins_lock:
+        _feis_has_pins[adjudicator.feis_id] = True
+    if PIN_PEPPER_IS_EPHEMERAL:
+        with _current_pepper_pins_lock:
+            _current_pepper_pins.add(adjudicator.id)
     
     return GeneratePinResponse(
         success=True,
@@ -541,68 +558,86 @@ async def login_with_pin(
     session: Session = Depends(get_session)
 ):
     """Login as an adjudicator using a day-of PIN."""
-    adjudicators = session.exec(
-        select(FeisAdjudicator)
-        .where(FeisAdjudicator.feis_id == UUID(request.feis_id))
-        .where(FeisAdjudicator.access_pin_hash.isnot(None))
-    ).all()
+    feis_id = UUID(request.feis_id)
+    adjudicators = []
+    if _feis_issued_pins(session, feis_id):
+        adjudicators = session.exec(
+            select(FeisAdjudicator)
+            .where(FeisAdjudicator.feis_id == feis_id)
+            .where(FeisAdjudicator.access_pin_lookup == pin_lookup(feis_id, request.pin))
+        ).all()
+        
+        if not adjudicators:
+            # PINs generated before the lookup column existed, or whose digest
+            # was keyed with a previous process's random pepper, can only be
+            # found by trying their hashes. A match rewrites the digest below.
+            stale = FeisAdjudicator.access_pin_lookup.is_(None)
+            if PIN_PEPPER_IS_EPHEMERAL:
+                with _current_pepper_pins_lock:
+                    current = set(_current_pepper_pins)
+                stale = or_(stale, FeisAdjudicator.id.not_in(current))
+            adjudicators = session.exec(
+                select(FeisAdjudicator)
+                .where(FeisAdjudicator.feis_id == feis_id)
+                .where(FeisAdjudicator.access_pin_hash.isnot(None))
+                .where(stale)
+            ).all()
     
     matched_adjudicator = None
     for adj in adjudicators:
-        if verify_password(request.pin, adj.access_pin_hash):
+        if await averify_password(request.pin, adj.access_pin_hash):
             matched_adjudicator = adj
             break
     
     if not matched_adjudicator:
+        if not adjudicators:
+            # Still pay for one hash check so a miss can't be told apart from
+            # a hit (or from a feis without PINs) by response time.
+            await averify_password(request.pin, await _dummy_pin_hash())
         raise HTTPException(status_code=401, detail="Invalid PIN")
     
     feis = session.get(Feis, UUID(request.feis_id))
     
     matched_adjudicator.status = AdjudicatorStatus.ACTIVE
+    # Unchanged for a digest hit; rewritten when found by the bcrypt fallback
+    matched_adjudicator.access_pin_lookup = pin_lookup(feis_id, request.pin)
     session.add(matched_adjudicator)
     
     if matched_adjudicator.user_id:
         user = session.get(User, matched_adjudicator.user_id)
         access_token = create_access_token(user.id, user.role)
     else:
-        if matched_adjudicator.email:
-            existing_user = session.exec(
-                select(User).where(User.email == matched_adjudicator.email)
-            ).first()
-            if existing_user:
-                matched_adjudicator.user_id = existing_user.id
-                session.add(matched_adjudicator)
-                access_token = create_access_token(existing_user.id, existing_user.role)
-            else:
-                temp_user = User(
-                    email=matched_adjudicator.email or f"adj_{matched_adjudicator.id}@temp.openfeis.local",
-                    password_hash=hash_password(secrets.token_urlsafe(32)),
-                    name=matched_adjudicator.name,
-                    role=RoleType.ADJUDICATOR,
-                    email_verified=True
-                )
-                session.add(temp_user)
-                session.commit()
-                session.refresh(temp_user)
-                matched_adjudicator.user_id = temp_user.id
-                session.add(matched_adjudicator)
-                access_token = create_access_token(temp_user.id, temp_user.role)
+        # Link the account registered under the adjudicator's email (matched
+        # case-insensitively, like password login), or create a placeholder one.
+        email = matched_adjudicator.email or f"adj_{matched_adjudicator.id}@pin.openfeis.local"
+        existing_user = get_user_by_email(session, email)
+        if existing_user:
+            user_id, role = existing_user.id, existing_user.role
         else:
-            temp_user = User(
-                email=f"adj_{matched_adjudicator.id}@pin.openfeis.local",
-                password_hash=hash_password(secrets.token_urlsafe(32)),
+            # The database is always SQLite (backend.db.database), so its dialect's
+            # upsert is safe here. It only covers a concurrent login inserting the
+            # same address since the lookup; the no-op update lets RETURNING hand
+            # back that row.
+            new_user = sqlite_insert(User).values(
+                id=uuid4(),
+                email=email,
+                password_hash=await ahash_password(secrets.token_urlsafe(32)),
                 name=matched_adjudicator.name,
                 role=RoleType.ADJUDICATOR,
                 email_verified=True
             )
-            session.add(temp_user)
-            session.commit()
-            session.refresh(temp_user)
-            matched_adjudicator.user_id = temp_user.id
-            session.add(matched_adjudicator)
-            access_token = create_access_token(temp_user.id, temp_user.role)
+            user_id, role = session.exec(
+                new_user
+                .on_conflict_do_update(index_elements=[User.email], set_={"email": new_user.excluded.email})
+                .returning(User.id, User.role)
+            ).one()
+        matched_adjudicator.user_id = user_id
+        access_token = create_access_token(user_id, role)
     
     session.commit()
+    if PIN_PEPPER_IS_EPHEMERAL:
+        with _current_pepper_pins_lock:
+            _current_pepper_pins.add(matched_adjudicator.id)
     
     return PinLoginResponse(
         success=True,
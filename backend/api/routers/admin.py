@@ -1,36 +1,139 @@
-from fastapi import APIRouter, HTTPException, Depends
+from fastapi import APIRouter, BackgroundTasks, HTTPException, Depends
+from dataclasses import dataclass
+from datetime import datetime
+from functools import lru_cache
+from itertools import product
+import logging
+import re
 from typing import List, Optional
-from uuid import UUID
-from sqlmodel import Session, select, func
-from backend.db.database import get_session
-from backend.api.auth import get_current_user, require_admin, require_organizer_or_admin
+from uuid import uuid4
+import threading
+from cachetools import TTLCache
+from sqlmodel import Session, func, insert, select
+from backend.db.database import SessionLocal, get_session
+from backend.api.auth import Principal, get_current_user, REQUIRE_ADMIN, REQUIRE_ORG_OR_ADMIN
 from backend.scoring_engine.models_platform import (
-    SiteSettings, User, Feis, Competition, RoleType, Dancer, Entry,
+    SiteSettings, Feis, Competition, RoleType, Dancer, Entry,
     CompetitionLevel, Gender, DanceType, ScoringMethod, CompetitionCategory
 )
 from backend.api.schemas import (
     SiteSettingsResponse, SiteSettingsUpdate,
     SyllabusGenerationRequest, SyllabusGenerationResponse,
-    DemoDataStatus, DemoDataSummary
+    DemoDataStatus, DemoDataSummary, DemoDataJobResponse
+)
+from backend.services.email import (
+    get_cached_site_settings, get_site_settings, invalidate_site_settings_cache
 )
-from backend.services.email import get_site_settings
 from backend.services.demo_data import has_demo_data, populate_demo_data, delete_demo_data
 from backend.utils.competition_codes import generate_competition_code
 from backend.services.scheduling import get_dance_type_from_name, get_default_tempo
 
 router = APIRouter()
+logger = logging.getLogger(__name__)
+
+# Demo data populate/delete runs after the response is sent. Jobs live in this
+# process only, which matches the single-worker deployment.
+DEMO_JOB_TTL = 3600
+_demo_jobs: TTLCache = TTLCache(maxsize=32, ttl=DEMO_JOB_TTL)
+_demo_jobs_lock = threading.Lock()
+
+
+CHAMPIONSHIP_LEVELS = frozenset({
+    CompetitionLevel.PRELIMINARY_CHAMPIONSHIP,
+    CompetitionLevel.OPEN_CHAMPIONSHIP,
+})
+SET_DANCE_TYPES = frozenset({
+    DanceType.TRADITIONAL_SET,
+    DanceType.NON_TRADITIONAL_SET,
+    DanceType.CONTEMPORARY_SET,
+})
+# Legacy include_championships/championship_types flags
+CHAMPIONSHIP_TYPE_LEVELS = {
+    "prelim": CompetitionLevel.PRELIMINARY_CHAMPIONSHIP,
+    "open": CompetitionLevel.OPEN_CHAMPIONSHIP,
+}
+FIGURE_DANCE_TYPES = {
+    "2-Hand": DanceType.TWO_HAND,
+    "3-Hand": DanceType.THREE_HAND,
+    "4-Hand": DanceType.FOUR_HAND,
+    "6-Hand": DanceType.SIX_HAND,
+    "8-Hand": DanceType.EIGHT_HAND,
+}
+CHAMPIONSHIP_LABELS = {
+    CompetitionLevel.PRELIMINARY_CHAMPIONSHIP: "Preliminary Championship",
+    CompetitionLevel.OPEN_CHAMPIONSHIP: "Open Championship",
+}
+# 'other' means open to all, so those competitions carry no gender label
+GENDER_LABELS = {
+    Gender.MALE: "Boys",
+    Gender.FEMALE: "Girls",
+    Gender.OTHER: None,
+}
+
 
+@dataclass(frozen=True, slots=True)
+class AgeConfig:
+    """An age group to generate syllabus competitions for."""
+    label: str
+    min_age: int
+    max_age: int
+    code_age: int
+    is_over: bool
+    is_adult: bool
+
+
+@lru_cache(maxsize=64)
 def format_level_name(level: str) -> str:
     """Format level name for display."""
     return level.replace('_', ' ').title()
 
+
+# "Adult" (any case), or U/O followed by the reference age, e.g. "U12", "O15"
+_AGE_GROUP_RE = re.compile(r"(?i:(adult))|([UO])(\d+)")
+
+
+@lru_cache(maxsize=64)
+def parse_age_group(age_str: str) -> Optional[AgeConfig]:
+    """Parse a selected age group label; None if it isn't one we recognise."""
+    match = _AGE_GROUP_RE.fullmatch(age_str)
+    if not match:
+        return None
+    adult, prefix, value = match.groups()
+    if adult:
+        return AgeConfig(
+            label="Adult",
+            min_age=25,
+            max_age=99,
+            code_age=99,
+            is_over=False, # Adults usually treated as U99 or similar
+            is_adult=True
+        )
+    val = int(value)
+    if prefix == "U":
+        return AgeConfig(
+            label=age_str,
+            min_age=0, # Allow dancing up
+            max_age=val,
+            code_age=val,
+            is_over=False,
+            is_adult=False
+        )
+    return AgeConfig(
+        label=age_str,
+        min_age=val + 1,
+        max_age=99,
+        code_age=val, # Pass the reference age (e.g. 15 for O15)
+        is_over=True,
+        is_adult=False
+    )
+
 @router.get("/admin/settings", response_model=SiteSettingsResponse)
-async def get_settings(
+def get_settings(
     session: Session = Depends(get_session),
-    current_user: User = Depends(require_admin())
+    current_user: Principal = Depends(REQUIRE_ADMIN)
 ):
     """Get site settings. Requires super_admin role."""
-    settings = get_site_settings(session)
+    settings = get_cached_site_settings(session)
     
     return SiteSettingsResponse(
         resend_configured=bool(settings.resend_api_key),
@@ -41,10 +144,10 @@ async def get_settings(
 
 
 @router.put("/admin/settings", response_model=SiteSettingsResponse)
-async def update_settings(
+def update_settings(
     settings_data: SiteSettingsUpdate,
     session: Session = Depends(get_session),
-    current_user: User = Depends(require_admin())
+    current_user: Principal = Depends(REQUIRE_ADMIN)
 ):
     """Update site settings. Requires super_admin role."""
     settings = get_site_settings(session)
@@ -58,26 +161,31 @@ async def update_settings(
     if settings_data.site_url is not None:
         settings.site_url = settings_data.site_url
     
-    session.add(settings)
-    session.commit()
-    session.refresh(settings)
-    
-    return SiteSettingsResponse(
+    # settings is already attached; the response only echoes the values just
+    # set, so build it before the commit expires them instead of refreshing
+    response = SiteSettingsResponse(
         resend_configured=bool(settings.resend_api_key),
         resend_from_email=settings.resend_from_email,
         site_name=settings.site_name,
         site_url=settings.site_url
     )
+    session.commit()
+    invalidate_site_settings_cache()
+    
+    return response
 
 
 @router.post("/admin/syllabus/generate", response_model=SyllabusGenerationResponse)
-async def generate_syllabus(
+def generate_syllabus(
     request: SyllabusGenerationRequest, 
     session: Session = Depends(get_session),
-    current_user: User = Depends(require_organizer_or_admin())
+    current_user: Principal = Depends(REQUIRE_ORG_OR_ADMIN)
 ):
     """Auto-generate syllabus competitions. Requires organizer or super_admin role."""
-    feis = session.get(Feis, UUID(request.feis_id))
+    # Only the columns used below, not a full Feis entity
+    feis = session.exec(
+        select(Feis.id, Feis.organizer_id, Feis.name).where(Feis.id == request.feis_id)
+    ).first()
     if not feis:
         raise HTTPException(status_code=404, detail="Feis not found")
     
@@ -85,284 +193,244 @@ async def generate_syllabus(
     if current_user.role != RoleType.SUPER_ADMIN and feis.organizer_id != current_user.id:
         raise HTTPException(status_code=403, detail="You can only generate syllabus for your own feis")
     
-    count = 0
-    
     # Determine age configs to process
-    age_configs = []
-    
     if request.selected_ages:
-        for age_str in request.selected_ages:
-            if age_str.lower() == "adult":
-                age_configs.append({
-                    "label": "Adult",
-                    "min_age": 25,
-                    "max_age": 99,
-                    "code_age": 99,
-                    "is_over": False, # Adults usually treated as U99 or similar
-                    "is_adult": True
-                })
-            elif age_str.startswith("U"):
-                try:
-                    val = int(age_str[1:])
-                    age_configs.append({
-                        "label": age_str,
-                        "min_age": 0, # Allow dancing up
-                        "max_age": val,
-                        "code_age": val,
-                        "is_over": False,
-                        "is_adult": False
-                    })
-                except ValueError:
-                    continue
-            elif age_str.startswith("O"):
-                try:
-                    val = int(age_str[1:])
-                    age_configs.append({
-                        "label": age_str,
-                        "min_age": val + 1,
-                        "max_age": 99,
-                        "code_age": val, # Pass the reference age (e.g. 15 for O15)
-                        "is_over": True,
-                        "is_adult": False
-                    })
-                except ValueError:
-                    continue
+        age_configs = [
+            age_config
+            for age_config in map(parse_age_group, request.selected_ages)
+            if age_config
+        ]
     else:
         # Legacy loop behavior (U-ages only, step 2)
-        current_age = request.min_age
-        while current_age <= request.max_age:
-            age_configs.append({
-                "label": f"U{current_age}",
-                "min_age": current_age - 2,
-                "max_age": current_age,
-                "code_age": current_age,
-                "is_over": False,
-                "is_adult": False
-            })
-            current_age += 2
+        age_configs = [
+            AgeConfig(
+                label=f"U{age}",
+                min_age=age - 2,
+                max_age=age,
+                code_age=age,
+                is_over=False,
+                is_adult=False
+            )
+            for age in range(request.min_age, request.max_age + 1, 2)
+        ]
             
     # ===== SOLO DANCES =====
-    for age_config in age_configs:
-        age_group = age_config["label"]
-        min_age_val = age_config["min_age"]
-        max_age_val = age_config["max_age"]
-        
-        for gender in request.genders:
-            for level in request.levels:
-                for dance in request.dances:
-                    # Map dance name to DanceType enum
-                    dance_type = get_dance_type_from_name(dance)
-                    
-                    # Skip championship levels in solo loop UNLESS it's a set dance (which can be standalone trophies)
-                    is_champ_level = level in (CompetitionLevel.PRELIMINARY_CHAMPIONSHIP, CompetitionLevel.OPEN_CHAMPIONSHIP)
-                    is_set_dance = dance_type in (DanceType.TRADITIONAL_SET, DanceType.NON_TRADITIONAL_SET, DanceType.CONTEMPORARY_SET)
-                    
-                    if is_champ_level and not is_set_dance:
-                        continue
-                        
-                    # Handle open (non-gendered) competitions - 'other' means open to all
-                    is_open = gender.value == 'other'
-                    if is_open:
-                        comp_name = f"{age_group} {dance} ({format_level_name(level.value)})"
-                    else:
-                        gender_label = "Boys" if gender.value == 'male' else "Girls"
-                        comp_name = f"{gender_label} {age_group} {dance} ({format_level_name(level.value)})"
-                    
-                    # Map dance name to DanceType enum
-                    dance_type = get_dance_type_from_name(dance)
-                    tempo = get_default_tempo(dance_type)
-                    
-                    # Generate competition code
-                    code = generate_competition_code(
-                        level=level.value,
-                        min_age=age_config["code_age"],
-                        dance_type=dance_type.value if dance_type else None,
-                        is_over=age_config["is_over"],
-                        gender=gender.value if gender else None
-                    )
-                    
-                    comp = Competition(
-                        feis_id=feis.id,
-                        name=comp_name,
-                        min_age=min_age_val,
-                        max_age=max_age_val,
-                        level=level,
-                        gender=None if is_open else gender,  # Open competitions have no gender restriction
-                        code=code,
-                        category=CompetitionCategory.SOLO,
-                        is_mixed=False,
-                        # New fields
-                        dance_type=dance_type,
-                        tempo_bpm=tempo,
-                        bars=48,  # Standard
-                        scoring_method=request.scoring_method,
-                        price_cents=request.price_cents,
-                        estimated_duration_minutes=2  # Default for short feis events
-                    )
-                    session.add(comp)
-                    count += 1
+    # Lookups that depend on a single loop variable are worked out once, not per row
+    dance_types = {dance: get_dance_type_from_name(dance) for dance in request.dances}
+    dance_tempos = {dance: get_default_tempo(dance_type) for dance, dance_type in dance_types.items()}
+    
+    # Every age group/gender pair, with the gender's code value, the gender stored
+    # on its rows (None for open competitions) and the "<gender> <age> " prefix
+    # of their names
+    audiences = []
+    for age_config, gender in product(age_configs, request.genders):
+        gender_label = GENDER_LABELS[gender]
+        if gender_label is None:
+            audiences.append((age_config, gender.value, None, f"{age_config.label} "))
+        else:
+            audiences.append((age_config, gender.value, gender, f"{gender_label} {age_config.label} "))
+    
+    # Championship levels only get solo competitions for set dances (standalone
+    # trophies), so pair each level with just the dances it produces rather than
+    # skipping them row by row. Each pair carries everything its rows need that
+    # doesn't depend on the audience: enum values for the code, the tempo and the
+    # "<dance> (<level>)" tail of the competition names.
+    set_dances = [
+        dance for dance in request.dances
+        if dance_types[dance] in SET_DANCE_TYPES
+    ]
+    solo_dances = []
+    for level in request.levels:
+        level_name = format_level_name(level.value)
+        level_dances = set_dances if level in CHAMPIONSHIP_LEVELS else request.dances
+        for dance in level_dances:
+            dance_type = dance_types[dance]
+            solo_dances.append((
+                level, level.value,
+                dance_type, dance_type.value if dance_type else None,
+                dance_tempos[dance], f"{dance} ({level_name})"
+            ))
+    
+    # Column values for every generated competition, inserted in one batch at the end
+    rows = [
+        dict(
+            feis_id=feis.id,
+            name=name_prefix + name_tail,
+            min_age=age_config.min_age,
+            max_age=age_config.max_age,
+            level=level,
+            gender=row_gender,  # Open competitions have no gender restriction
+            code=generate_competition_code(
+                level=level_value,
+                min_age=age_config.code_age,
+                dance_type=dance_value,
+                is_over=age_config.is_over,
+                gender=gender_value
+            ),
+            category=CompetitionCategory.SOLO,
+            is_mixed=False,
+            # New fields
+            dance_type=dance_type,
+            tempo_bpm=tempo,
+            bars=48,  # Standard
+            scoring_method=request.scoring_method,
+            price_cents=request.price_cents,
+            estimated_duration_minutes=2  # Default for short feis events
+        )
+        for (age_config, gender_value, row_gender, name_prefix),
+            (level, level_value, dance_type, dance_value, tempo, name_tail)
+        in product(audiences, solo_dances)
+    ]
     
     # ===== FIGURE/CEILI DANCES =====
     # Figure dances are NOT leveled - they're open to all grade levels, divided by age only
     if request.figure_dances:
-        figure_dance_map = {
-            "2-Hand": DanceType.TWO_HAND,
-            "3-Hand": DanceType.THREE_HAND,
-            "4-Hand": DanceType.FOUR_HAND,
-            "6-Hand": DanceType.SIX_HAND,
-            "8-Hand": DanceType.EIGHT_HAND,
-        }
+        figure_dances = [
+            (fig_dance, FIGURE_DANCE_TYPES[fig_dance])
+            for fig_dance in request.figure_dances
+            if fig_dance in FIGURE_DANCE_TYPES
+        ]
         
-        for age_config in age_configs:
-            age_group = age_config["label"]
-            min_age_val = age_config["min_age"]
-            max_age_val = age_config["max_age"]
+        for age_config, (fig_dance, dance_type) in product(age_configs, figure_dances):
+            age_group = age_config.label
             
-            for fig_dance in request.figure_dances:
-                dance_type = figure_dance_map.get(fig_dance)
-                if not dance_type:
-                    continue
-                
-                # Create girls-only figure competition (standard)
-                comp_name = f"Girls {age_group} {fig_dance}"
+            # Create girls-only figure competition (standard)
+            comp_name = f"Girls {age_group} {fig_dance}"
+            code = generate_competition_code(
+                level="novice",  # Use novice as placeholder since figure dances aren't leveled
+                min_age=age_config.code_age,
+                dance_type=dance_type.value,
+                is_over=age_config.is_over,
+                is_mixed=False
+            )
+            
+            # Only add suffix if not using the new figure dance format (ending in FD/FM)
+            if not (code.endswith("FD") or code.endswith("FM")):
+                code += "G"  # Add 'G' suffix for girls
+            
+            rows.append(dict(
+                feis_id=feis.id,
+                name=comp_name,
+                min_age=age_config.min_age,
+                max_age=age_config.max_age,
+                level=CompetitionLevel.NOVICE,  # Placeholder - figure dances are open level
+                gender=Gender.FEMALE,
+                code=code,
+                category=CompetitionCategory.FIGURE,
+                is_mixed=False,
+                dance_type=dance_type,
+                tempo_bpm=113,  # Figure dances typically 113 bpm
+                bars=48,
+                scoring_method=ScoringMethod.SOLO,  # Figure dances use solo scoring
+                price_cents=request.price_cents,
+                estimated_duration_minutes=2  # Default for short feis events
+            ))
+            
+            # Create mixed figure competition if enabled
+            if request.include_mixed_figure:
+                comp_name = f"Mixed {age_group} {fig_dance}"
                 code = generate_competition_code(
-                    level="novice",  # Use novice as placeholder since figure dances aren't leveled
-                    min_age=age_config["code_age"],
+                    level="novice",
+                    min_age=age_config.code_age,
                     dance_type=dance_type.value,
-                    is_over=age_config["is_over"],
-                    is_mixed=False
+                    is_over=age_config.is_over,
+                    is_mixed=True
                 )
                 
-                # Only add suffix if not using the new figure dance format (ending in FD/FM)
+                # Only add suffix if not using the new figure dance format
                 if not (code.endswith("FD") or code.endswith("FM")):
-                    code += "G"  # Add 'G' suffix for girls
+                    code += "M"  # Add 'M' suffix for mixed
                 
-                comp = Competition(
+                rows.append(dict(
                     feis_id=feis.id,
                     name=comp_name,
-                    min_age=min_age_val,
-                    max_age=max_age_val,
+                    min_age=age_config.min_age,
+                    max_age=age_config.max_age,
                     level=CompetitionLevel.NOVICE,  # Placeholder - figure dances are open level
-                    gender=Gender.FEMALE,
+                    gender=None,  # Mixed - no gender restriction
                     code=code,
                     category=CompetitionCategory.FIGURE,
-                    is_mixed=False,
+                    is_mixed=True,
                     dance_type=dance_type,
-                    tempo_bpm=113,  # Figure dances typically 113 bpm
+                    tempo_bpm=113,
                     bars=48,
-                    scoring_method=ScoringMethod.SOLO,  # Figure dances use solo scoring
+                    scoring_method=ScoringMethod.SOLO,
                     price_cents=request.price_cents,
                     estimated_duration_minutes=2  # Default for short feis events
-                )
-                session.add(comp)
-                count += 1
-                
-                # Create mixed figure competition if enabled
-                if request.include_mixed_figure:
-                    comp_name = f"Mixed {age_group} {fig_dance}"
-                    code = generate_competition_code(
-                        level="novice",
-                        min_age=age_config["code_age"],
-                        dance_type=dance_type.value,
-                        is_over=age_config["is_over"],
-                        is_mixed=True
-                    )
-                    
-                    # Only add suffix if not using the new figure dance format
-                    if not (code.endswith("FD") or code.endswith("FM")):
-                        code += "M"  # Add 'M' suffix for mixed
-                    
-                    comp = Competition(
-                        feis_id=feis.id,
-                        name=comp_name,
-                        min_age=min_age_val,
-                        max_age=max_age_val,
-                        level=CompetitionLevel.NOVICE,  # Placeholder - figure dances are open level
-                        gender=None,  # Mixed - no gender restriction
-                        code=code,
-                        category=CompetitionCategory.FIGURE,
-                        is_mixed=True,
-                        dance_type=dance_type,
-                        tempo_bpm=113,
-                        bars=48,
-                        scoring_method=ScoringMethod.SOLO,
-                        price_cents=request.price_cents,
-                        estimated_duration_minutes=2  # Default for short feis events
-                    )
-                    session.add(comp)
-                    count += 1
+                ))
     
     # ===== CHAMPIONSHIPS =====
     # Find championship levels in the main levels list
-    champ_levels = [l for l in request.levels if l in (CompetitionLevel.PRELIMINARY_CHAMPIONSHIP, CompetitionLevel.OPEN_CHAMPIONSHIP)]
+    champ_levels = [l for l in request.levels if l in CHAMPIONSHIP_LEVELS]
     
     # Also support the legacy include_championships/championship_types flags
     if request.include_championships and request.championship_types:
-        champ_level_map = {
-            "prelim": CompetitionLevel.PRELIMINARY_CHAMPIONSHIP,
-            "open": CompetitionLevel.OPEN_CHAMPIONSHIP,
-        }
         for ct in request.championship_types:
-            level = champ_level_map.get(ct)
+            level = CHAMPIONSHIP_TYPE_LEVELS.get(ct)
             if level and level not in champ_levels:
                 champ_levels.append(level)
+    
+    for (age_config, gender_value, row_gender, name_prefix), level in product(audiences, champ_levels):
+        code = generate_competition_code(
+            level=level.value,
+            min_age=age_config.code_age,
+            is_over=age_config.is_over,
+            gender=gender_value
+        )
         
-    if champ_levels:
-        for age_config in age_configs:
-            age_group = age_config["label"]
-            min_age_val = age_config["min_age"]
-            max_age_val = age_config["max_age"]
-            
-            for gender in request.genders:
-                for level in champ_levels:
-                    # Handle open (non-gendered) championships
-                    is_open = gender.value == 'other'
-                    champ_label = "Preliminary Championship" if level == CompetitionLevel.PRELIMINARY_CHAMPIONSHIP else "Open Championship"
-                    if is_open:
-                        comp_name = f"{age_group} {champ_label}"
-                    else:
-                        gender_label = "Boys" if gender.value == 'male' else "Girls"
-                        comp_name = f"{gender_label} {age_group} {champ_label}"
-                    
-                    code = generate_competition_code(
-                        level=level.value,
-                        min_age=age_config["code_age"],
-                        is_over=age_config["is_over"],
-                        gender=gender.value if gender else None
-                    )
-                    
-                    comp = Competition(
-                        feis_id=feis.id,
-                        name=comp_name,
-                        min_age=min_age_val,
-                        max_age=max_age_val,
-                        level=level,
-                        gender=None if is_open else gender,  # Open championships have no gender restriction
-                        code=code,
-                        category=CompetitionCategory.CHAMPIONSHIP,
-                        is_mixed=False,
-                        dance_type=None,  # Championships have multiple dances
-                        tempo_bpm=None,
-                        bars=48,
-                        scoring_method=ScoringMethod.CHAMPIONSHIP,
-                        price_cents=request.price_cents * 2,  # Championships typically cost more
-                        estimated_duration_minutes=2  # Default for short feis events
-                    )
-                    session.add(comp)
-                    count += 1
+        rows.append(dict(
+            feis_id=feis.id,
+            name=name_prefix + CHAMPIONSHIP_LABELS[level],
+            min_age=age_config.min_age,
+            max_age=age_config.max_age,
+            level=level,
+            gender=row_gender,  # Open championships have no gender restriction
+            code=code,
+            category=CompetitionCategory.CHAMPIONSHIP,
+            is_mixed=False,
+            dance_type=None,  # Championships have multiple dances
+            tempo_bpm=None,
+            bars=48,
+            scoring_method=ScoringMethod.CHAMPIONSHIP,
+            price_cents=request.price_cents * 2,  # Championships typically cost more
+            estimated_duration_minutes=2  # Default for short feis events
+        ))
     
+    # Re-running the generator skips competitions the feis already has, rather
+    # than inserting a second copy of each. Codes alone are not unique (girls,
+    # open and older-age groups can share one), so match on the full identity.
+    identity_fields = ("code", "gender", "min_age", "max_age", "name")
+    existing = set(session.exec(
+        select(*(getattr(Competition, field) for field in identity_fields))
+        .where(Competition.feis_id == feis.id)
+    ).all())
+    generated = len(rows)
+    if existing:
+        rows = [
+            row for row in rows
+            if tuple(row[field] for field in identity_fields) not in existing
+        ]
+    count = len(rows)
+    
+    message = f"Successfully created {count} competitions for {feis.name}."
+    if generated > count:
+        message += f" Skipped {generated - count} that already exist."
+    
+    # The whole syllabus goes in as one statement in the request's transaction
+    if rows:
+        session.exec(insert(Competition), params=rows)
     session.commit()
     
     return SyllabusGenerationResponse(
         generated_count=count,
-        message=f"Successfully created {count} competitions for {feis.name}."
+        message=message
     )
 
 
 @router.get("/admin/demo-data/status", response_model=DemoDataStatus)
-async def get_demo_data_status(
+def get_demo_data_status(
     session: Session = Depends(get_session),
-    current_user: User = Depends(require_admin)
+    current_user: Principal = Depends(REQUIRE_ADMIN)
 ):
     """
     Check if demo data exists in the system.
@@ -375,10 +443,88 @@ async def get_demo_data_status(
     )
 
 
-@router.post("/admin/demo-data/populate", response_model=DemoDataSummary)
-async def populate_demo_data_endpoint(
+def _populate_summary(summary: dict) -> DemoDataSummary:
+    return DemoDataSummary(
+        success=True,
+        message=f"Successfully created demo data: {summary['feiseanna']} feiseanna, {summary['dancers']} dancers, {summary['entries']} entries.",
+        **summary
+    )
+
+
+def _delete_summary(summary: dict) -> DemoDataSummary:
+    return DemoDataSummary(
+        success=True,
+        message=f"Successfully deleted demo data: {summary['users_deleted']} users, {summary['feiseanna_deleted']} feiseanna, {summary['dancers_deleted']} dancers.",
+        feiseanna=summary["feiseanna_deleted"],
+        dancers=summary["dancers_deleted"],
+        entries=summary["entries_deleted"],
+        scores=summary["scores_deleted"]
+    )
+
+
+def _update_demo_job(job_id: str, **changes) -> None:
+    with _demo_jobs_lock:
+        job = _demo_jobs.get(job_id)
+        if job is not None:
+            _demo_jobs[job_id] = job.model_copy(update=changes)
+
+
+def _start_demo_job(operation: str) -> DemoDataJobResponse:
+    """Register a new job, refusing if another populate/delete is still going."""
+    with _demo_jobs_lock:
+        if any(job.status in ("pending", "running") for job in _demo_jobs.values()):
+            raise HTTPException(
+                status_code=409,
+                detail="A demo data job is already running. Wait for it to finish."
+            )
+        job = DemoDataJobResponse(
+            id=str(uuid4()),
+            operation=operation,
+            status="pending",
+            created_at=datetime.utcnow()
+        )
+        _demo_jobs[job.id] = job
+    return job
+
+
+def _run_demo_job(job_id: str, operation: str) -> None:
+    """
+    Populate or delete demo data after the response has been sent.
+    
+    Uses its own session: the request's session is closed by then.
+    """
+    _update_demo_job(job_id, status="running")
+    with SessionLocal() as session:
+        try:
+            if operation == "populate":
+                summary = _populate_summary(populate_demo_data(session))
+            else:
+                summary = _delete_summary(delete_demo_data(session))
+        except Exception as e:
+            session.rollback()
+            logger.exception("Demo data %s job %s failed", operation, job_id)
+            _update_demo_job(
+                job_id,
+                status="failed",
+                message=f"Failed to {operation} demo data: {str(e)}",
+                finished_at=datetime.utcnow()
+            )
+            return
+    logger.info("Demo data %s job %s finished: %s", operation, job_id, summary.message)
+    _update_demo_job(
+        job_id,
+        status="succeeded",
+        message=summary.message,
+        result=summary,
+        finished_at=datetime.utcnow()
+    )
+
+
+@router.post("/admin/demo-data/populate", response_model=DemoDataJobResponse, status_code=202)
+def populate_demo_data_endpoint(
+    background_tasks: BackgroundTasks,
     session: Session = Depends(get_session),
-    current_user: User = Depends(require_admin)
+    current_user: Principal = Depends(REQUIRE_ADMIN)
 ):
     """
     Populate the database with comprehensive demo data.
@@ -392,33 +538,26 @@ async def populate_demo_data_endpoint(
     - Full syllabus with competitions for each feis
     - Realistic registrations, schedules, and (for past feis) scores
     
+    Runs in the background; poll /admin/demo-data/jobs/{job_id} for the result.
+    
     Super Admin only.
     """
     if has_demo_data(session):
-        return DemoDataSummary(
-            success=False,
-            message="Demo data already exists. Delete existing demo data first."
-        )
-    
-    try:
-        summary = populate_demo_data(session)
-        return DemoDataSummary(
-            success=True,
-            message=f"Successfully created demo data: {summary['feiseanna']} feiseanna, {summary['dancers']} dancers, {summary['entries']} entries.",
-            **summary
-        )
-    except Exception as e:
-        session.rollback()
         raise HTTPException(
-            status_code=500,
-            detail=f"Failed to populate demo data: {str(e)}"
+            status_code=409,
+            detail="Demo data already exists. Delete existing demo data first."
         )
+    
+    job = _start_demo_job("populate")
+    background_tasks.add_task(_run_demo_job, job.id, "populate")
+    return job
 
 
-@router.delete("/admin/demo-data", response_model=DemoDataSummary)
-async def delete_demo_data_endpoint(
+@router.delete("/admin/demo-data", response_model=DemoDataJobResponse, status_code=202)
+def delete_demo_data_endpoint(
+    background_tasks: BackgroundTasks,
     session: Session = Depends(get_session),
-    current_user: User = Depends(require_admin)
+    current_user: Principal = Depends(REQUIRE_ADMIN)
 ):
     """
     Delete all demo data from the database.
@@ -430,27 +569,33 @@ async def delete_demo_data_endpoint(
     - All dancers belonging to demo parents
     - All associated entries, scores, etc.
     
+    Runs in the background; poll /admin/demo-data/jobs/{job_id} for the result.
+    
     Super Admin only.
     """
     if not has_demo_data(session):
-        return DemoDataSummary(
-            success=False,
-            message="No demo data found to delete."
-        )
-    
-    try:
-        summary = delete_demo_data(session)
-        return DemoDataSummary(
-            success=True,
-            message=f"Successfully deleted demo data: {summary['users_deleted']} users, {summary['feiseanna_deleted']} feiseanna, {summary['dancers_deleted']} dancers.",
-            feiseanna=summary["feiseanna_deleted"],
-            dancers=summary["dancers_deleted"],
-            entries=summary["entries_deleted"],
-            scores=summary["scores_deleted"]
-        )
-    except Exception as e:
-        session.rollback()
         raise HTTPException(
-            status_code=500,
-            detail=f"Failed to delete demo data: {str(e)}"
+            status_code=409,
+            detail="No demo data found to delete."
         )
+    
+    job = _start_demo_job("delete")
+    background_tasks.add_task(_run_demo_job, job.id, "delete")
+    return job
+
+
+@router.get("/admin/demo-data/jobs/{job_id}", response_model=DemoDataJobResponse)
+def get_demo_data_job(
+    job_id: str,
+    current_user: Principal = Depends(REQUIRE_ADMIN)
+):
+    """
+    Get the progress of a demo data populate/delete job.
+    Finished jobs are kept for an hour.
+    Super Admin only.
+    """
+    with _demo_jobs_lock:
+        job = _demo_jobs.get(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Demo data job not found")
+    return job
@@ -1,17 +1,18 @@
 from fastapi import APIRouter, HTTPException, Depends
-from typing import List
+from functools import lru_cache
+from typing import List, Tuple
 from uuid import UUID
 from datetime import datetime
 from sqlmodel import Session, select
 from backend.db.database import get_session
-from backend.api.auth import get_current_user, require_organizer_or_admin
+from backend.api.auth import Principal, get_current_user, REQUIRE_ORG_OR_ADMIN
 from backend.scoring_engine.models_platform import (
     User, Dancer, Competition, Feis, Entry,
     AdvancementNotice, PlacementHistory, CompetitionLevel, DanceType, RoleType
 )
 from backend.api.schemas import (
     AdvancementRuleInfo, AdvancementCheckResponse, AdvancementNoticeResponse,
-    PlacementHistoryResponse, DancerPlacementHistoryResponse,
+    PlacementHistoryCreate, PlacementHistoryResponse, DancerPlacementHistoryResponse,
     AcknowledgeAdvancementRequest, OverrideAdvancementRequest
 )
 
@@ -26,24 +27,30 @@ ADVANCEMENT_RULES = {
     CompetitionLevel.PRELIMINARY_CHAMPIONSHIP: {"wins": 3, "next": CompetitionLevel.OPEN_CHAMPIONSHIP, "per_dance": True},
 }
 
-@router.get("/advancement/rules", response_model=List[AdvancementRuleInfo])
-async def get_advancement_rules():
-    """Get the advancement rules for all levels."""
-    rules = []
-    for level, rule in ADVANCEMENT_RULES.items():
-        rules.append(AdvancementRuleInfo(
+
+@lru_cache(maxsize=1)
+def _build_rules() -> Tuple[AdvancementRuleInfo, ...]:
+    """ADVANCEMENT_RULES never changes at runtime, so build the response once."""
+    return tuple(
+        AdvancementRuleInfo(
             level=level,
             wins_required=rule["wins"],
             next_level=rule["next"],
             per_dance=rule["per_dance"],
             description=f"Advance from {level.value.replace('_', ' ').title()} to {rule['next'].value.replace('_', ' ').title()} after {rule['wins']} first place wins"
-        ))
-    
-    return rules
+        )
+        for level, rule in ADVANCEMENT_RULES.items()
+    )
+
+
+@router.get("/advancement/rules", response_model=List[AdvancementRuleInfo])
+async def get_advancement_rules():
+    """Get the advancement rules for all levels."""
+    return _build_rules()
 
 
 @router.get("/dancers/{dancer_id}/placements", response_model=DancerPlacementHistoryResponse)
-async def get_dancer_placements(
+def get_dancer_placements(
     dancer_id: str,
     session: Session = Depends(get_session)
 ):
@@ -52,25 +59,31 @@ async def get_dancer_placements(
     if not dancer:
         raise HTTPException(status_code=404, detail="Dancer not found")
     
-    placements = session.exec(
-        select(PlacementHistory)
+    # Competition and feis names come back in the same query; outer joins keep
+    # placements whose competition or feis has since been removed
+    rows = session.exec(
+        select(
+            PlacementHistory,
+            Competition.name.label("competition_name"),
+            Feis.name.label("feis_name")
+        )
+        .outerjoin(Competition, Competition.id == PlacementHistory.competition_id)
+        .outerjoin(Feis, Feis.id == PlacementHistory.feis_id)
         .where(PlacementHistory.dancer_id == dancer.id)
         .order_by(PlacementHistory.competition_date.desc())
     ).all()
     
-    placement_responses = []
-    for p in placements:
-        comp = session.get(Competition, p.competition_id)
-        feis = session.get(Feis, p.feis_id)
-        
-        placement_responses.append(PlacementHistoryResponse(
+    # Every value comes straight from the database, so skip per-row validation;
+    # the response_model check on the way out still covers the payload
+    placement_responses = [
+        PlacementHistoryResponse.model_construct(
             id=str(p.id),
             dancer_id=str(p.dancer_id),
             dancer_name=dancer.name,
             competition_id=str(p.competition_id),
-            competition_name=comp.name if comp else "Unknown",
+            competition_name=competition_name or "Unknown",
             feis_id=str(p.feis_id),
-            feis_name=feis.name if feis else "Unknown",
+            feis_name=feis_name or "Unknown",
             rank=p.rank,
             irish_points=p.irish_points,
             dance_type=p.dance_type,
@@ -78,39 +91,45 @@ async def get_dancer_placements(
             competition_date=p.competition_date,
             triggered_advancement=p.triggered_advancement,
             created_at=p.created_at
-        ))
-    
-    first_places = len([p for p in placements if p.rank == 1])
+        )
+        for p, competition_name, feis_name in rows
+    ]
     
     return DancerPlacementHistoryResponse(
         dancer_id=str(dancer.id),
         dancer_name=dancer.name,
-        total_placements=len(placements),
-        first_place_count=first_places,
+        total_placements=len(rows),
+        first_place_count=sum(1 for p in placement_responses if p.rank == 1),
         placements=placement_responses
     )
 
 
 @router.post("/placements", response_model=PlacementHistoryResponse)
-async def record_placement(
-    placement_data,
+def record_placement(
+    placement_data: PlacementHistoryCreate,
     session: Session = Depends(get_session),
-    current_user: User = Depends(require_organizer_or_admin())
+    current_user: Principal = Depends(REQUIRE_ORG_OR_ADMIN)
 ):
     """Record a placement for a dancer."""
-    from backend.api.schemas import PlacementHistoryCreate
-    
-    dancer = session.get(Dancer, UUID(placement_data.dancer_id))
-    if not dancer:
-        raise HTTPException(status_code=404, detail="Dancer not found")
-    
-    competition = session.get(Competition, UUID(placement_data.competition_id))
-    if not competition:
-        raise HTTPException(status_code=404, detail="Competition not found")
-    
-    feis = session.get(Feis, UUID(placement_data.feis_id))
-    if not feis:
+    dancer_id = UUID(placement_data.dancer_id)
+    competition_id = UUID(placement_data.competition_id)
+    feis_id = UUID(placement_data.feis_id)
+    
+    # Fetch all three in one round trip; the join comes back empty if any is missing
+    row = session.exec(
+        select(Dancer, Competition, Feis)
+        .select_from(Dancer)
+        .join(Competition, Competition.id == competition_id)
+        .join(Feis, Feis.id == feis_id)
+        .where(Dancer.id == dancer_id)
+    ).first()
+    if not row:
+        if not session.get(Dancer, dancer_id):
+            raise HTTPException(status_code=404, detail="Dancer not found")
+        if not session.get(Competition, competition_id):
+            raise HTTPException(status_code=404, detail="Competition not found")
         raise HTTPException(status_code=404, detail="Feis not found")
+    dancer, competition, feis = row
     
     placement = PlacementHistory(
         dancer_id=dancer.id,
@@ -147,7 +166,7 @@ async def record_placement(
 
 
 @router.get("/dancers/{dancer_id}/advancement", response_model=AdvancementCheckResponse)
-async def check_dancer_advancement(
+def check_dancer_advancement(
     dancer_id: str,
     session: Session = Depends(get_session)
 ):
@@ -161,9 +180,8 @@ async def check_dancer_advancement(
     pending = get_pending_advancements(session, dancer.id)
     eligible, warnings = get_eligible_levels(session, dancer)
     
-    pending_responses = []
-    for n in pending:
-        pending_responses.append(AdvancementNoticeResponse(
+    pending_responses = [
+        AdvancementNoticeResponse(
             id=str(n.id),
             dancer_id=str(n.dancer_id),
             dancer_name=dancer.name,
@@ -175,7 +193,9 @@ async def check_dancer_advancement(
             overridden=n.overridden,
             override_reason=n.override_reason,
             created_at=n.created_at
-        ))
+        )
+        for n in pending
+    ]
     
     return AdvancementCheckResponse(
         dancer_id=str(dancer.id),
@@ -188,7 +208,7 @@ async def check_dancer_advancement(
 
 
 @router.post("/advancement/{advancement_id}/acknowledge")
-async def acknowledge_advancement_notice(
+def acknowledge_advancement_notice(
     advancement_id: str,
     session: Session = Depends(get_session),
     current_user: User = Depends(get_current_user)
@@ -206,11 +226,11 @@ async def acknowledge_advancement_notice(
 
 
 @router.post("/advancement/{advancement_id}/override")
-async def override_advancement_requirement(
+def override_advancement_requirement(
     advancement_id: str,
     override_data: OverrideAdvancementRequest,
     session: Session = Depends(get_session),
-    current_user: User = Depends(require_organizer_or_admin())
+    current_user: Principal = Depends(REQUIRE_ORG_OR_ADMIN)
 ):
     """Override an advancement requirement (admin only). Allows a dancer to continue competing at their current level."""
     from backend.services.advancement import override_advancement
@@ -1,9 +1,10 @@
+import hashlib
 import os
-from fastapi import APIRouter, HTTPException, Depends
+from fastapi import APIRouter, HTTPException, Depends, Request, Response
 from fastapi.security import OAuth2PasswordRequestForm
-from typing import List
-from sqlmodel import Session, select
-from backend.scoring_engine.models_platform import User, RoleType, FeisOrganizer
+from typing import List, Optional
+from sqlmodel import Session, func, select
+from backend.scoring_engine.models_platform import User, RoleType
 from backend.db.database import get_session
 from backend.api.schemas import (
     LoginRequest, RegisterRequest, AuthResponse,
@@ -12,7 +13,12 @@ from backend.api.schemas import (
 )
 from backend.api.auth import (
     hash_password, verify_password, create_access_token,
-    get_current_user
+    get_current_user, get_user_by_email, invalidate_cached_user, is_co_organizer,
+    password_needs_rehash
+)
+from backend.api.rate_limit import (
+    LOGIN_EMAIL_LIMITER, LOGIN_IP_LIMITER, RESEND_DAILY_LIMITER, RESEND_IP_LIMITER,
+    email_key, rate_limit
 )
 from backend.services.email import (
     send_verification_email,
@@ -27,32 +33,60 @@ LOCAL_MODE = os.getenv("OPENFEIS_LOCAL_MODE", "false").lower() == "true"
 SEED_ADMIN_EMAIL = os.getenv("OPENFEIS_SEED_ADMIN_EMAIL", "admin@openfeis.org")
 DEFAULT_LOCAL_ADMIN_PASSWORD = "admin123"
 
+def upgrade_password_hash(session: Session, user: User, password: str) -> None:
+    """Re-hash a just-verified password if its stored hash uses an outdated cost."""
+    if password_needs_rehash(user.password_hash):
+        user.password_hash = hash_password(password)
+        session.add(user)
+        session.commit()
+        invalidate_cached_user(user.id)
+
+def not_modified_response(request: Request, response: Response, payload: bytes) -> Optional[Response]:
+    """
+    Tag a per-user response with an ETag of its payload. Returns a 304 to send
+    instead when the client already holds this version, otherwise None.
+    
+    Clients must revalidate every time (no-cache), so a profile change shows
+    up on the next request rather than after a max-age expires.
+    """
+    headers = {
+        "ETag": f'"{hashlib.sha1(payload).hexdigest()}"',
+        "Cache-Control": "private, no-cache",
+        "Vary": "Authorization",
+    }
+    if request.headers.get("if-none-match") == headers["ETag"]:
+        return Response(status_code=304, headers=headers)
+    response.headers.update(headers)
+    return None
+
 # ============= Authentication Endpoints =============
 
-@router.post("/auth/login", response_model=AuthResponse)
-async def login(
+@router.post(
+    "/auth/login",
+    response_model=AuthResponse,
+    dependencies=[Depends(rate_limit(LOGIN_IP_LIMITER, "login"))]
+)
+def login(
     credentials: LoginRequest,
     session: Session = Depends(get_session)
 ):
     """
     Authenticate user and return JWT token.
     """
-    # Find user by email
-    statement = select(User).where(User.email == credentials.email)
-    user = session.exec(statement).first()
+    limit_key = email_key(credentials.email)
+    LOGIN_EMAIL_LIMITER.ensure_allowed(limit_key)
     
-    if not user:
-        raise HTTPException(
-            status_code=401,
-            detail="Invalid email or password"
-        )
+    # Find user by email
+    user = get_user_by_email(session, credentials.email)
     
-    # Verify password
-    if not verify_password(credentials.password, user.password_hash):
+    # Verify password; only failures count towards the per-account limit
+    if not user or not verify_password(credentials.password, user.password_hash):
+        LOGIN_EMAIL_LIMITER.hit(limit_key)
         raise HTTPException(
             status_code=401,
             detail="Invalid email or password"
         )
+    upgrade_password_hash(session, user, credentials.password)
     
     # Create access token
     access_token = create_access_token(user.id, user.role)
@@ -72,7 +106,7 @@ async def login(
     return AuthResponse(
         access_token=access_token,
         token_type="bearer",
-        user=UserResponse(
+        user=UserResponse.model_construct(
             id=str(user.id),
             email=user.email,
             name=user.name,
@@ -82,8 +116,12 @@ async def login(
         warning=warning,
     )
 
-@router.post("/auth/login/form", response_model=AuthResponse)
-async def login_form(
+@router.post(
+    "/auth/login/form",
+    response_model=AuthResponse,
+    dependencies=[Depends(rate_limit(LOGIN_IP_LIMITER, "login"))]
+)
+def login_form(
     form_data: OAuth2PasswordRequestForm = Depends(),
     session: Session = Depends(get_session)
 ):
@@ -91,22 +129,20 @@ async def login_form(
     OAuth2 compatible login endpoint (for Swagger UI).
     Uses form data instead of JSON body.
     """
-    # Find user by email (username field in OAuth2)
-    statement = select(User).where(User.email == form_data.username)
-    user = session.exec(statement).first()
+    limit_key = email_key(form_data.username)
+    LOGIN_EMAIL_LIMITER.ensure_allowed(limit_key)
     
-    if not user:
-        raise HTTPException(
-            status_code=401,
-            detail="Invalid email or password"
-        )
+    # Find user by email (username field in OAuth2)
+    user = get_user_by_email(session, form_data.username)
     
-    # Verify password
-    if not verify_password(form_data.password, user.password_hash):
+    # Verify password; only failures count towards the per-account limit
+    if not user or not verify_password(form_data.password, user.password_hash):
+        LOGIN_EMAIL_LIMITER.hit(limit_key)
         raise HTTPException(
             status_code=401,
             detail="Invalid email or password"
         )
+    upgrade_password_hash(session, user, form_data.password)
     
     # Create access token
     access_token = create_access_token(user.id, user.role)
@@ -126,7 +162,7 @@ async def login_form(
     return AuthResponse(
         access_token=access_token,
         token_type="bearer",
-        user=UserResponse(
+        user=UserResponse.model_construct(
             id=str(user.id),
             email=user.email,
             name=user.name,
@@ -137,7 +173,7 @@ async def login_form(
     )
 
 @router.post("/auth/register", response_model=AuthResponse)
-async def register(
+def register(
     registration: RegisterRequest,
     session: Session = Depends(get_session)
 ):
@@ -147,7 +183,9 @@ async def register(
     Sends verification email if email is configured.
     """
     # Check if email already exists
-    statement = select(User).where(User.email == registration.email)
+    statement = select(User.id).where(
+        func.lower(User.email) == func.lower(registration.email.strip())
+    )
     existing_user = session.exec(statement).first()
     
     if existing_user:
@@ -177,7 +215,7 @@ async def register(
     return AuthResponse(
         access_token=access_token,
         token_type="bearer",
-        user=UserResponse(
+        user=UserResponse.model_construct(
             id=str(user.id),
             email=user.email,
             name=user.name,
@@ -187,7 +225,9 @@ async def register(
     )
 
 @router.get("/auth/me", response_model=UserResponse)
-async def get_current_user_info(
+def get_current_user_info(
+    request: Request,
+    response: Response,
     current_user: User = Depends(get_current_user),
     session: Session = Depends(get_session)
 ):
@@ -203,12 +243,11 @@ async def get_current_user_info(
     
     if not is_feis_organizer:
         # Check FeisOrganizer table
-        co_org = session.exec(
-            select(FeisOrganizer).where(FeisOrganizer.user_id == current_user.id)
-        ).first()
-        is_feis_organizer = co_org is not None
+        is_feis_organizer = is_co_organizer(session, current_user.id)
     
-    return UserResponse(
+    # Fields come straight from the user row, so skip validation here and in
+    # the other auth responses
+    user_info = UserResponse.model_construct(
         id=str(current_user.id),
         email=current_user.email,
         name=current_user.name,
@@ -216,12 +255,13 @@ async def get_current_user_info(
         email_verified=current_user.email_verified,
         is_feis_organizer=is_feis_organizer
     )
+    return not_modified_response(request, response, user_info.model_dump_json().encode()) or user_info
 
 
 # ============= Email Verification Endpoints =============
 
 @router.post("/auth/verify-email", response_model=VerificationResponse)
-async def verify_email(
+def verify_email(
     request: VerifyEmailRequest,
     session: Session = Depends(get_session)
 ):
@@ -242,13 +282,18 @@ async def verify_email(
     )
 
 
-@router.post("/auth/resend-verification", response_model=VerificationResponse)
-async def resend_verification(
+@router.post(
+    "/auth/resend-verification",
+    response_model=VerificationResponse,
+    dependencies=[Depends(rate_limit(RESEND_IP_LIMITER, "resend-verification"))]
+)
+def resend_verification(
     request: ResendVerificationRequest,
     session: Session = Depends(get_session)
 ):
     """
-    Resend the verification email. Rate limited to once per 60 seconds.
+    Resend the verification email. Rate limited to once per 60 seconds and
+    five times a day per account, plus a per-IP limit on requests.
     """
     # Check if email is configured
     if not is_email_configured(session):
@@ -258,8 +303,7 @@ async def resend_verification(
         )
     
     # Find user by email
-    statement = select(User).where(User.email == request.email)
-    user = session.exec(statement).first()
+    user = get_user_by_email(session, request.email)
     
     if not user:
         # Don't reveal whether email exists
@@ -280,6 +324,10 @@ async def resend_verification(
             status_code=429,
             detail="Please wait at least 60 seconds before requesting another verification email."
         )
+    RESEND_DAILY_LIMITER.check(
+        email_key(user.email),
+        detail="Too many verification emails requested today. Please try again tomorrow."
+    )
     
     # Send verification email
     sent = send_verification_email(session, user)
@@ -297,20 +345,25 @@ async def resend_verification(
 
 
 @router.get("/auth/email-status")
-async def get_email_status(
+def get_email_status(
+    request: Request,
+    response: Response,
     session: Session = Depends(get_session),
     current_user: User = Depends(get_current_user)
 ):
     """
     Get the current user's email verification status and whether email is configured.
     """
-    return {
-        "email_verified": current_user.email_verified,
-        "email_configured": is_email_configured(session)
+    email_verified = current_user.email_verified
+    email_configured = is_email_configured(session)
+    payload = f"{current_user.id}:{email_verified}:{email_configured}".encode()
+    return not_modified_response(request, response, payload) or {
+        "email_verified": email_verified,
+        "email_configured": email_configured
     }
 
 @router.put("/auth/profile", response_model=UserResponse)
-async def update_profile(
+def update_profile(
     profile_data: ProfileUpdate,
     session: Session = Depends(get_session),
     current_user: User = Depends(get_current_user)
@@ -323,9 +376,10 @@ async def update_profile(
     
     session.add(current_user)
     session.commit()
+    invalidate_cached_user(current_user.id)
     session.refresh(current_user)
     
-    return UserResponse(
+    return UserResponse.model_construct(
         id=str(current_user.id),
         email=current_user.email,
         name=current_user.name,
@@ -335,7 +389,7 @@ async def update_profile(
 
 
 @router.put("/auth/password")
-async def change_password(
+def change_password(
     password_data: PasswordChangeRequest,
     session: Session = Depends(get_session),
     current_user: User = Depends(get_current_user)
@@ -356,5 +410,6 @@ async def change_password(
     current_user.password_hash = hash_password(password_data.new_password)
     session.add(current_user)
     session.commit()
+    invalidate_cached_user(current_user.id)
     
     return {"message": "Password changed successfully"}
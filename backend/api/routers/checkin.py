@@ -1,149 +1,124 @@
-from fastapi import APIRouter, HTTPException, Depends
-from fastapi.responses import StreamingResponse
-from typing import List
+from fastapi import APIRouter, HTTPException, Depends, Request, Response
+from functools import lru_cache
+from typing import List, Tuple
 from uuid import UUID
 from sqlmodel import Session, select, func
 from backend.db.database import get_session
-from backend.api.auth import get_current_user, require_organizer_or_admin
-from backend.scoring_engine.models_platform import User, Entry, Dancer, Competition, CheckInStatus
+from backend.api.auth import Principal, get_current_user, REQUIRE_ORG_OR_ADMIN
+from backend.scoring_engine.models_platform import User, Entry, Dancer, Competition, CheckInStatus, RoleType
 from backend.api.schemas import CheckInRequest, CheckInResponse, BulkCheckInRequest, BulkCheckInResponse, StageMonitorResponse, StageMonitorEntry
-from backend.services.checkin import check_in_entry, undo_check_in
+from backend.services.checkin import (
+    CheckInResult, check_in_entry, check_in_by_feis_number, undo_check_in,
+    bulk_check_in as bulk_check_in_entries
+)
+import hashlib
 import qrcode
 import io
 
 router = APIRouter()
 
+def _check_in_response(result: CheckInResult) -> CheckInResponse:
+    # Built from values the service just read or set; no need to re-validate
+    return CheckInResponse.model_construct(
+        entry_id=result.entry_id,
+        dancer_name=result.dancer_name,
+        competitor_number=result.competitor_number,
+        competition_name=result.competition_name,
+        status=result.status,
+        checked_in_at=result.checked_in_at,
+        message=result.message
+    )
+
+
 @router.post("/checkin", response_model=CheckInResponse)
-async def check_in_dancer(
+def check_in_dancer(
     request: CheckInRequest,
     session: Session = Depends(get_session),
-    current_user: User = Depends(require_organizer_or_admin())
+    current_user: Principal = Depends(REQUIRE_ORG_OR_ADMIN)
 ):
     """Check in a dancer for their competition."""
-    success, message, entry = check_in_entry(session, UUID(request.entry_id))
-    
-    if not success:
-        raise HTTPException(status_code=400, detail=message)
+    result = check_in_entry(session, UUID(request.entry_id), current_user.id)
     
-    dancer = session.get(Dancer, entry.dancer_id)
-    comp = session.get(Competition, entry.competition_id)
+    if not result.success:
+        raise HTTPException(status_code=400, detail=result.message)
     
-    return CheckInResponse(
-        entry_id=str(entry.id),
-        dancer_name=dancer.name if dancer else "Unknown",
-        competitor_number=entry.competitor_number,
-        competition_name=comp.name if comp else "Unknown",
-        status=entry.check_in_status,
-        checked_in_at=entry.checked_in_at,
-        message=message
-    )
+    return _check_in_response(result)
 
 
 @router.post("/checkin/by-number", response_model=CheckInResponse)
-async def check_in_by_number(
+def check_in_by_number(
     feis_id: str,
     competitor_number: int,
     session: Session = Depends(get_session),
-    current_user: User = Depends(require_organizer_or_admin())
+    current_user: Principal = Depends(REQUIRE_ORG_OR_ADMIN)
 ):
     """Check in a dancer by their competitor number."""
-    entry = session.exec(
-        select(Entry)
-        .join(Competition)
-        .where(Competition.feis_id == UUID(feis_id))
-        .where(Entry.competitor_number == competitor_number)
-    ).first()
+    result = check_in_by_feis_number(session, UUID(feis_id), competitor_number, current_user.id)
     
-    if not entry:
+    if not result:
         raise HTTPException(status_code=404, detail=f"No entry found with number {competitor_number}")
     
-    success, message, entry = check_in_entry(session, entry.id)
-    
-    if not success:
-        raise HTTPException(status_code=400, detail=message)
-    
-    dancer = session.get(Dancer, entry.dancer_id)
-    comp = session.get(Competition, entry.competition_id)
+    if not result.success:
+        raise HTTPException(status_code=400, detail=result.message)
     
-    return CheckInResponse(
-        entry_id=str(entry.id),
-        dancer_name=dancer.name if dancer else "Unknown",
-        competitor_number=entry.competitor_number,
-        competition_name=comp.name if comp else "Unknown",
-        status=entry.check_in_status,
-        checked_in_at=entry.checked_in_at,
-        message=message
-    )
+    return _check_in_response(result)
 
 
 @router.post("/checkin/bulk", response_model=BulkCheckInResponse)
-async def bulk_check_in(
+def bulk_check_in(
     request: BulkCheckInRequest,
     session: Session = Depends(get_session),
-    current_user: User = Depends(require_organizer_or_admin())
+    current_user: Principal = Depends(REQUIRE_ORG_OR_ADMIN)
 ):
     """Check in multiple dancers at once."""
-    results = []
-    successful = 0
-    failed = 0
-    
-    for entry_id_str in request.entry_ids:
-        success, message, entry = check_in_entry(session, UUID(entry_id_str))
-        
-        if success:
-            successful += 1
-        else:
-            failed += 1
-        
-        dancer = session.get(Dancer, entry.dancer_id) if entry else None
-        comp = session.get(Competition, entry.competition_id) if entry else None
-        
-        results.append(CheckInResponse(
-            entry_id=entry_id_str,
-            dancer_name=dancer.name if dancer else "Unknown",
-            competitor_number=entry.competitor_number if entry else None,
-            competition_name=comp.name if comp else "Unknown",
-            status=entry.check_in_status if entry else CheckInStatus.NOT_CHECKED_IN,
-            checked_in_at=entry.checked_in_at if entry else None,
-            message=message
-        ))
+    results = bulk_check_in_entries(
+        session, [UUID(entry_id) for entry_id in request.entry_ids], current_user.id
+    )
+    successful = sum(1 for result in results if result.success)
     
     return BulkCheckInResponse(
         successful=successful,
-        failed=failed,
-        results=results
+        failed=len(results) - successful,
+        results=[_check_in_response(result) for result in results]
     )
 
 
 @router.post("/checkin/{entry_id}/undo", response_model=CheckInResponse)
-async def undo_check_in_endpoint(
+def undo_check_in_endpoint(
     entry_id: str,
     session: Session = Depends(get_session),
-    current_user: User = Depends(require_organizer_or_admin())
+    current_user: Principal = Depends(REQUIRE_ORG_OR_ADMIN)
 ):
     """Undo a check-in."""
-    success, message, entry = undo_check_in(session, UUID(entry_id))
+    result = undo_check_in(session, UUID(entry_id))
     
-    if not success:
-        raise HTTPException(status_code=400, detail=message)
+    if not result.success:
+        raise HTTPException(status_code=400, detail=result.message)
     
-    dancer = session.get(Dancer, entry.dancer_id)
-    comp = session.get(Competition, entry.competition_id)
+    return _check_in_response(result)
+
+
+@lru_cache(maxsize=4096)
+def _checkin_qr_png(dancer_id: str) -> Tuple[bytes, str]:
+    """
+    Render the check-in QR code for a dancer as PNG bytes plus an ETag.
+    The payload never changes for a dancer, so each code is only drawn once.
+    """
+    qr = qrcode.QRCode(version=1, box_size=10, border=4)
+    qr.add_data(f"dancer:{dancer_id}")
+    qr.make(fit=True)
     
-    return CheckInResponse(
-        entry_id=str(entry.id),
-        dancer_name=dancer.name if dancer else "Unknown",
-        competitor_number=entry.competitor_number,
-        competition_name=comp.name if comp else "Unknown",
-        status=entry.check_in_status,
-        checked_in_at=entry.checked_in_at,
-        message=message
-    )
+    img = qr.make_image(fill_color="black", back_color="white")
+    buf = io.BytesIO()
+    img.save(buf, format='PNG')
+    png = buf.getvalue()
+    return png, f'"{hashlib.sha1(png).hexdigest()}"'
 
 
 @router.get("/checkin/qr/{dancer_id}")
-async def generate_checkin_qr_code(
+def generate_checkin_qr_code(
     dancer_id: str,
+    request: Request,
     session: Session = Depends(get_session),
     current_user: User = Depends(get_current_user)
 ):
@@ -156,14 +131,9 @@ async def generate_checkin_qr_code(
     if current_user.role == RoleType.PARENT and dancer.parent_id != current_user.id:
         raise HTTPException(status_code=403, detail="Not authorized")
     
-    # Generate QR code with dancer ID
-    qr = qrcode.QRCode(version=1, box_size=10, border=4)
-    qr.add_data(f"dancer:{dancer_id}")
-    qr.make(fit=True)
-    
-    img = qr.make_image(fill_color="black", back_color="white")
-    buf = io.BytesIO()
-    img.save(buf, format='PNG')
-    buf.seek(0)
+    png, etag = _checkin_qr_png(str(dancer.id))
+    headers = {"ETag": etag, "Cache-Control": "private, max-age=86400"}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
     
-    return StreamingResponse(buf, media_type="image/png")
+    return Response(content=png, media_type="image/png", headers=headers)
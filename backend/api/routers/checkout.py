@@ -4,7 +4,7 @@ from uuid import UUID
 from datetime import datetime
 from sqlmodel import Session, select, func
 from backend.db.database import get_session
-from backend.api.auth import get_current_user, require_organizer_or_admin
+from backend.api.auth import Principal, get_current_user, REQUIRE_ORG_OR_ADMIN
 from backend.scoring_engine.models_platform import User, Feis, Order, Entry, FeeItem, RoleType, PaymentStatus
 from backend.api.schemas import (
     CartCalculationRequest, CartCalculationResponse, CartLineItemResponse,
@@ -15,7 +15,7 @@ from backend.api.schemas import (
 )
 from backend.services.cart import calculate_cart, create_order
 from backend.services.stripe import create_checkout_session, handle_checkout_success
-from backend.services.email import get_site_settings
+from backend.services.email import get_cached_site_settings
 from backend.services.refund import process_full_refund, process_partial_refund, get_order_refund_summary
 
 router = APIRouter()
@@ -169,7 +169,7 @@ async def checkout(
         )
     
     # Online payment - create Stripe checkout session
-    site_settings = get_site_settings(session)
+    site_settings = get_cached_site_settings(session)
     base_url = site_settings.site_url
     
     success_url = f"{base_url}/registration/success"
@@ -307,7 +307,7 @@ async def refund_order(
     order_id: str,
     request: RefundRequest,
     session: Session = Depends(get_session),
-    current_user: User = Depends(require_organizer_or_admin())
+    current_user: Principal = Depends(REQUIRE_ORG_OR_ADMIN)
 ):
     """Process a refund for an order."""
     order = session.get(Order, UUID(order_id))
@@ -4,7 +4,7 @@ from uuid import UUID
 from datetime import datetime
 from sqlmodel import Session, select, func
 from backend.db.database import get_session
-from backend.api.auth import get_current_user, require_organizer_or_admin
+from backend.api.auth import Principal, get_current_user, REQUIRE_ORG_OR_ADMIN
 from backend.scoring_engine.models_platform import User, Feis, Competition, Entry, Dancer, RoleType, CheckInStatus
 from backend.api.schemas import CompetitionCreate, CompetitionUpdate, CompetitionResponse, StageMonitorResponse, StageMonitorEntry
 from backend.utils.competition_codes import generate_competition_code
@@ -208,7 +208,7 @@ async def delete_competition(
 async def update_competition_duration(
     comp_id: str,
     session: Session = Depends(get_session),
-    current_user: User = Depends(require_organizer_or_admin())
+    current_user: Principal = Depends(REQUIRE_ORG_OR_ADMIN)
 ):
     """Recalculate and update the estimated duration for a competition."""
     competition = session.get(Competition, UUID(comp_id))
@@ -313,7 +313,7 @@ async def update_competition_schedule(
     comp_id: str,
     schedule_update: dict,
     session: Session = Depends(get_session),
-    current_user: User = Depends(require_organizer_or_admin())
+    current_user: Principal = Depends(REQUIRE_ORG_OR_ADMIN)
 ):
     """
     Update competition scheduling details (stage, time, adjudicator).
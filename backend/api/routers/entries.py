@@ -3,9 +3,10 @@ from fastapi.responses import StreamingResponse
 from typing import List, Optional
 from uuid import UUID
 from datetime import date, datetime
+from sqlalchemy.orm import aliased
 from sqlmodel import Session, select, func
 from backend.db.database import get_session
-from backend.api.auth import get_current_user, require_organizer_or_admin, require_teacher
+from backend.api.auth import Principal, get_current_user, REQUIRE_ORG_OR_ADMIN, REQUIRE_TEACHER
 from backend.scoring_engine.models_platform import User, Entry, Dancer, Competition, Feis, RoleType, EntryFlag
 from backend.api.schemas import (
     EntryCreate, EntryUpdate, EntryResponse,
@@ -53,7 +54,7 @@ async def create_entry(
     
     # Check for duplicate entry
     existing = session.exec(
-        select(Entry)
+        select(Entry.id)
         .where(Entry.dancer_id == dancer.id)
         .where(Entry.competition_id == competition.id)
     ).first()
@@ -106,7 +107,7 @@ async def create_bulk_entries(
         
         # Check for duplicate
         existing = session.exec(
-            select(Entry)
+            select(Entry.id)
             .where(Entry.dancer_id == dancer.id)
             .where(Entry.competition_id == competition.id)
         ).first()
@@ -152,40 +153,41 @@ async def list_entries(
     dancer_id: Optional[str] = None,
     competition_id: Optional[str] = None,
     session: Session = Depends(get_session),
-    current_user: User = Depends(require_organizer_or_admin())
+    current_user: Principal = Depends(REQUIRE_ORG_OR_ADMIN)
 ):
     """List entries with optional filters."""
-    statement = select(Entry)
+    # Fetch each entry with its dancer, competition and school name in one
+    # query rather than looking them up row by row.
+    school = aliased(User)
+    statement = (
+        select(Entry, Dancer.name, Competition.name, school.name)
+        .join(Dancer, Dancer.id == Entry.dancer_id)
+        .join(Competition, Competition.id == Entry.competition_id)
+        .outerjoin(school, school.id == Dancer.school_id)
+    )
     
     if competition_id:
         statement = statement.where(Entry.competition_id == UUID(competition_id))
     elif feis_id:
-        # Filter by feis requires join
-        statement = statement.join(Competition).where(Competition.feis_id == UUID(feis_id))
+        statement = statement.where(Competition.feis_id == UUID(feis_id))
     
     if dancer_id:
         statement = statement.where(Entry.dancer_id == UUID(dancer_id))
     
-    entries = session.exec(statement).all()
-    
-    result = []
-    for entry in entries:
-        dancer = session.get(Dancer, entry.dancer_id)
-        competition = session.get(Competition, entry.competition_id)
-        if dancer and competition:
-            result.append(EntryResponse(
-                id=str(entry.id),
-                dancer_id=str(entry.dancer_id),
-                dancer_name=dancer.name,
-                dancer_school=get_school_name(session, dancer.school_id),
-                competition_id=str(entry.competition_id),
-                competition_name=competition.name,
-                competitor_number=entry.competitor_number,
-                paid=entry.paid,
-                pay_later=entry.pay_later
-            ))
-    
-    return result
+    return [
+        EntryResponse(
+            id=str(entry.id),
+            dancer_id=str(entry.dancer_id),
+            dancer_name=dancer_name,
+            dancer_school=school_name,
+            competition_id=str(entry.competition_id),
+            competition_name=competition_name,
+            competitor_number=entry.competitor_number,
+            paid=entry.paid,
+            pay_later=entry.pay_later
+        )
+        for entry, dancer_name, competition_name, school_name in session.exec(statement)
+    ]
 
 
 @router.put("/entries/{entry_id}", response_model=EntryResponse)
@@ -252,7 +254,7 @@ async def generate_single_number_card(
     entry_id: str,
     session: Session = Depends(get_session),
     base_url: str = Query("https://openfeis.com"),
-    current_user: User = Depends(require_organizer_or_admin())
+    current_user: Principal = Depends(REQUIRE_ORG_OR_ADMIN)
 ):
     """Generate a PDF with a single number card (for reprints)."""
     entry = session.get(Entry, UUID(entry_id))
@@ -361,7 +363,7 @@ async def flag_entry(
     entry_id: str,
     flag_data: EntryFlagCreate,
     session: Session = Depends(get_session),
-    current_user: User = Depends(require_teacher())
+    current_user: Principal = Depends(REQUIRE_TEACHER)
 ):
     """
     Flag an entry for organizer review.
@@ -374,7 +376,7 @@ async def flag_entry(
     
     # Check if already flagged
     existing = session.exec(
-        select(EntryFlag)
+        select(EntryFlag.id)
         .where(EntryFlag.entry_id == entry.id)
         .where(EntryFlag.resolved == False)
     ).first()
@@ -420,7 +422,7 @@ async def resolve_flag(
     flag_id: str,
     resolve_data: ResolveFlagRequest,
     session: Session = Depends(get_session),
-    current_user: User = Depends(require_organizer_or_admin())
+    current_user: Principal = Depends(REQUIRE_ORG_OR_ADMIN)
 ):
     """Resolve a flagged entry."""
     flag = session.get(EntryFlag, UUID(flag_id))
@@ -18,7 +18,7 @@ from typing import List, Dict, Any
 from uuid import UUID
 from sqlmodel import Session, select, func
 from backend.db.database import get_session
-from backend.api.auth import get_current_user, require_organizer_or_admin
+from backend.api.auth import Principal, get_current_user, invalidate_cached_co_organizer, REQUIRE_ORG_OR_ADMIN
 from backend.scoring_engine.models_platform import (
     User, Feis, Competition, Entry, RoleType,
     Stage, FeisSettings, FeeItem, StageJudgeCoverage,
@@ -53,7 +53,7 @@ router = APIRouter()
 
 # ============= Helper Functions =============
 
-def is_feis_organizer(feis: Feis, user: User, session: Session) -> bool:
+def is_feis_organizer(feis: Feis, user: Principal, session: Session) -> bool:
     """
     Check if a user is an organizer for a feis (primary or co-organizer).
     
@@ -79,7 +79,7 @@ def is_feis_organizer(feis: Feis, user: User, session: Session) -> bool:
     return co_org is not None
 
 
-def get_feis_organizer_permissions(feis: Feis, user: User, session: Session) -> dict:
+def get_feis_organizer_permissions(feis: Feis, user: Principal, session: Session) -> dict:
     """
     Get the permissions for a user on a feis.
     
@@ -166,7 +166,7 @@ async def list_feiseanna(
 @router.get("/feis/mine", response_model=List[FeisResponse])
 async def list_my_feiseanna(
     session: Session = Depends(get_session),
-    current_user: User = Depends(require_organizer_or_admin())
+    current_user: Principal = Depends(REQUIRE_ORG_OR_ADMIN)
 ):
     """
     List feiseanna that the current user can manage.
@@ -225,7 +225,7 @@ async def list_my_feiseanna(
 async def create_feis(
     feis_data: FeisCreate, 
     session: Session = Depends(get_session),
-    current_user: User = Depends(require_organizer_or_admin())
+    current_user: Principal = Depends(REQUIRE_ORG_OR_ADMIN)
 ):
     """Create a new feis. Requires organizer or super_admin role."""
     if feis_data.organizer_id:
@@ -288,7 +288,7 @@ async def update_feis(
     feis_id: str, 
     feis_data: FeisUpdate, 
     session: Session = Depends(get_session),
-    current_user: User = Depends(require_organizer_or_admin())
+    current_user: Principal = Depends(REQUIRE_ORG_OR_ADMIN)
 ):
     """Update a feis. Requires organizer (owner/co-organizer) or super_admin role."""
     feis = session.get(Feis, UUID(feis_id))
@@ -337,7 +337,7 @@ async def update_feis(
 async def delete_feis(
     feis_id: str, 
     session: Session = Depends(get_session),
-    current_user: User = Depends(require_organizer_or_admin())
+    current_user: Principal = Depends(REQUIRE_ORG_OR_ADMIN)
 ):
     """Delete a feis and all its competitions/entries. Requires primary organizer or super_admin role."""
     feis = session.get(Feis, UUID(feis_id))
@@ -428,12 +428,15 @@ async def delete_feis(
     co_organizers = session.exec(
         select(FeisOrganizer).where(FeisOrganizer.feis_id == feis.id)
     ).all()
+    co_organizer_user_ids = [co_org.user_id for co_org in co_organizers]
     for co_org in co_organizers:
         session.delete(co_org)
     
     # 11. Finally, delete the feis itself
     session.delete(feis)
     session.commit()
+    for user_id in co_organizer_user_ids:
+        invalidate_cached_co_organizer(user_id)
     
     return {"message": f"Feis '{feis.name}' and all associated data deleted"}
 
@@ -444,7 +447,7 @@ async def delete_feis(
 async def list_feis_organizers(
     feis_id: str,
     session: Session = Depends(get_session),
-    current_user: User = Depends(require_organizer_or_admin())
+    current_user: Principal = Depends(REQUIRE_ORG_OR_ADMIN)
 ):
     """List all organizers (primary and co-organizers) for a feis."""
     feis = session.get(Feis, UUID(feis_id))
@@ -496,7 +499,7 @@ async def add_feis_organizer(
     feis_id: str,
     organizer_data: FeisOrganizerCreate,
     session: Session = Depends(get_session),
-    current_user: User = Depends(require_organizer_or_admin())
+    current_user: Principal = Depends(REQUIRE_ORG_OR_ADMIN)
 ):
     """Add a co-organizer to a feis. Requires permission to add organizers."""
     feis = session.get(Feis, UUID(feis_id))
@@ -515,7 +518,7 @@ async def add_feis_organizer(
         raise HTTPException(status_code=400, detail="User is already the primary organizer")
     
     existing = session.exec(
-        select(FeisOrganizer).where(
+        select(FeisOrganizer.id).where(
             FeisOrganizer.feis_id == feis.id,
             FeisOrganizer.user_id == user_to_add.id
         )
@@ -537,6 +540,7 @@ async def add_feis_organizer(
     session.add(co_organizer)
     session.commit()
     session.refresh(co_organizer)
+    invalidate_cached_co_organizer(co_organizer.user_id)
     
     return FeisOrganizerResponse(
         id=str(co_organizer.id),
@@ -562,7 +566,7 @@ async def update_feis_organizer(
     organizer_id: str,
     organizer_data: FeisOrganizerUpdate,
     session: Session = Depends(get_session),
-    current_user: User = Depends(require_organizer_or_admin())
+    current_user: Principal = Depends(REQUIRE_ORG_OR_ADMIN)
 ):
     """Update a co-organizer's permissions. Requires permission to add organizers."""
     feis = session.get(Feis, UUID(feis_id))
@@ -620,7 +624,7 @@ async def remove_feis_organizer(
     feis_id: str,
     organizer_id: str,
     session: Session = Depends(get_session),
-    current_user: User = Depends(require_organizer_or_admin())
+    current_user: Principal = Depends(REQUIRE_ORG_OR_ADMIN)
 ):
     """Remove a co-organizer from a feis. Requires permission to add organizers."""
     feis = session.get(Feis, UUID(feis_id))
@@ -635,11 +639,13 @@ async def remove_feis_organizer(
     if not co_organizer or co_organizer.feis_id != feis.id:
         raise HTTPException(status_code=404, detail="Co-organizer not found for this feis")
     
-    user = session.get(User, co_organizer.user_id)
+    user_id = co_organizer.user_id
+    user = session.get(User, user_id)
     user_name = user.name if user else "Unknown"
     
     session.delete(co_organizer)
     session.commit()
+    invalidate_cached_co_organizer(user_id)
     
     return {"message": f"Co-organizer '{user_name}' removed from feis"}
 
@@ -696,7 +702,7 @@ async def list_competitions(feis_id: str, session: Session = Depends(get_session
 async def delete_empty_competitions(
     feis_id: str, 
     session: Session = Depends(get_session),
-    current_user: User = Depends(require_organizer_or_admin())
+    current_user: Principal = Depends(REQUIRE_ORG_OR_ADMIN)
 ):
     """Delete all competitions with zero entries for a feis."""
     feis = session.get(Feis, UUID(feis_id))
@@ -821,7 +827,7 @@ async def update_feis_settings(
     feis_id: str,
     settings_data: FeisSettingsUpdate,
     session: Session = Depends(get_session),
-    current_user: User = Depends(require_organizer_or_admin())
+    current_user: Principal = Depends(REQUIRE_ORG_OR_ADMIN)
 ):
     """Update feis settings. Requires organizer (owner) or super_admin role."""
     feis = session.get(Feis, UUID(feis_id))
@@ -916,7 +922,7 @@ async def create_fee_item(
     feis_id: str,
     item_data: FeeItemCreate,
     session: Session = Depends(get_session),
-    current_user: User = Depends(require_organizer_or_admin())
+    current_user: Principal = Depends(REQUIRE_ORG_OR_ADMIN)
 ):
     """Create a fee item. Requires organizer (owner) or super_admin role."""
     feis = session.get(Feis, UUID(feis_id))
@@ -957,7 +963,7 @@ async def update_fee_item(
     item_id: str,
     item_data: FeeItemUpdate,
     session: Session = Depends(get_session),
-    current_user: User = Depends(require_organizer_or_admin())
+    current_user: Principal = Depends(REQUIRE_ORG_OR_ADMIN)
 ):
     """Update a fee item."""
     item = session.get(FeeItem, UUID(item_id))
@@ -1004,7 +1010,7 @@ async def update_fee_item(
 async def delete_fee_item(
     item_id: str,
     session: Session = Depends(get_session),
-    current_user: User = Depends(require_organizer_or_admin())
+    current_user: Principal = Depends(REQUIRE_ORG_OR_ADMIN)
 ):
     """Delete (soft-delete by deactivating) a fee item."""
     item = session.get(FeeItem, UUID(item_id))
@@ -1101,7 +1107,7 @@ async def start_stripe_onboarding(
     feis_id: str,
     onboarding_data: StripeOnboardingRequest,
     session: Session = Depends(get_session),
-    current_user: User = Depends(require_organizer_or_admin())
+    current_user: Principal = Depends(REQUIRE_ORG_OR_ADMIN)
 ):
     """Start Stripe Connect onboarding for a feis."""
     feis = session.get(Feis, UUID(feis_id))
@@ -1130,7 +1136,7 @@ async def start_stripe_onboarding(
 async def complete_stripe_onboarding(
     feis_id: str,
     session: Session = Depends(get_session),
-    current_user: User = Depends(require_organizer_or_admin())
+    current_user: Principal = Depends(REQUIRE_ORG_OR_ADMIN)
 ):
     """
     Check and mark Stripe onboarding as complete.
@@ -1179,7 +1185,7 @@ async def complete_stripe_onboarding(
 async def export_feis_endpoint(
     feis_id: str,
     session: Session = Depends(get_session),
-    current_user: User = Depends(require_organizer_or_admin())
+    current_user: Principal = Depends(REQUIRE_ORG_OR_ADMIN)
 ):
     """
     Export a complete feis as JSON for archival, cloning, or migration.
@@ -1230,7 +1236,7 @@ async def import_feis_endpoint(
     import_data: Dict[str, Any],
     include_orders: bool = True,
     session: Session = Depends(get_session),
-    current_user: User = Depends(require_organizer_or_admin())
+    current_user: Principal = Depends(REQUIRE_ORG_OR_ADMIN)
 ):
     """
     Import a feis from exported JSON data.
@@ -1246,7 +1252,7 @@ async def import_feis_endpoint(
     - The new feis ID
     """
     try:
-        report = import_feis(session, import_data, current_user, include_orders)
+        report = import_feis(session, import_data, current_user.id, include_orders)
         
         if not report["success"]:
             raise HTTPException(
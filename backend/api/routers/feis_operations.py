@@ -23,7 +23,7 @@ from datetime import date
 from sqlmodel import Session, select, func
 from backend.db.database import get_session
 from backend.api.auth import (
-    get_current_user, require_organizer_or_admin, require_adjudicator
+    Principal, get_current_user, REQUIRE_ORG_OR_ADMIN, REQUIRE_ADJUDICATOR
 )
 from backend.scoring_engine.models_platform import (
     User, Feis, Competition, Dancer, Entry, RoleType,
@@ -83,7 +83,7 @@ def get_school_name(session: Session, school_id: Optional[UUID]) -> Optional[str
 @router.get("/judge/feiseanna", response_model=List[FeisResponse])
 async def get_judge_feiseanna(
     session: Session = Depends(get_session),
-    current_user: User = Depends(require_adjudicator())
+    current_user: Principal = Depends(REQUIRE_ADJUDICATOR)
 ):
     """
     Get all feiseanna the current user is authorized to judge.
@@ -318,7 +318,7 @@ async def bulk_schedule_competitions(
     feis_id: str,
     request: BulkScheduleRequest,
     session: Session = Depends(get_session),
-    current_user: User = Depends(require_organizer_or_admin())
+    current_user: Principal = Depends(REQUIRE_ORG_OR_ADMIN)
 ):
     """Schedule multiple competitions at once with auto-judge assignment."""
     feis = session.get(Feis, UUID(feis_id))
@@ -369,7 +369,7 @@ async def bulk_schedule_competitions(
 async def reassign_judges_from_coverage(
     feis_id: str,
     session: Session = Depends(get_session),
-    current_user: User = Depends(require_organizer_or_admin())
+    current_user: Principal = Depends(REQUIRE_ORG_OR_ADMIN)
 ):
     """
     Clear all explicit judge/panel assignments from scheduled competitions.
@@ -416,7 +416,7 @@ async def instant_schedule(
     feis_id: str,
     request: InstantSchedulerRequest = None,
     session: Session = Depends(get_session),
-    current_user: User = Depends(require_organizer_or_admin())
+    current_user: Principal = Depends(REQUIRE_ORG_OR_ADMIN)
 ):
     """Generate an instant schedule for a feis using algorithmic heuristics."""
     from backend.services.instant_scheduler import (
@@ -630,16 +630,12 @@ async def list_entries(
     if not feis:
         raise HTTPException(status_code=404, detail="Feis not found")
     
-    competitions = session.exec(
-        select(Competition).where(Competition.feis_id == feis.id)
-    ).all()
-    comp_ids = [c.id for c in competitions]
-    comp_map = {c.id: c for c in competitions}
-    
-    if not comp_ids:
-        return []
-    
-    statement = select(Entry).where(Entry.competition_id.in_(comp_ids))
+    statement = (
+        select(Entry, Dancer.name, Competition.name)
+        .join(Dancer, Dancer.id == Entry.dancer_id)
+        .join(Competition, Competition.id == Entry.competition_id)
+        .where(Competition.feis_id == feis.id)
+    )
     
     if paid is not None:
         statement = statement.where(Entry.paid == paid)
@@ -649,26 +645,20 @@ async def list_entries(
         else:
             statement = statement.where(Entry.competitor_number.is_(None))
     
-    entries = session.exec(statement).all()
-    
-    result = []
-    for entry in entries:
-        dancer = session.get(Dancer, entry.dancer_id)
-        comp = comp_map.get(entry.competition_id)
-        if dancer and comp:
-            result.append(EntryResponse(
-                id=str(entry.id),
-                dancer_id=str(entry.dancer_id),
-                dancer_name=dancer.name,
-                dancer_school=None,
-                competition_id=str(entry.competition_id),
-                competition_name=comp.name,
-                competitor_number=entry.competitor_number,
-                paid=entry.paid,
-                pay_later=entry.pay_later
-            ))
-    
-    return result
+    return [
+        EntryResponse(
+            id=str(entry.id),
+            dancer_id=str(entry.dancer_id),
+            dancer_name=dancer_name,
+            dancer_school=None,
+            competition_id=str(entry.competition_id),
+            competition_name=competition_name,
+            competitor_number=entry.competitor_number,
+            paid=entry.paid,
+            pay_later=entry.pay_later
+        )
+        for entry, dancer_name, competition_name in session.exec(statement)
+    ]
 
 
 @router.post("/feis/{feis_id}/assign-numbers", response_model=BulkNumberAssignmentResponse)
@@ -720,7 +710,7 @@ async def generate_feis_number_cards(
     feis_id: str,
     session: Session = Depends(get_session),
     base_url: str = Query("https://openfeis.com", description="Base URL for QR code check-in links"),
-    current_user: User = Depends(require_organizer_or_admin())
+    current_user: Principal = Depends(REQUIRE_ORG_OR_ADMIN)
 ):
     """Generate a PDF of all number cards for a feis."""
     feis = session.get(Feis, UUID(feis_id))
@@ -811,7 +801,7 @@ async def get_feis_flags(
     feis_id: str,
     include_resolved: bool = False,
     session: Session = Depends(get_session),
-    current_user: User = Depends(require_organizer_or_admin())
+    current_user: Principal = Depends(REQUIRE_ORG_OR_ADMIN)
 ):
     """Get all flagged entries for a feis."""
     feis = session.get(Feis, UUID(feis_id))
@@ -989,7 +979,7 @@ async def get_feis_refund_policy(
 async def get_feis_refund_statistics(
     feis_id: str,
     session: Session = Depends(get_session),
-    current_user: User = Depends(require_organizer_or_admin())
+    current_user: Principal = Depends(REQUIRE_ORG_OR_ADMIN)
 ):
     """Get refund statistics for a feis."""
     feis = session.get(Feis, UUID(feis_id))
@@ -1069,7 +1059,7 @@ async def add_feis_adjudicator(
     feis_id: str,
     adjudicator_data: AdjudicatorCreate,
     session: Session = Depends(get_session),
-    current_user: User = Depends(require_organizer_or_admin())
+    current_user: Principal = Depends(REQUIRE_ORG_OR_ADMIN)
 ):
     """Add an adjudicator to the feis roster."""
     feis = session.get(Feis, UUID(feis_id))
@@ -1082,14 +1072,14 @@ async def add_feis_adjudicator(
     existing = None
     if adjudicator_data.email:
         existing = session.exec(
-            select(FeisAdjudicator)
+            select(FeisAdjudicator.id)
             .where(FeisAdjudicator.feis_id == UUID(feis_id))
             .where(FeisAdjudicator.email == adjudicator_data.email)
         ).first()
     
     if not existing and adjudicator_data.user_id:
         existing = session.exec(
-            select(FeisAdjudicator)
+            select(FeisAdjudicator.id)
             .where(FeisAdjudicator.feis_id == UUID(feis_id))
             .where(FeisAdjudicator.user_id == UUID(adjudicator_data.user_id))
         ).first()
@@ -1239,7 +1229,7 @@ async def update_scheduling_defaults(
     feis_id: str,
     update_data: SchedulingDefaultsUpdate,
     session: Session = Depends(get_session),
-    current_user: User = Depends(require_organizer_or_admin())
+    current_user: Principal = Depends(REQUIRE_ORG_OR_ADMIN)
 ):
     """Update scheduling defaults for a feis."""
     feis = session.get(Feis, UUID(feis_id))
@@ -11,7 +11,7 @@ from uuid import UUID
 from datetime import datetime
 
 from backend.db.database import get_session
-from backend.api.auth import require_organizer_or_admin
+from backend.api.auth import Principal, REQUIRE_ORG_OR_ADMIN
 from backend.api.schemas import (
     JudgePanelCreate,
     JudgePanelUpdate,
@@ -20,7 +20,6 @@ from backend.api.schemas import (
     PanelMemberResponse
 )
 from backend.scoring_engine.models_platform import (
-    User,
     Feis,
     JudgePanel,
     PanelMember,
@@ -91,7 +90,7 @@ async def create_panel(
     feis_id: str,
     panel_data: JudgePanelCreate,
     session: Session = Depends(get_session),
-    current_user: User = Depends(require_organizer_or_admin())
+    current_user: Principal = Depends(REQUIRE_ORG_OR_ADMIN)
 ):
     """Create a new judge panel."""
     feis = session.get(Feis, UUID(feis_id))
@@ -164,7 +163,7 @@ async def update_panel(
     panel_id: str,
     panel_data: JudgePanelUpdate,
     session: Session = Depends(get_session),
-    current_user: User = Depends(require_organizer_or_admin())
+    current_user: Principal = Depends(REQUIRE_ORG_OR_ADMIN)
 ):
     """Update a judge panel."""
     panel = session.get(JudgePanel, UUID(panel_id))
@@ -241,7 +240,7 @@ async def update_panel(
 async def delete_panel(
     panel_id: str,
     session: Session = Depends(get_session),
-    current_user: User = Depends(require_organizer_or_admin())
+    current_user: Principal = Depends(REQUIRE_ORG_OR_ADMIN)
 ):
     """Delete a judge panel."""
     panel = session.get(JudgePanel, UUID(panel_id))
@@ -251,7 +250,7 @@ async def delete_panel(
     # Check if panel is currently assigned to any stages
     from backend.scoring_engine.models_platform import StageJudgeCoverage
     coverage = session.exec(
-        select(StageJudgeCoverage).where(StageJudgeCoverage.panel_id == panel.id)
+        select(StageJudgeCoverage.id).where(StageJudgeCoverage.panel_id == panel.id)
     ).first()
     
     if coverage:
@@ -4,7 +4,7 @@ from datetime import datetime, date, time
 from uuid import UUID
 from sqlmodel import Session, select, func
 from backend.db.database import get_session
-from backend.api.auth import get_current_user, require_organizer_or_admin
+from backend.api.auth import Principal, get_current_user, REQUIRE_ORG_OR_ADMIN
 from backend.scoring_engine.models_platform import User, Stage, StageJudgeCoverage, Feis, FeisAdjudicator, RoleType
 from backend.api.schemas import (
     StageCreate, StageUpdate, StageResponse, StageJudgeCoverageCreate, StageJudgeCoverageResponse,
@@ -127,7 +127,7 @@ def sync_competitions_with_coverage(
 async def create_stage(
     stage_data: StageCreate,
     session: Session = Depends(get_session),
-    current_user: User = Depends(require_organizer_or_admin())
+    current_user: Principal = Depends(REQUIRE_ORG_OR_ADMIN)
 ):
     """Create a new stage."""
     feis = session.get(Feis, UUID(stage_data.feis_id))
@@ -164,7 +164,7 @@ async def update_stage(
     stage_id: str,
     stage_data: StageUpdate,
     session: Session = Depends(get_session),
-    current_user: User = Depends(require_organizer_or_admin())
+    current_user: Principal = Depends(REQUIRE_ORG_OR_ADMIN)
 ):
     """Update a stage."""
     stage = session.get(Stage, UUID(stage_id))
@@ -206,7 +206,7 @@ async def update_stage(
 async def delete_stage(
     stage_id: str,
     session: Session = Depends(get_session),
-    current_user: User = Depends(require_organizer_or_admin())
+    current_user: Principal = Depends(REQUIRE_ORG_OR_ADMIN)
 ):
     """Delete a stage. Competitions assigned to this stage will have their stage_id cleared."""
     stage = session.get(Stage, UUID(stage_id))
@@ -299,7 +299,7 @@ async def create_stage_coverage(
     stage_id: str,
     coverage_data: StageJudgeCoverageCreate,
     session: Session = Depends(get_session),
-    current_user: User = Depends(require_organizer_or_admin())
+    current_user: Principal = Depends(REQUIRE_ORG_OR_ADMIN)
 ):
     """Add a judge or panel coverage block to a stage."""
     
@@ -420,7 +420,7 @@ async def create_stage_coverage(
 async def delete_stage_coverage(
     coverage_id: str,
     session: Session = Depends(get_session),
-    current_user: User = Depends(require_organizer_or_admin())
+    current_user: Principal = Depends(REQUIRE_ORG_OR_ADMIN)
 ):
     """Delete a judge coverage block and re-sync affected competitions."""
     coverage = session.get(StageJudgeCoverage, UUID(coverage_id))
@@ -456,7 +456,7 @@ async def delete_stage_coverage(
 async def sync_feis_judge_coverage(
     feis_id: str,
     session: Session = Depends(get_session),
-    current_user: User = Depends(require_organizer_or_admin())
+    current_user: Principal = Depends(REQUIRE_ORG_OR_ADMIN)
 ):
     """
     Manually sync all competitions in a feis with current judge coverage.
@@ -3,7 +3,7 @@ from typing import List, Optional
 from uuid import UUID
 from sqlmodel import Session, select, func
 from backend.db.database import get_session
-from backend.api.auth import get_current_user, require_adjudicator
+from backend.api.auth import Principal, get_current_user, REQUIRE_ADJUDICATOR
 from backend.scoring_engine.models import JudgeScore, RoundResult, Round
 from backend.scoring_engine.models_platform import (
     User, Feis, Competition, Entry, Dancer, RoleType,
@@ -27,7 +27,7 @@ calculator = IrishPointsCalculator()
 async def submit_score(
     score: JudgeScore, 
     session: Session = Depends(get_session),
-    current_user: User = Depends(require_adjudicator())
+    current_user: Principal = Depends(REQUIRE_ADJUDICATOR)
 ):
     """Submit a score. Requires adjudicator role."""
     session.add(score)
@@ -44,7 +44,7 @@ async def submit_score(
 async def submit_score_batch(
     scores: List[JudgeScore],
     session: Session = Depends(get_session),
-    current_user: User = Depends(require_adjudicator())
+    current_user: Principal = Depends(REQUIRE_ADJUDICATOR)
 ):
     """Submit multiple scores (for sync). Requires adjudicator role."""
     for score in scores:
@@ -69,7 +69,7 @@ async def get_round_results(round_id: str, session: Session = Depends(get_sessio
 async def list_judge_competitions(
     feis_id: str,
     session: Session = Depends(get_session),
-    current_user: User = Depends(require_adjudicator())
+    current_user: Principal = Depends(REQUIRE_ADJUDICATOR)
 ):
     """
     List competitions assigned to the current judge for a feis.
@@ -197,7 +197,7 @@ async def list_judge_competitions(
 async def get_competitors_for_scoring(
     comp_id: str,
     session: Session = Depends(get_session),
-    current_user: User = Depends(require_adjudicator())
+    current_user: Principal = Depends(REQUIRE_ADJUDICATOR)
 ):
     """Get all competitors in a competition ready to be scored."""
     competition = session.get(Competition, UUID(comp_id))
@@ -247,7 +247,7 @@ async def get_competitors_for_scoring(
 async def submit_judge_score(
     score_data: ScoreSubmission,
     session: Session = Depends(get_session),
-    current_user: User = Depends(require_adjudicator())
+    current_user: Principal = Depends(REQUIRE_ADJUDICATOR)
 ):
     """Submit or update a score for a competitor."""
     # Validate entry exists
@@ -5,7 +5,7 @@ from datetime import datetime
 from sqlmodel import Session, select, func
 from backend.scoring_engine.models import JudgeScore
 from backend.db.database import get_session
-from backend.api.auth import get_current_user, require_adjudicator
+from backend.api.auth import Principal, get_current_user, REQUIRE_ADJUDICATOR
 from backend.scoring_engine.models_platform import User
 from backend.api.websocket import manager as ws_manager
 import asyncio
@@ -53,7 +53,7 @@ router = APIRouter()
 async def sync_scores_batch(
     sync_data: SyncScoresRequest,
     session: Session = Depends(get_session),
-    current_user: User = Depends(require_adjudicator())
+    current_user: Principal = Depends(REQUIRE_ADJUDICATOR)
 ):
     """
     Batch sync scores from local device to cloud.
@@ -143,7 +143,7 @@ async def sync_scores_batch(
 async def resolve_sync_conflict(
     resolution: ConflictResolutionRequest,
     session: Session = Depends(get_session),
-    current_user: User = Depends(require_adjudicator())
+    current_user: Principal = Depends(REQUIRE_ADJUDICATOR)
 ):
     """
     Resolve a sync conflict by choosing either local or server value.
@@ -6,7 +6,7 @@ from sqlmodel import Session, select, func
 import csv
 import io
 from backend.db.database import get_session
-from backend.api.auth import get_current_user, require_teacher
+from backend.api.auth import Principal, get_current_user, REQUIRE_TEACHER
 from backend.scoring_engine.models_platform import User, Dancer, Entry, Competition, Feis, RoleType, AdvancementNotice, EntryFlag
 from backend.api.schemas import TeacherDashboardResponse, SchoolRosterResponse, SchoolStudentInfo, TeacherStudentEntry, LinkDancerToSchoolRequest
 
@@ -15,7 +15,7 @@ router = APIRouter()
 @router.get("/teacher/dashboard", response_model=TeacherDashboardResponse)
 async def get_teacher_dashboard(
     session: Session = Depends(get_session),
-    current_user: User = Depends(require_teacher())
+    current_user: Principal = Depends(REQUIRE_TEACHER)
 ):
     """Get teacher dashboard data."""
     # Get all students
@@ -89,7 +89,7 @@ async def get_teacher_dashboard(
 @router.get("/teacher/roster", response_model=SchoolRosterResponse)
 async def get_school_roster(
     session: Session = Depends(get_session),
-    current_user: User = Depends(require_teacher())
+    current_user: Principal = Depends(REQUIRE_TEACHER)
 ):
     """Get all students in the teacher's school."""
     dancers = session.exec(
@@ -133,7 +133,7 @@ async def get_school_roster(
 async def get_teacher_student_entries(
     feis_id: Optional[str] = None,
     session: Session = Depends(get_session),
-    current_user: User = Depends(require_teacher())
+    current_user: Principal = Depends(REQUIRE_TEACHER)
 ):
     """Get all entries for students in the teacher's school."""
     dancers = session.exec(
@@ -246,7 +246,7 @@ async def export_teacher_entries(
     feis_id: Optional[str] = None,
     format: str = "csv",
     session: Session = Depends(get_session),
-    current_user: User = Depends(require_teacher())
+    current_user: Principal = Depends(REQUIRE_TEACHER)
 ):
     """Export teacher's student entries to CSV or JSON."""
     dancers = session.exec(
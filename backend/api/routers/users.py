@@ -10,8 +10,10 @@ from backend.api.schemas import (
 )
 from backend.api.auth import (
     get_current_user,
-    require_organizer_or_admin,
-    require_admin
+    REQUIRE_ORG_OR_ADMIN,
+    REQUIRE_ADMIN,
+    invalidate_cached_user,
+    Principal
 )
 
 router = APIRouter()
@@ -24,7 +26,7 @@ async def list_users(
     role: Optional[RoleType] = None,
     search: Optional[str] = None,
     limit: int = 50,
-    current_user: User = Depends(require_organizer_or_admin())
+    current_user: Principal = Depends(REQUIRE_ORG_OR_ADMIN)
 ):
     """
     List users with optional filters.
@@ -94,7 +96,7 @@ async def update_user(
     user_id: str, 
     user_data: UserUpdate, 
     session: Session = Depends(get_session),
-    current_user: User = Depends(require_admin())
+    current_user: Principal = Depends(REQUIRE_ADMIN)
 ):
     """Update a user's name or role. Requires super_admin role."""
     user = session.get(User, UUID(user_id))
@@ -108,6 +110,7 @@ async def update_user(
     
     session.add(user)
     session.commit()
+    invalidate_cached_user(user.id)
     session.refresh(user)
     
     return UserResponse(
@@ -124,7 +127,7 @@ async def update_user(
 @router.get("/dancers", response_model=List[DancerResponse])
 async def list_dancers(
     session: Session = Depends(get_session),
-    current_user: User = Depends(require_organizer_or_admin())
+    current_user: Principal = Depends(REQUIRE_ORG_OR_ADMIN)
 ):
     """List all dancers."""
     dancers = session.exec(select(Dancer)).all()
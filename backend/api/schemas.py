@@ -11,7 +11,7 @@ from backend.scoring_engine.models_platform import (
 # ============= Syllabus Generation =============
 
 class SyllabusGenerationRequest(BaseModel):
-    feis_id: str
+    feis_id: UUID
     levels: List[CompetitionLevel]
     min_age: Optional[int] = None
     max_age: Optional[int] = None
@@ -1252,6 +1252,17 @@ class DemoDataStatus(BaseModel):
     message: str
 
 
+class DemoDataJobResponse(BaseModel):
+    """A populate/delete demo data run executing in the background."""
+    id: str
+    operation: str  # "populate" or "delete"
+    status: str  # "pending", "running", "succeeded", "failed"
+    message: Optional[str] = None
+    result: Optional[DemoDataSummary] = None
+    created_at: DateTime
+    finished_at: Optional[DateTime] = None
+
+
 # ============= Phase 6: Adjudicator Roster Management =============
 
 class AdjudicatorCreate(BaseModel):
@@ -1451,8 +1462,8 @@ class AvailabilityBlockUpdate(BaseModel):
 
 class AvailabilityBlockResponse(BaseModel):
     """Response with availability block details."""
-    id: str
-    feis_adjudicator_id: str
+    id: UUID
+    feis_adjudicator_id: UUID
     feis_day: Date
     start_time: Time
     end_time: Time
@@ -1,7 +1,7 @@
 import os
 from sqlmodel import SQLModel, create_engine, Session
-from sqlalchemy.pool import StaticPool
-from sqlalchemy import text
+from sqlalchemy import event, text
+from sqlalchemy.orm import sessionmaker
 
 # Using SQLite with WAL mode (as per requirements)
 # For local dev, we use a file-based DB. 
@@ -10,13 +10,45 @@ from sqlalchemy import text
 sqlite_file_name = os.environ.get("DB_PATH", "openfeis.db")
 sqlite_url = f"sqlite:///{sqlite_file_name}"
 
+# Sync route handlers run on FastAPI's threadpool, so each session needs its own
+# connection: a single shared (StaticPool) connection would interleave their
+# transactions. SQLAlchemy's default QueuePool hands out one per checkout.
+#
+# The pool is sized for the threadpool (40 workers by default) rather than
+# SQLAlchemy's 5+10 default, so a long admin request such as the demo data
+# populate can't starve every other handler waiting on a checkout. Pre-ping and
+# recycle are left off: a local SQLite file has no server to drop idle links.
 engine = create_engine(
     sqlite_url, 
-    connect_args={"check_same_thread": False}, 
-    poolclass=StaticPool # Simple pooling for SQLite
+    connect_args={"check_same_thread": False},
+    pool_size=20,
+    max_overflow=10,
+    pool_timeout=30,
 )
 
 
+@event.listens_for(engine, "connect")
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    """Enable WAL and a busy timeout on every pooled connection.
+
+    WAL lets readers proceed while a writer holds the lock, and busy_timeout
+    makes a second writer wait for it instead of failing with "database is
+    locked" now that several connections are open at once.
+    """
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA busy_timeout=30000")
+    cursor.close()
+
+
+# One configured session factory shared by request handlers and background work.
+# Sessions stay per request (see get_session) rather than thread-local: FastAPI
+# may run a dependency's setup, the handler and the teardown on different
+# threadpool threads, and async handlers all share the event loop thread, so a
+# scoped_session registry would hand unrelated requests the same session.
+SessionLocal = sessionmaker(bind=engine, class_=Session)
+
+
 def run_migrations():
     """
     Simple migration helper for SQLite.
@@ -99,6 +131,19 @@ def run_migrations():
         
         # Competition table - panel support (Judge Assignment fix)
         ("competition", "panel_id", "ALTER TABLE competition ADD COLUMN panel_id VARCHAR"),
+        
+        # FeisAdjudicator table - indexed PIN lookup (PIN login)
+        ("feisadjudicator", "access_pin_lookup", "ALTER TABLE feisadjudicator ADD COLUMN access_pin_lookup VARCHAR"),
+    ]
+    
+    # Indexes for migrated columns (create_all only builds indexes for new tables).
+    # Names match SQLModel's ix_<table>_<column> so fresh databases aren't duplicated.
+    indexes = [
+        "CREATE INDEX IF NOT EXISTS ix_feisadjudicator_access_pin_lookup ON feisadjudicator (access_pin_lookup)",
+        "CREATE INDEX IF NOT EXISTS ix_competition_feis_id_code ON competition (feis_id, code)",
+        "CREATE INDEX IF NOT EXISTS ix_user_email_lower ON user (lower(email))",
+        # Tiny partial index that has_demo_data can probe instead of scanning users
+        "CREATE INDEX IF NOT EXISTS ix_user_demo_email ON user (email) WHERE email LIKE '%@openfeis.demo'",
     ]
     
     with engine.connect() as conn:
@@ -116,6 +161,38 @@ def run_migrations():
                 except Exception as e:
                     print(f"Migration warning: {e}")
         
+        for sql in indexes:
+            try:
+                conn.execute(text(sql))
+                conn.commit()
+            except Exception as e:
+                print(f"Migration warning (index): {e}")
+        
+        # Partial unique index replaces the plain invite_token index. It can't be
+        # built while two adjudicators share a live token, and then the old index
+        # stays so invite lookups don't fall back to scanning the table.
+        try:
+            conn.execute(text(
+                "CREATE UNIQUE INDEX IF NOT EXISTS ux_feisadjudicator_invite_token "
+                "ON feisadjudicator (invite_token) WHERE invite_token IS NOT NULL"
+            ))
+            conn.execute(text("DROP INDEX IF EXISTS ix_feisadjudicator_invite_token"))
+            conn.commit()
+        except Exception as e:
+            conn.rollback()
+            duplicates = conn.execute(text("""
+                SELECT id FROM feisadjudicator WHERE invite_token IN (
+                    SELECT invite_token FROM feisadjudicator
+                    WHERE invite_token IS NOT NULL
+                    GROUP BY invite_token HAVING COUNT(*) > 1
+                )
+            """)).scalars().all()
+            print(f"Migration warning (index): {e}")
+            print(
+                "Migration: Keeping ix_feisadjudicator_invite_token; adjudicators sharing "
+                f"an invite token (re-send their invites to fix): {', '.join(map(str, duplicates))}"
+            )
+        
         # Data migration: Fix enum values (lowercase to uppercase)
         # This fixes the SQLAlchemy enum lookup issue
         try:
@@ -203,5 +280,5 @@ def create_db_and_tables():
 
 
 def get_session():
-    with Session(engine) as session:
+    with SessionLocal() as session:
         yield session
@@ -1,19 +1,20 @@
 # Database schema version: 4.3 (data migration to fix enum values)
+import hashlib
 import os
 import secrets
 from pathlib import Path
 from fastapi import FastAPI, Request, WebSocket, WebSocketDisconnect, Query
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, Response
 from contextlib import asynccontextmanager
 from backend.api.routes import router as api_router
 from backend.api.websocket import manager as ws_manager
-from backend.db.database import create_db_and_tables, engine
+from backend.db.database import SessionLocal, create_db_and_tables
 from backend.scoring_engine.models_platform import User, Feis, Competition, Dancer, Entry, RoleType, CompetitionLevel
 from backend.scoring_engine.models import Round
-from sqlmodel import Session, select
-from backend.api.auth import hash_password
+from sqlmodel import select
+from backend.api.auth import TokenClaimsMiddleware, hash_password
 from datetime import date
 import uuid
 import logging
@@ -25,7 +26,7 @@ LOCAL_MODE = os.getenv("OPENFEIS_LOCAL_MODE", "false").lower() == "true"
 
 # Initial Data Seeding for MVP
 def seed_data():
-    with Session(engine) as session:
+    with SessionLocal() as session:
         seed_admin_email = os.getenv("OPENFEIS_SEED_ADMIN_EMAIL", "admin@openfeis.org")
         seed_admin_password = os.getenv("OPENFEIS_SEED_ADMIN_PASSWORD")
 
@@ -132,6 +133,9 @@ else:
         allow_headers=["*"],
     )
 
+# Verify bearer tokens once per request, ahead of dependency resolution
+app.add_middleware(TokenClaimsMiddleware)
+
 app.include_router(api_router, prefix="/api/v1")
 
 @app.get("/health")
@@ -219,6 +223,14 @@ if FRONTEND_DIR.exists():
     # Serve static assets (js, css, images)
     app.mount("/assets", StaticFiles(directory=FRONTEND_DIR / "assets"), name="assets")
     
+    # index.html is the shell for every client-side route and only changes
+    # with a new build, so read it once instead of on every navigation.
+    INDEX_HTML = (FRONTEND_DIR / "index.html").read_bytes()
+    INDEX_ETAG = '"' + hashlib.blake2b(INDEX_HTML, digest_size=8).hexdigest() + '"'
+    # no-cache (not max-age): browsers must revalidate so a new deploy's
+    # asset hashes are picked up, but an unchanged shell costs only a 304.
+    INDEX_HEADERS = {"ETag": INDEX_ETAG, "Cache-Control": "no-cache"}
+    
     # Catch-all route for SPA - must be last!
     @app.get("/{full_path:path}")
     async def serve_spa(request: Request, full_path: str):
@@ -233,4 +245,6 @@ if FRONTEND_DIR.exists():
             return FileResponse(file_path)
         
         # Otherwise, serve index.html for SPA routing
-        return FileResponse(FRONTEND_DIR / "index.html")
+        if request.headers.get("if-none-match") == INDEX_ETAG:
+            return Response(status_code=304, headers=INDEX_HEADERS)
+        return Response(content=INDEX_HTML, media_type="text/html", headers=INDEX_HEADERS)
@@ -1,6 +1,7 @@
 from typing import List, Optional, TYPE_CHECKING
 from uuid import UUID, uuid4
 from datetime import date, datetime, time
+from sqlalchemy import Index, text
 from sqlmodel import SQLModel, Field, Relationship
 from enum import Enum
 
@@ -115,6 +116,17 @@ class AvailabilityType(str, Enum):
 # --- Database Models ---
 
 class User(SQLModel, table=True):
+    __table_args__ = (
+        # Logins match addresses case-insensitively
+        Index("ix_user_email_lower", text("lower(email)")),
+        # Tiny partial index that has_demo_data can probe instead of scanning users
+        Index(
+            "ix_user_demo_email", "email",
+            sqlite_where=text("email LIKE '%@openfeis.demo'"),
+            postgresql_where=text("email LIKE '%@openfeis.demo'"),
+        ),
+    )
+    
     id: Optional[UUID] = Field(default_factory=uuid4, primary_key=True)
     email: str = Field(index=True, unique=True)
     password_hash: str 
@@ -254,6 +266,12 @@ class Dancer(SQLModel, table=True):
     entries: List["Entry"] = Relationship(back_populates="dancer")
 
 class Competition(SQLModel, table=True):
+    __table_args__ = (
+        # Competitions are almost always looked up per feis; code makes it covering
+        # for the existing-code check in syllabus generation
+        Index("ix_competition_feis_id_code", "feis_id", "code"),
+    )
+    
     id: Optional[UUID] = Field(default_factory=uuid4, primary_key=True)
     feis_id: UUID = Field(foreign_key="feis.id")
     name: str
@@ -670,6 +688,14 @@ class FeisAdjudicator(SQLModel, table=True):
     - Detect school affiliation conflicts
     """
     __tablename__ = "feisadjudicator"
+    __table_args__ = (
+        # Live invite tokens are unique; the partial index skips the many rows without one
+        Index(
+            "ux_feisadjudicator_invite_token", "invite_token", unique=True,
+            sqlite_where=text("invite_token IS NOT NULL"),
+            postgresql_where=text("invite_token IS NOT NULL"),
+        ),
+    )
     
     id: Optional[UUID] = Field(default_factory=uuid4, primary_key=True)
     feis_id: UUID = Field(foreign_key="feis.id", index=True)
@@ -689,12 +715,13 @@ class FeisAdjudicator(SQLModel, table=True):
     status: AdjudicatorStatus = Field(default=AdjudicatorStatus.INVITED)
     
     # Access - Magic link invite
-    invite_token: Optional[str] = Field(default=None, index=True)  # Magic link token
+    invite_token: Optional[str] = None  # Magic link token (see ux_feisadjudicator_invite_token)
     invite_sent_at: Optional[datetime] = None
     invite_expires_at: Optional[datetime] = None
     
     # Access - Day-of PIN
     access_pin_hash: Optional[str] = None  # 6-digit day-of PIN (hashed)
+    access_pin_lookup: Optional[str] = Field(default=None, index=True)  # Keyed digest of feis+PIN for indexed login
     pin_generated_at: Optional[datetime] = None
     
     # Timestamps
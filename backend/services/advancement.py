@@ -411,33 +411,43 @@ def get_dancer_placement_summary(
     
     Returns dict with total placements, 1st place count, etc.
     """
-    placements = session.exec(
-        select(PlacementHistory)
+    # Counted by the database, grouped by level, rather than loading every row
+    level_counts = session.exec(
+        select(
+            PlacementHistory.level,
+            func.count(),
+            func.count().filter(PlacementHistory.rank == 1),
+            func.count().filter(PlacementHistory.rank <= 3)
+        )
         .where(PlacementHistory.dancer_id == dancer_id)
-        .order_by(PlacementHistory.competition_date.desc())
+        .group_by(PlacementHistory.level)
     ).all()
     
-    first_places = [p for p in placements if p.rank == 1]
-    podiums = [p for p in placements if p.rank <= 3]
-    
-    # Group by level
     by_level: Dict[str, int] = {}
-    for p in placements:
-        level_key = p.level.value
-        by_level[level_key] = by_level.get(level_key, 0) + 1
-    
-    # Group by dance type
-    by_dance: Dict[str, int] = {}
-    for p in first_places:
-        if p.dance_type:
-            dance_key = p.dance_type.value
-            by_dance[dance_key] = by_dance.get(dance_key, 0) + 1
+    total_placements = first_place_count = podium_count = 0
+    for level, total, firsts, podiums in level_counts:
+        by_level[level.value] = total
+        total_placements += total
+        first_place_count += firsts
+        podium_count += podiums
+    
+    # 1st places by dance type
+    by_dance: Dict[str, int] = {
+        dance_type.value: count
+        for dance_type, count in session.exec(
+            select(PlacementHistory.dance_type, func.count())
+            .where(PlacementHistory.dancer_id == dancer_id)
+            .where(PlacementHistory.rank == 1)
+            .where(PlacementHistory.dance_type.is_not(None))
+            .group_by(PlacementHistory.dance_type)
+        ).all()
+    }
     
     return {
         "dancer_id": str(dancer_id),
-        "total_placements": len(placements),
-        "first_place_count": len(first_places),
-        "podium_count": len(podiums),
+        "total_placements": total_placements,
+        "first_place_count": first_place_count,
+        "podium_count": podium_count,
         "by_level": by_level,
         "first_places_by_dance": by_dance
     }
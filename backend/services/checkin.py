@@ -27,6 +27,7 @@ class CheckInResult:
     competition_name: str
     status: CheckInStatus
     message: str
+    checked_in_at: Optional[datetime] = None
 
 
 @dataclass
@@ -44,52 +45,51 @@ class StageMonitorData:
     entries: List[dict]
 
 
-def check_in_entry(
-    session: Session,
-    entry_id: UUID,
+def _entry_not_found(entry_id: UUID) -> CheckInResult:
+    return CheckInResult(
+        success=False,
+        entry_id=str(entry_id),
+        dancer_name="Unknown",
+        competitor_number=None,
+        competition_name="Unknown",
+        status=CheckInStatus.NOT_CHECKED_IN,
+        message="Entry not found"
+    )
+
+
+def _apply_check_in(
+    entry: Entry,
+    dancer: Optional[Dancer],
+    competition: Optional[Competition],
     checked_in_by: UUID
 ) -> CheckInResult:
     """
-    Check in a dancer for their competition.
+    Check in an already-loaded entry. Marks it checked in without committing.
     """
-    entry = session.get(Entry, entry_id)
-    
-    if not entry:
-        return CheckInResult(
-            success=False,
-            entry_id=str(entry_id),
-            dancer_name="Unknown",
-            competitor_number=None,
-            competition_name="Unknown",
-            status=CheckInStatus.NOT_CHECKED_IN,
-            message="Entry not found"
-        )
-    
-    dancer = session.get(Dancer, entry.dancer_id)
-    competition = session.get(Competition, entry.competition_id)
-    
     # Check if already scratched
     if entry.cancelled:
         return CheckInResult(
             success=False,
-            entry_id=str(entry_id),
+            entry_id=str(entry.id),
             dancer_name=dancer.name if dancer else "Unknown",
             competitor_number=entry.competitor_number,
             competition_name=competition.name if competition else "Unknown",
             status=CheckInStatus.SCRATCHED,
-            message="Entry has been scratched/cancelled"
+            message="Entry has been scratched/cancelled",
+            checked_in_at=entry.checked_in_at
         )
     
     # Check if already checked in
     if entry.check_in_status == CheckInStatus.CHECKED_IN:
         return CheckInResult(
             success=True,
-            entry_id=str(entry_id),
+            entry_id=str(entry.id),
             dancer_name=dancer.name if dancer else "Unknown",
             competitor_number=entry.competitor_number,
             competition_name=competition.name if competition else "Unknown",
             status=CheckInStatus.CHECKED_IN,
-            message="Already checked in"
+            message="Already checked in",
+            checked_in_at=entry.checked_in_at
         )
     
     # Perform check-in
@@ -97,21 +97,65 @@ def check_in_entry(
     entry.checked_in_at = datetime.utcnow()
     entry.checked_in_by = checked_in_by
     
-    session.add(entry)
-    session.commit()
-    session.refresh(entry)
-    
     return CheckInResult(
         success=True,
-        entry_id=str(entry_id),
+        entry_id=str(entry.id),
         dancer_name=dancer.name if dancer else "Unknown",
         competitor_number=entry.competitor_number,
         competition_name=competition.name if competition else "Unknown",
         status=CheckInStatus.CHECKED_IN,
-        message="Successfully checked in"
+        message="Successfully checked in",
+        checked_in_at=entry.checked_in_at
     )
 
 
+def _load_entry_details(
+    session: Session,
+    *criteria
+) -> Optional[Tuple[Entry, Optional[Dancer], Optional[Competition]]]:
+    """
+    Load the first entry matching `criteria` together with its dancer and
+    competition in a single query.
+    """
+    return session.exec(
+        select(Entry, Dancer, Competition)
+        .outerjoin(Dancer, Dancer.id == Entry.dancer_id)
+        .outerjoin(Competition, Competition.id == Entry.competition_id)
+        .where(*criteria)
+    ).first()
+
+
+def _check_in_matching(
+    session: Session,
+    checked_in_by: UUID,
+    *criteria
+) -> Optional[CheckInResult]:
+    """Check in the entry matching `criteria`; None if there is no such entry."""
+    row = _load_entry_details(session, *criteria)
+    if row is None:
+        return None
+    
+    entry, dancer, competition = row
+    result = _apply_check_in(entry, dancer, competition, checked_in_by)
+    if session.is_modified(entry):
+        session.add(entry)
+        session.commit()
+    
+    return result
+
+
+def check_in_entry(
+    session: Session,
+    entry_id: UUID,
+    checked_in_by: UUID
+) -> CheckInResult:
+    """
+    Check in a dancer for their competition.
+    """
+    result = _check_in_matching(session, checked_in_by, Entry.id == entry_id)
+    return result or _entry_not_found(entry_id)
+
+
 def check_in_by_number(
     session: Session,
     competition_id: UUID,
@@ -121,25 +165,42 @@ def check_in_by_number(
     """
     Check in a dancer by their competitor number.
     """
-    entry = session.exec(
-        select(Entry).where(
-            Entry.competition_id == competition_id,
-            Entry.competitor_number == competitor_number
-        )
-    ).first()
-    
-    if not entry:
-        return CheckInResult(
-            success=False,
-            entry_id="",
-            dancer_name="Unknown",
-            competitor_number=competitor_number,
-            competition_name="Unknown",
-            status=CheckInStatus.NOT_CHECKED_IN,
-            message=f"No entry found with number {competitor_number}"
-        )
+    result = _check_in_matching(
+        session,
+        checked_in_by,
+        Entry.competition_id == competition_id,
+        Entry.competitor_number == competitor_number
+    )
+    if result:
+        return result
     
-    return check_in_entry(session, entry.id, checked_in_by)
+    return CheckInResult(
+        success=False,
+        entry_id="",
+        dancer_name="Unknown",
+        competitor_number=competitor_number,
+        competition_name="Unknown",
+        status=CheckInStatus.NOT_CHECKED_IN,
+        message=f"No entry found with number {competitor_number}"
+    )
+
+
+def check_in_by_feis_number(
+    session: Session,
+    feis_id: UUID,
+    competitor_number: int,
+    checked_in_by: UUID
+) -> Optional[CheckInResult]:
+    """
+    Check in a dancer by their competitor number anywhere in a feis.
+    Returns None if no entry in the feis has that number.
+    """
+    return _check_in_matching(
+        session,
+        checked_in_by,
+        Competition.feis_id == feis_id,
+        Entry.competitor_number == competitor_number
+    )
 
 
 def bulk_check_in(
@@ -149,11 +210,42 @@ def bulk_check_in(
 ) -> List[CheckInResult]:
     """
     Check in multiple dancers at once.
+    
+    Entries, dancers and competitions are each loaded with a single IN query
+    and every check-in is committed together, so the number of round trips
+    doesn't grow with the size of the batch. Results follow the order of
+    entry_ids.
     """
+    entries = {
+        entry.id: entry
+        for entry in session.exec(select(Entry).where(Entry.id.in_(set(entry_ids)))).all()
+    }
+    dancer_ids = {entry.dancer_id for entry in entries.values()}
+    competition_ids = {entry.competition_id for entry in entries.values()}
+    dancers = {
+        dancer.id: dancer
+        for dancer in session.exec(select(Dancer).where(Dancer.id.in_(dancer_ids))).all()
+    } if dancer_ids else {}
+    competitions = {
+        competition.id: competition
+        for competition in session.exec(select(Competition).where(Competition.id.in_(competition_ids))).all()
+    } if competition_ids else {}
+    
     results = []
     for entry_id in entry_ids:
-        result = check_in_entry(session, entry_id, checked_in_by)
-        results.append(result)
+        entry = entries.get(entry_id)
+        if not entry:
+            results.append(_entry_not_found(entry_id))
+            continue
+        results.append(_apply_check_in(
+            entry,
+            dancers.get(entry.dancer_id),
+            competitions.get(entry.competition_id),
+            checked_in_by
+        ))
+    
+    if session.dirty:
+        session.commit()
     return results
 
 
@@ -164,31 +256,17 @@ def undo_check_in(
     """
     Undo a check-in (mark as not checked in).
     """
-    entry = session.get(Entry, entry_id)
-    
-    if not entry:
-        return CheckInResult(
-            success=False,
-            entry_id=str(entry_id),
-            dancer_name="Unknown",
-            competitor_number=None,
-            competition_name="Unknown",
-            status=CheckInStatus.NOT_CHECKED_IN,
-            message="Entry not found"
-        )
+    row = _load_entry_details(session, Entry.id == entry_id)
     
-    dancer = session.get(Dancer, entry.dancer_id)
-    competition = session.get(Competition, entry.competition_id)
+    if not row:
+        return _entry_not_found(entry_id)
     
+    entry, dancer, competition = row
     entry.check_in_status = CheckInStatus.NOT_CHECKED_IN
     entry.checked_in_at = None
     entry.checked_in_by = None
     
-    session.add(entry)
-    session.commit()
-    session.refresh(entry)
-    
-    return CheckInResult(
+    result = CheckInResult(
         success=True,
         entry_id=str(entry_id),
         dancer_name=dancer.name if dancer else "Unknown",
@@ -197,6 +275,10 @@ def undo_check_in(
         status=CheckInStatus.NOT_CHECKED_IN,
         message="Check-in undone"
     )
+    session.add(entry)
+    session.commit()
+    
+    return result
 
 
 def mark_scratched(
@@ -9,11 +9,13 @@ All demo data uses identifiable patterns for easy cleanup:
 Super Admin only feature.
 """
 
+import logging
 import random
 from datetime import date, datetime, timedelta
-from typing import List, Tuple, Optional
+from typing import Dict, List, Tuple, Optional
 from uuid import uuid4, UUID
-from sqlmodel import Session, select, delete
+from sqlalchemy import literal
+from sqlmodel import Session, select, delete, func, insert, update
 
 from backend.scoring_engine.models_platform import (
     User, Feis, Competition, Entry, Dancer, Stage, FeisSettings,
@@ -22,16 +24,22 @@ from backend.scoring_engine.models_platform import (
     PlacementHistory, StageJudgeCoverage, FeisAdjudicator
 )
 from backend.scoring_engine.models import JudgeScore
-from backend.api.auth import hash_password
+from backend.api.auth import clear_user_cache, hash_password
 from backend.utils.competition_codes import generate_competition_code
 from backend.services.scheduling import estimate_competition_duration, get_default_tempo
 
+logger = logging.getLogger(__name__)
+
 # ============= Constants =============
 
 DEMO_EMAIL_DOMAIN = "openfeis.demo"
 DEMO_ORGANIZER_EMAIL = f"demo_organizer@{DEMO_EMAIL_DOMAIN}"
 DEMO_PASSWORD = "demo123"  # All demo accounts use this password
 
+# Parents, dancers, entries and scores are written with one executemany per
+# chunk of this many rows instead of an ORM add/flush per object.
+BULK_INSERT_BATCH_SIZE = 5000
+
 # Irish-flavored names for realism
 GIRL_FIRST_NAMES = [
     "Siobhan", "Aoife", "Niamh", "Caoimhe", "Saoirse", "Ciara", "Aisling", 
@@ -190,10 +198,23 @@ class DemoDataGenerator:
         self.session = session
         self.demo_organizer: Optional[User] = None
         self.demo_teachers: List[User] = []
-        self.demo_parents: List[User] = []
-        self.demo_dancers: List[Dancer] = []
+        self.demo_parents: List[UUID] = []
+        self.demo_dancers: List[UUID] = []
         self.demo_feiseanna: List[Feis] = []
         self.demo_adjudicators: List[User] = []
+        # Every demo account shares DEMO_PASSWORD, so bcrypt runs once
+        self.password_hash = hash_password(DEMO_PASSWORD)
+        # Parent ids by email, so reused parent slots don't need a lookup each
+        self.parent_ids: Dict[str, UUID] = dict(session.exec(
+            select(User.email, User.id).where(User.email.like(f"demo_parent_%@{DEMO_EMAIL_DOMAIN}"))
+        ).all())
+    
+    def _bulk_insert(self, model, rows: List[dict]):
+        """Insert prepared rows for a table in chunks of BULK_INSERT_BATCH_SIZE."""
+        for start in range(0, len(rows), BULK_INSERT_BATCH_SIZE):
+            batch = rows[start:start + BULK_INSERT_BATCH_SIZE]
+            self.session.exec(insert(model), params=batch)
+            logger.debug("Inserted %d demo %s rows", len(batch), model.__tablename__)
     
     def generate_all(self) -> dict:
         """
@@ -277,7 +298,7 @@ class DemoDataGenerator:
         self.demo_organizer = User(
             id=uuid4(),
             email=DEMO_ORGANIZER_EMAIL,
-            password_hash=hash_password(DEMO_PASSWORD),
+            password_hash=self.password_hash,
             role=RoleType.ORGANIZER,
             name="Demo Feis Organizer",
             email_verified=True
@@ -302,7 +323,7 @@ class DemoDataGenerator:
             teacher = User(
                 id=uuid4(),
                 email=email,
-                password_hash=hash_password(DEMO_PASSWORD),
+                password_hash=self.password_hash,
                 role=RoleType.TEACHER,
                 name=school_name,  # Teacher name is the school name
                 email_verified=True
@@ -347,7 +368,7 @@ class DemoDataGenerator:
             adj = User(
                 id=uuid4(),
                 email=email,
-                password_hash=hash_password(DEMO_PASSWORD),
+                password_hash=self.password_hash,
                 role=RoleType.ADJUDICATOR,
                 name=adj_name,
                 email_verified=True
@@ -357,29 +378,30 @@ class DemoDataGenerator:
         
         self.session.flush()
     
-    def _create_demo_parent(self, index: int) -> User:
-        """Create a demo parent account."""
-        email = f"demo_parent_{index}@{DEMO_EMAIL_DOMAIN}"
+    def _create_demo_parent(self, index: int, parent_rows: List[dict]) -> UUID:
+        """
+        Get or prepare a demo parent account.
         
-        existing = self.session.exec(
-            select(User).where(User.email == email)
-        ).first()
+        New parents are appended to parent_rows for the caller to insert.
+        """
+        email = f"demo_parent_{index}@{DEMO_EMAIL_DOMAIN}"
         
+        existing = self.parent_ids.get(email)
         if existing:
             return existing
         
         first, last = generate_dancer_name(random.choice([Gender.FEMALE, Gender.MALE]))
-        parent = User(
-            id=uuid4(),
-            email=email,
-            password_hash=hash_password(DEMO_PASSWORD),
-            role=RoleType.PARENT,
-            name=f"{first} {last}",
-            email_verified=True
-        )
-        self.session.add(parent)
-        self.session.flush()
-        return parent
+        parent_id = uuid4()
+        parent_rows.append({
+            "id": parent_id,
+            "email": email,
+            "password_hash": self.password_hash,
+            "role": RoleType.PARENT,
+            "name": f"{first} {last}",
+            "email_verified": True,
+        })
+        self.parent_ids[email] = parent_id
+        return parent_id
     
     def _create_feis_with_registrations(
         self,
@@ -433,6 +455,9 @@ class DemoDataGenerator:
         parent_count = 0
         dancer_count = 0
         entry_count = 0
+        parent_rows: List[dict] = []
+        dancer_rows: List[dict] = []
+        entry_rows: List[dict] = []
         
         # Determine family structure (some parents have multiple dancers)
         num_families = int(target_dancers * 0.7)  # ~70% single-dancer families
@@ -440,12 +465,12 @@ class DemoDataGenerator:
         
         # Create single-dancer families
         for i in range(num_families):
-            parent = self._create_demo_parent(len(self.demo_parents) + i + 1)
-            self.demo_parents.append(parent)
+            parent_id = self._create_demo_parent(len(self.demo_parents) + i + 1, parent_rows)
+            self.demo_parents.append(parent_id)
             parent_count += 1
             
             dancer, entries = self._create_dancer_with_entries(
-                parent, feis, competitions, dancer_index=dancer_count
+                parent_id, feis, competitions, dancer_rows, entry_rows
             )
             dancer_count += 1
             entry_count += len(entries)
@@ -453,15 +478,15 @@ class DemoDataGenerator:
         # Create multi-dancer families (2-3 dancers each)
         family_idx = num_families
         while dancer_count < target_dancers:
-            parent = self._create_demo_parent(len(self.demo_parents) + family_idx + 1)
-            self.demo_parents.append(parent)
+            parent_id = self._create_demo_parent(len(self.demo_parents) + family_idx + 1, parent_rows)
+            self.demo_parents.append(parent_id)
             parent_count += 1
             family_idx += 1
             
             num_siblings = min(random.randint(2, 3), target_dancers - dancer_count)
             for _ in range(num_siblings):
                 dancer, entries = self._create_dancer_with_entries(
-                    parent, feis, competitions, dancer_index=dancer_count
+                    parent_id, feis, competitions, dancer_rows, entry_rows
                 )
                 dancer_count += 1
                 entry_count += len(entries)
@@ -471,7 +496,16 @@ class DemoDataGenerator:
         stats["entries"] = entry_count
         
         # Assign competitor numbers
-        self._assign_competitor_numbers(feis.id)
+        self._assign_competitor_numbers(dancer_rows, entry_rows)
+        
+        # Write the registrations in foreign key order
+        self._bulk_insert(User, parent_rows)
+        self._bulk_insert(Dancer, dancer_rows)
+        self._bulk_insert(Entry, entry_rows)
+        logger.info(
+            "Generated demo feis %s: %d competitions, %d dancers, %d entries",
+            feis.name, stats["competitions"], dancer_count, entry_count
+        )
         
         # Create schedule - SKIPPED for realism as per request
         # self._create_schedule(feis, stages, competitions)
@@ -494,17 +528,17 @@ class DemoDataGenerator:
         )
         
         # Mark all entries as checked in and paid
-        entries = self.session.exec(
-            select(Entry)
-            .join(Competition)
-            .where(Competition.feis_id == feis.id)
-        ).all()
-        
-        for entry in entries:
-            entry.paid = True
-            entry.check_in_status = CheckInStatus.CHECKED_IN
-            entry.checked_in_at = datetime.combine(feis.date, datetime.min.time()) + timedelta(hours=8)
-            self.session.add(entry)
+        self.session.exec(
+            update(Entry)
+            .where(Entry.competition_id.in_(
+                select(Competition.id).where(Competition.feis_id == feis.id)
+            ))
+            .values(
+                paid=True,
+                check_in_status=CheckInStatus.CHECKED_IN,
+                checked_in_at=datetime.combine(feis.date, datetime.min.time()) + timedelta(hours=8)
+            )
+        )
         
         # Generate scores for all competitions
         score_count = self._generate_scores_for_feis(feis)
@@ -694,12 +728,17 @@ class DemoDataGenerator:
     
     def _create_dancer_with_entries(
         self,
-        parent: User,
+        parent_id: UUID,
         feis: Feis,
         competitions: List[Competition],
-        dancer_index: int
-    ) -> Tuple[Dancer, List[Entry]]:
-        """Create a dancer and register them for competitions."""
+        dancer_rows: List[dict],
+        entry_rows: List[dict]
+    ) -> Tuple[dict, List[dict]]:
+        """
+        Prepare a dancer and their competition registrations.
+        
+        Rows are appended to dancer_rows/entry_rows for the caller to insert.
+        """
         # Random attributes
         gender = random.choice([Gender.FEMALE, Gender.MALE])
         # Weight towards females (Irish dance has more girls)
@@ -721,18 +760,17 @@ class DemoDataGenerator:
         # Assign to a school
         school = random.choice(self.demo_teachers) if self.demo_teachers else None
         
-        dancer = Dancer(
-            id=uuid4(),
-            parent_id=parent.id,
-            school_id=school.id if school else None,
-            name=f"{first} {last}",
-            dob=dob,
-            current_level=level,
-            gender=gender
-        )
-        self.session.add(dancer)
-        self.session.flush()
-        self.demo_dancers.append(dancer)
+        dancer = {
+            "id": uuid4(),
+            "parent_id": parent_id,
+            "school_id": school.id if school else None,
+            "name": f"{first} {last}",
+            "dob": dob,
+            "current_level": level,
+            "gender": gender,
+        }
+        dancer_rows.append(dancer)
+        self.demo_dancers.append(dancer["id"])
         
         # Find eligible competitions
         eligible = [
@@ -753,41 +791,34 @@ class DemoDataGenerator:
         
         entries = []
         for comp in selected_comps:
-            entry = Entry(
-                id=uuid4(),
-                dancer_id=dancer.id,
-                competition_id=comp.id,
-                paid=random.random() < 0.8,  # 80% paid
-                pay_later=random.random() < 0.2,  # 20% pay at door
-            )
-            self.session.add(entry)
+            entry = {
+                "id": uuid4(),
+                "dancer_id": dancer["id"],
+                "competition_id": comp.id,
+                "paid": random.random() < 0.8,  # 80% paid
+                "pay_later": random.random() < 0.2,  # 20% pay at door
+                "competitor_number": None,
+            }
             entries.append(entry)
+        entry_rows.extend(entries)
         
-        self.session.flush()
         return dancer, entries
     
-    def _assign_competitor_numbers(self, feis_id: UUID):
-        """Assign competitor numbers to all entries in a feis."""
-        entries = self.session.exec(
-            select(Entry)
-            .join(Competition)
-            .where(Competition.feis_id == feis_id)
-            .join(Dancer)
-            .order_by(Dancer.name)
-        ).all()
+    def _assign_competitor_numbers(self, dancer_rows: List[dict], entry_rows: List[dict]):
+        """Assign competitor numbers to all entries in a feis, in dancer name order."""
+        entered = {entry["dancer_id"] for entry in entry_rows}
         
         # Group by dancer to give same number
         dancer_numbers = {}
         current_number = 101
         
-        for entry in entries:
-            if entry.dancer_id not in dancer_numbers:
-                dancer_numbers[entry.dancer_id] = current_number
+        for dancer in sorted(dancer_rows, key=lambda d: d["name"]):
+            if dancer["id"] in entered:
+                dancer_numbers[dancer["id"]] = current_number
                 current_number += 1
-            entry.competitor_number = dancer_numbers[entry.dancer_id]
-            self.session.add(entry)
         
-        self.session.flush()
+        for entry in entry_rows:
+            entry["competitor_number"] = dancer_numbers[entry["dancer_id"]]
     
     def _create_schedule(self, feis: Feis, stages: List[Stage], competitions: List[Competition]):
         """Create a schedule for competitions across stages."""
@@ -823,10 +854,10 @@ class DemoDataGenerator:
             for comp in stage_comps:
                 # Count entries
                 entry_count = self.session.exec(
-                    select(Entry).where(Entry.competition_id == comp.id)
-                ).all()
+                    select(func.count(Entry.id)).where(Entry.competition_id == comp.id)
+                ).one()
                 
-                duration = estimate_competition_duration(comp, len(entry_count))
+                duration = estimate_competition_duration(comp, entry_count)
                 
                 comp.scheduled_time = current_time
                 comp.estimated_duration_minutes = duration
@@ -840,14 +871,23 @@ class DemoDataGenerator:
         """Generate realistic scores for all competitions in a feis."""
         score_count = 0
         
+        score_rows = []
+        
         competitions = self.session.exec(
             select(Competition).where(Competition.feis_id == feis.id)
         ).all()
         
+        # One query for every entry in the feis, grouped by competition
+        entries_by_comp: Dict[UUID, list] = {}
+        for entry in self.session.exec(
+            select(Entry.id, Entry.competition_id).where(
+                Entry.competition_id.in_([comp.id for comp in competitions])
+            )
+        ).all():
+            entries_by_comp.setdefault(entry.competition_id, []).append(entry)
+        
         for comp in competitions:
-            entries = self.session.exec(
-                select(Entry).where(Entry.competition_id == comp.id)
-            ).all()
+            entries = entries_by_comp.get(comp.id)
             
             if not entries:
                 continue
@@ -883,18 +923,17 @@ class DemoDataGenerator:
                 
                 # Save scores
                 for entry, score in raw_scores:
-                    judge_score = JudgeScore(
-                        id=uuid4(),  # UUID object, not string
-                        judge_id=str(judge.id),
-                        competitor_id=str(entry.id),
-                        round_id=str(comp.id),
-                        value=score,
-                        timestamp=datetime.combine(feis.date, datetime.min.time()) + timedelta(hours=10)
-                    )
-                    self.session.add(judge_score)
+                    score_rows.append({
+                        "id": uuid4(),  # UUID object, not string
+                        "judge_id": str(judge.id),
+                        "competitor_id": str(entry.id),
+                        "round_id": str(comp.id),
+                        "value": score,
+                        "timestamp": datetime.combine(feis.date, datetime.min.time()) + timedelta(hours=10),
+                    })
                     score_count += 1
         
-        self.session.flush()
+        self._bulk_insert(JudgeScore, score_rows)
         return score_count
 
 
@@ -1039,13 +1078,18 @@ def delete_demo_data(session: Session) -> dict:
         summary["users_deleted"] += 1
     
     session.commit()
+    clear_user_cache()
     
     return summary
 
 
 def has_demo_data(session: Session) -> bool:
     """Check if demo data exists in the database."""
+    # The pattern is rendered inline (not bound) so SQLite can match it to the
+    # ix_user_demo_email partial index, which only holds demo accounts.
     demo_user = session.exec(
-        select(User).where(User.email.like(f"%@{DEMO_EMAIL_DOMAIN}"))
+        select(User.id)
+        .where(User.email.like(literal(f"%@{DEMO_EMAIL_DOMAIN}", literal_execute=True)))
+        .limit(1)
     ).first()
     return demo_user is not None
@@ -3,13 +3,16 @@ Email service for Open Feis using Resend.
 Handles sending verification emails and other transactional emails.
 """
 import secrets
+import threading
 from datetime import datetime, timedelta
 from typing import Optional
 from sqlmodel import Session, select
 
 import resend
+from cachetools import TTLCache
 
 from backend.scoring_engine.models_platform import User, SiteSettings
+from backend.api.auth import invalidate_cached_user
 
 
 def get_site_settings(session: Session) -> SiteSettings:
@@ -25,6 +28,36 @@ def get_site_settings(session: Session) -> SiteSettings:
     return settings
 
 
+SITE_SETTINGS_CACHE_TTL = 60  # seconds a read of the settings row is reused
+
+_site_settings_cache: TTLCache = TTLCache(maxsize=1, ttl=SITE_SETTINGS_CACHE_TTL)
+_site_settings_lock = threading.Lock()
+
+
+def get_cached_site_settings(session: Session) -> SiteSettings:
+    """
+    Read-only site settings, cached for SITE_SETTINGS_CACHE_TTL seconds.
+
+    Returns a fresh, session-less SiteSettings built from the cached row so
+    callers can't leak changes into the cache. Use get_site_settings when the
+    settings are going to be modified.
+    """
+    with _site_settings_lock:
+        data = _site_settings_cache.get(SiteSettings.__tablename__)
+    if data is None:
+        settings = get_site_settings(session)
+        data = {column.key: getattr(settings, column.key) for column in SiteSettings.__table__.columns}
+        with _site_settings_lock:
+            _site_settings_cache[SiteSettings.__tablename__] = data
+    return SiteSettings(**data)
+
+
+def invalidate_site_settings_cache() -> None:
+    """Drop the cached settings row; call after committing a settings change."""
+    with _site_settings_lock:
+        _site_settings_cache.clear()
+
+
 def generate_verification_token() -> str:
     """Generate a secure random token for email verification."""
     return secrets.token_urlsafe(32)
@@ -32,7 +65,7 @@ def generate_verification_token() -> str:
 
 def is_email_configured(session: Session) -> bool:
     """Check if email sending is configured (Resend API key is set)."""
-    settings = get_site_settings(session)
+    settings = get_cached_site_settings(session)
     return bool(settings.resend_api_key)
 
 
@@ -47,7 +80,7 @@ def send_verification_email(
     Returns True if email was sent successfully, False otherwise.
     If Resend API key is not configured, returns False silently.
     """
-    settings = get_site_settings(session)
+    settings = get_cached_site_settings(session)
     
     if not settings.resend_api_key:
         # Email not configured - skip silently
@@ -60,6 +93,7 @@ def send_verification_email(
     user.email_verification_sent_at = datetime.utcnow()
     session.add(user)
     session.commit()
+    invalidate_cached_user(user.id)
     
     # Build verification URL
     site_url = base_url or settings.site_url
@@ -146,6 +180,7 @@ def verify_email_token(session: Session, token: str) -> Optional[User]:
     user.email_verification_sent_at = None
     session.add(user)
     session.commit()
+    invalidate_cached_user(user.id)
     session.refresh(user)
     
     return user
@@ -16,7 +16,6 @@ from uuid import UUID, uuid4
 from datetime import datetime, date, time
 from sqlmodel import Session, select
 import secrets
-from passlib.context import CryptContext
 
 from backend.scoring_engine.models_platform import (
     User, Feis, FeisSettings, FeeItem, Stage, Competition,
@@ -27,8 +26,7 @@ from backend.scoring_engine.models_platform import (
     AdjudicatorStatus, AvailabilityType
 )
 from backend.scoring_engine.models import Round, JudgeScore
-
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+from backend.api.auth import hash_password, invalidate_cached_co_organizer
 
 
 def export_feis(session: Session, feis_id: UUID) -> Dict[str, Any]:
@@ -374,7 +372,7 @@ def export_feis(session: Session, feis_id: UUID) -> Dict[str, Any]:
 def import_feis(
     session: Session,
     import_data: Dict[str, Any],
-    importing_user: User,
+    importing_user_id: UUID,
     include_orders: bool = True
 ) -> Dict[str, Any]:
     """
@@ -386,7 +384,7 @@ def import_feis(
     Args:
         session: Database session
         import_data: Exported feis data dictionary
-        importing_user: User performing the import (becomes primary organizer)
+        importing_user_id: ID of the user performing the import (becomes primary organizer)
         include_orders: Whether to import order history
     
     Returns:
@@ -425,7 +423,7 @@ def import_feis(
             name=feis_data["name"],
             date=date.fromisoformat(feis_data["date"]),
             location=feis_data["location"],
-            organizer_id=importing_user.id,
+            organizer_id=importing_user_id,
         )
         session.add(new_feis)
         session.flush()
@@ -511,7 +509,7 @@ def import_feis(
             new_user = User(
                 email=email,
                 name=name,
-                password_hash=pwd_context.hash(temp_password),
+                password_hash=hash_password(temp_password),
                 role=role,
                 email_verified=False,
             )
@@ -730,6 +728,7 @@ def import_feis(
             session.add(coverage)
         
         # Import co-organizers
+        co_organizer_user_ids = []
         for co_org_data in import_data.get("co_organizers", []):
             user_email = co_org_data.get("user_email")
             if not user_email:
@@ -752,10 +751,11 @@ def import_feis(
                 can_manage_schedule=co_org_data.get("can_manage_schedule", False),
                 can_manage_adjudicators=co_org_data.get("can_manage_adjudicators", False),
                 can_add_organizers=co_org_data.get("can_add_organizers", False),
-                added_by=importing_user.id,
+                added_by=importing_user_id,
                 added_at=datetime.fromisoformat(co_org_data["added_at"]) if co_org_data.get("added_at") else datetime.utcnow(),
             )
             session.add(co_org)
+            co_organizer_user_ids.append(user.id)
         
         # Import entries
         entry_map = {}  # old_id -> new record
@@ -882,6 +882,8 @@ def import_feis(
             session.add(score)
         
         session.commit()
+        for user_id in co_organizer_user_ids:
+            invalidate_cached_co_organizer(user_id)
         
     except Exception as e:
         report["success"] = False
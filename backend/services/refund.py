@@ -194,7 +194,7 @@ def scratch_entry(
             if order.status == PaymentStatus.COMPLETED:
                 # Check if all entries are cancelled
                 remaining = session.exec(
-                    select(Entry).where(
+                    select(Entry.id).where(
                         Entry.order_id == order.id,
                         Entry.cancelled == False
                     )
@@ -426,7 +426,7 @@ def process_partial_refund(
     
     # Check if all entries are now cancelled
     remaining = session.exec(
-        select(Entry).where(
+        select(Entry.id).where(
             Entry.order_id == order_id,
             Entry.cancelled == False
         )
@@ -43,6 +43,7 @@ Championship round codes:
 - OC = Open Championship
 """
 
+from functools import lru_cache
 from typing import Optional
 
 # Level to digit mapping
@@ -81,6 +82,7 @@ DANCE_CODES = {
 DANCE_CODE_NAMES = {v: k for k, v in DANCE_CODES.items()}
 
 
+@lru_cache(maxsize=4096)
 def generate_competition_code(
     level: str,
     min_age: int,
@@ -106,6 +108,9 @@ def generate_competition_code(
     
     Returns:
         Competition code string (e.g., "407SJ", "609PC", "9210FD", "9410FM")
+    
+    Results are memoized: syllabus generation asks for the same small set of
+    level/age/dance combinations over and over.
     """
     # Get level digit
     level_digit = LEVEL_DIGITS.get(level.lower(), "9")
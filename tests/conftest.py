@@ -0,0 +1,52 @@
+"""
+Shared fixtures for tests that need a database.
+
+Each test gets a fresh in-memory SQLite database with every table created,
+and the in-process auth caches are cleared so no state leaks between tests.
+The organizer and feis fixtures give endpoint tests a feis to work on and
+the Principal the role checkers would pass in.
+"""
+from datetime import date
+
+import pytest
+from sqlalchemy.pool import StaticPool
+from sqlmodel import Session, SQLModel, create_engine
+
+from backend.api.auth import Principal, clear_user_cache
+from backend.scoring_engine.models_platform import Feis, RoleType, User
+
+
+@pytest.fixture
+def engine():
+    engine = create_engine(
+        "sqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    SQLModel.metadata.create_all(engine)
+    clear_user_cache()
+    yield engine
+    clear_user_cache()
+    engine.dispose()
+
+
+@pytest.fixture
+def session(engine):
+    with Session(engine) as session:
+        yield session
+
+
+@pytest.fixture
+def organizer(session) -> Principal:
+    user = User(email="organizer@test.com", password_hash="x", name="Organizer", role=RoleType.ORGANIZER)
+    session.add(user)
+    session.commit()
+    return Principal(id=user.id, role=user.role, name=user.name, email=user.email, email_verified=True)
+
+
+@pytest.fixture
+def feis(session, organizer) -> Feis:
+    feis = Feis(name="Test Feis", date=date(2025, 6, 15), location="Dublin", organizer_id=organizer.id)
+    session.add(feis)
+    session.commit()
+    return feis
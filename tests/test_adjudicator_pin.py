@@ -0,0 +1,110 @@
+"""
+Tests for day-of PIN login.
+
+Covers finding the adjudicator by PIN, linking the login to an existing
+account (case-insensitively) or creating one, and rejecting bad PINs.
+"""
+import asyncio
+
+import pytest
+from fastapi import HTTPException
+from sqlmodel import func, select
+
+from backend.api.auth import decode_access_token, hash_password, pin_lookup
+from backend.api.routers import adjudicators
+from backend.api.routers.adjudicators import login_with_pin
+from backend.api.schemas import PinLoginRequest
+from backend.scoring_engine.models_platform import (
+    AdjudicatorStatus, FeisAdjudicator, RoleType, User
+)
+
+PIN = "123456"
+
+
+def _add_adjudicator(session, feis, email=None, pin=PIN, lookup=None):
+    adjudicator = FeisAdjudicator(
+        feis_id=feis.id,
+        name="Judge Mary",
+        email=email,
+        access_pin_hash=hash_password(pin),
+        access_pin_lookup=lookup or pin_lookup(feis.id, pin),
+    )
+    session.add(adjudicator)
+    session.commit()
+    return adjudicator
+
+
+def _login(session, feis, pin=PIN):
+    request = PinLoginRequest(feis_id=str(feis.id), pin=pin)
+    return asyncio.run(login_with_pin(request, session=session))
+
+
+def _user_count(session):
+    return session.exec(select(func.count()).select_from(User)).one()
+
+
+class TestPinLogin:
+    """Test suite for login_with_pin."""
+
+    def test_links_existing_account_case_insensitively(self, session, feis):
+        parent = User(email="judge@example.com", password_hash="x", name="Mary", role=RoleType.PARENT)
+        session.add(parent)
+        session.commit()
+        adjudicator = _add_adjudicator(session, feis, email="Judge@Example.com")
+        users_before = _user_count(session)
+
+        response = _login(session, feis)
+
+        assert response.success
+        assert _user_count(session) == users_before
+        session.refresh(adjudicator)
+        assert adjudicator.user_id == parent.id
+        assert adjudicator.status == AdjudicatorStatus.ACTIVE
+        assert decode_access_token(response.access_token).sub == parent.id
+
+    def test_creates_adjudicator_account_once(self, session, feis):
+        adjudicator = _add_adjudicator(session, feis)
+        users_before = _user_count(session)
+
+        first = _login(session, feis)
+        second = _login(session, feis)
+
+        assert _user_count(session) == users_before + 1
+        session.refresh(adjudicator)
+        user = session.get(User, adjudicator.user_id)
+        assert user.role == RoleType.ADJUDICATOR
+        assert user.email == f"adj_{adjudicator.id}@pin.openfeis.local"
+        assert decode_access_token(first.access_token).sub == user.id
+        assert decode_access_token(second.access_token).sub == user.id
+
+    def test_rejects_wrong_pin(self, session, feis):
+        _add_adjudicator(session, feis)
+
+        with pytest.raises(HTTPException) as exc:
+            _login(session, feis, pin="654321")
+        assert exc.value.status_code == 401
+
+    def test_rejects_feis_without_pins(self, session, feis):
+        with pytest.raises(HTTPException) as exc:
+            _login(session, feis)
+        assert exc.value.status_code == 401
+
+    def test_stale_digest_falls_back_to_hash_with_ephemeral_pepper(self, session, feis, monkeypatch):
+        """A restart with a random pepper must not lock out PINs already issued."""
+        monkeypatch.setattr(adjudicators, "PIN_PEPPER_IS_EPHEMERAL", True)
+        monkeypatch.setattr(adjudicators, "_current_pepper_pins", set())
+        adjudicator = _add_adjudicator(session, feis, lookup="digest-from-previous-pepper")
+
+        assert _login(session, feis).success
+
+        session.refresh(adjudicator)
+        assert adjudicator.access_pin_lookup == pin_lookup(feis.id, PIN)
+        assert adjudicator.id in adjudicators._current_pepper_pins
+
+    def test_stale_digest_is_not_scanned_with_persistent_pepper(self, session, feis, monkeypatch):
+        monkeypatch.setattr(adjudicators, "PIN_PEPPER_IS_EPHEMERAL", False)
+        _add_adjudicator(session, feis, lookup="digest-from-another-pepper")
+
+        with pytest.raises(HTTPException) as exc:
+            _login(session, feis)
+        assert exc.value.status_code == 401
@@ -0,0 +1,143 @@
+"""
+Tests for placement history and the advancement summary.
+
+Covers recording a placement, listing a dancer's placements with their
+competition and feis names, and the per-level/per-dance summary counts.
+"""
+from datetime import date
+from uuid import UUID, uuid4
+
+import pytest
+from fastapi import HTTPException
+
+from backend.api.routers.advancement import get_dancer_placements, record_placement
+from backend.api.schemas import PlacementHistoryCreate
+from backend.scoring_engine.models_platform import (
+    Competition, CompetitionCategory, CompetitionLevel, Dancer, DanceType, Gender,
+    PlacementHistory, ScoringMethod
+)
+from backend.services.advancement import get_dancer_placement_summary
+
+
+@pytest.fixture
+def competition(session, feis):
+    competition = Competition(
+        feis_id=feis.id, name="U10 Novice Reel", min_age=0, max_age=10,
+        level=CompetitionLevel.NOVICE, code="410R",
+        category=CompetitionCategory.SOLO, dance_type=DanceType.REEL,
+        scoring_method=ScoringMethod.SOLO,
+    )
+    session.add(competition)
+    session.commit()
+    return competition
+
+
+@pytest.fixture
+def dancer(session, organizer):
+    dancer = Dancer(
+        parent_id=organizer.id, name="Aoife", dob=date(2016, 3, 15),
+        current_level=CompetitionLevel.NOVICE, gender=Gender.FEMALE,
+    )
+    session.add(dancer)
+    session.commit()
+    return dancer
+
+
+def _placement(session, dancer, competition, rank, level=CompetitionLevel.NOVICE,
+               dance_type=DanceType.REEL, competition_date=date(2025, 6, 15)):
+    placement = PlacementHistory(
+        dancer_id=dancer.id, competition_id=competition.id, feis_id=competition.feis_id,
+        rank=rank, level=level, dance_type=dance_type, competition_date=competition_date,
+    )
+    session.add(placement)
+    session.commit()
+    return placement
+
+
+class TestRecordPlacement:
+    """Test suite for record_placement."""
+
+    def _create(self, dancer, competition, feis, **fields):
+        return PlacementHistoryCreate(
+            dancer_id=str(dancer.id), competition_id=str(competition.id), feis_id=str(feis.id),
+            rank=1, level=CompetitionLevel.NOVICE, competition_date=date(2025, 6, 15),
+            **fields,
+        )
+
+    def test_records_with_names_and_competition_dance(self, session, organizer, dancer, competition, feis):
+        response = record_placement(
+            self._create(dancer, competition, feis), session=session, current_user=organizer
+        )
+
+        assert response.dancer_name == "Aoife"
+        assert response.competition_name == "U10 Novice Reel"
+        assert response.feis_name == "Test Feis"
+        assert response.dance_type == DanceType.REEL
+        placement = session.get(PlacementHistory, UUID(response.id))
+        assert placement.dancer_id == dancer.id
+        assert placement.dance_type == DanceType.REEL
+
+    @pytest.mark.parametrize("missing, detail", [
+        ("dancer", "Dancer not found"),
+        ("competition", "Competition not found"),
+        ("feis", "Feis not found"),
+    ])
+    def test_missing_rows_are_404(self, session, organizer, dancer, competition, feis, missing, detail):
+        data = self._create(dancer, competition, feis)
+        setattr(data, f"{missing}_id", str(uuid4()))
+
+        with pytest.raises(HTTPException) as exc:
+            record_placement(data, session=session, current_user=organizer)
+        assert exc.value.status_code == 404
+        assert exc.value.detail == detail
+
+
+class TestPlacementHistory:
+    """Test suite for get_dancer_placements and get_dancer_placement_summary."""
+
+    def test_lists_newest_first_with_names(self, session, dancer, competition):
+        _placement(session, dancer, competition, rank=2, competition_date=date(2025, 5, 1))
+        _placement(session, dancer, competition, rank=1, competition_date=date(2025, 6, 1))
+        orphan = PlacementHistory(
+            dancer_id=dancer.id, competition_id=uuid4(), feis_id=uuid4(), rank=3,
+            level=CompetitionLevel.NOVICE, competition_date=date(2025, 4, 1),
+        )
+        session.add(orphan)
+        session.commit()
+
+        response = get_dancer_placements(str(dancer.id), session=session)
+
+        assert response.total_placements == 3
+        assert response.first_place_count == 1
+        assert [p.rank for p in response.placements] == [1, 2, 3]
+        assert response.placements[0].competition_name == "U10 Novice Reel"
+        assert response.placements[0].feis_name == "Test Feis"
+        assert response.placements[2].competition_name == "Unknown"
+        assert response.placements[2].feis_name == "Unknown"
+
+    def test_unknown_dancer_is_404(self, session):
+        with pytest.raises(HTTPException) as exc:
+            get_dancer_placements(str(uuid4()), session=session)
+        assert exc.value.status_code == 404
+
+    def test_summary_counts(self, session, dancer, competition):
+        _placement(session, dancer, competition, rank=1)
+        _placement(session, dancer, competition, rank=1, dance_type=DanceType.LIGHT_JIG)
+        _placement(session, dancer, competition, rank=3)
+        _placement(session, dancer, competition, rank=5)
+        _placement(session, dancer, competition, rank=1, level=CompetitionLevel.PRIZEWINNER, dance_type=None)
+
+        summary = get_dancer_placement_summary(session, dancer.id)
+
+        assert summary["total_placements"] == 5
+        assert summary["first_place_count"] == 3
+        assert summary["podium_count"] == 4
+        assert summary["by_level"] == {"novice": 4, "prizewinner": 1}
+        assert summary["first_places_by_dance"] == {DanceType.REEL.value: 1, DanceType.LIGHT_JIG.value: 1}
+
+    def test_summary_without_placements(self, session, dancer):
+        summary = get_dancer_placement_summary(session, dancer.id)
+
+        assert summary["total_placements"] == 0
+        assert summary["by_level"] == {}
+        assert summary["first_places_by_dance"] == {}
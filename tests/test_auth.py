@@ -0,0 +1,299 @@
+"""
+Unit tests for the authentication helpers.
+
+Covers password hashing, JWT creation/verification (including the
+verified-token cache), the cached user lookup behind get_current_user and
+the rate limiter used by the login endpoints.
+"""
+import ipaddress
+import time
+from datetime import timedelta
+from uuid import uuid4
+
+import bcrypt
+import jwt
+import pytest
+from fastapi import HTTPException
+from starlette.requests import Request
+from sqlmodel import Session
+
+from backend.api.auth import (
+    ALGORITHM, BCRYPT_ROUNDS, SECRET_KEY, _load_principal, _load_user,
+    create_access_token, decode_access_token, get_user_by_email, hash_password,
+    invalidate_cached_user, password_needs_rehash, pin_lookup, verify_password
+)
+from backend.api import rate_limit as rate_limit_module
+from backend.api.rate_limit import SlidingWindowLimiter, client_ip, rate_limit
+from backend.api.routers import auth as auth_router
+from backend.api.schemas import LoginRequest
+from backend.scoring_engine.models_platform import RoleType, User
+
+
+class TestPasswords:
+    """Test suite for bcrypt hashing helpers."""
+
+    def test_hash_and_verify(self):
+        hashed = hash_password("correct horse")
+
+        assert hashed.startswith("$2")
+        assert verify_password("correct horse", hashed)
+        assert not verify_password("wrong horse", hashed)
+
+    def test_non_bcrypt_hash_never_matches(self):
+        """Empty or foreign hashes are rejected without raising."""
+        assert not verify_password("anything", "")
+        assert not verify_password("anything", "plaintext")
+        assert not verify_password("anything", "$2b$malformed")
+
+    def test_needs_rehash_on_cost_mismatch(self):
+        """Hashes made with another cost or variant are flagged for upgrade."""
+        assert not password_needs_rehash(hash_password("pw"))
+
+        other_cost = bcrypt.hashpw(b"pw", bcrypt.gensalt(rounds=BCRYPT_ROUNDS + 1))
+        legacy_variant = bcrypt.hashpw(b"pw", bcrypt.gensalt(rounds=BCRYPT_ROUNDS, prefix=b"2a"))
+
+        assert password_needs_rehash(other_cost.decode())
+        assert password_needs_rehash(legacy_variant.decode())
+
+
+class TestPinLookup:
+    """Test suite for the keyed PIN lookup digest."""
+
+    def test_deterministic_and_feis_scoped(self):
+        feis_a, feis_b = uuid4(), uuid4()
+
+        assert pin_lookup(feis_a, "123456") == pin_lookup(feis_a, "123456")
+        assert pin_lookup(feis_a, "123456") != pin_lookup(feis_a, "123457")
+        assert pin_lookup(feis_a, "123456") != pin_lookup(feis_b, "123456")
+
+
+class TestAccessTokens:
+    """Test suite for access token round-trips."""
+
+    def test_round_trip(self):
+        """A freshly issued token decodes to the same user and role."""
+        user_id = uuid4()
+        token = create_access_token(user_id, RoleType.ORGANIZER)
+
+        claims = decode_access_token(token)
+
+        assert claims.sub == user_id
+        assert claims.role == RoleType.ORGANIZER.value
+
+    def test_sub_is_compact(self):
+        """The subject is stored as 22-char base64 rather than a UUID string."""
+        user_id = uuid4()
+        token = create_access_token(user_id, RoleType.PARENT)
+
+        payload = jwt.decode(token, options={"verify_signature": False})
+
+        assert len(payload["s"]) == 22
+
+    def test_legacy_claims_accepted(self):
+        """Tokens issued with sub/role/exp and a UUID-string subject still decode."""
+        user_id = uuid4()
+        token = jwt.encode(
+            {"sub": str(user_id), "role": "parent", "exp": int(time.time()) + 60},
+            SECRET_KEY, algorithm=ALGORITHM,
+        )
+
+        assert decode_access_token(token).sub == user_id
+
+    def test_repeated_decode_is_stable(self):
+        """Decoding the same token twice (cache hit) gives the same claims."""
+        token = create_access_token(uuid4(), RoleType.PARENT)
+
+        assert decode_access_token(token) == decode_access_token(token)
+
+    def test_expired_token_rejected(self):
+        """Expiry is enforced even though verified tokens are cached."""
+        token = create_access_token(uuid4(), RoleType.PARENT, expires_delta=timedelta(seconds=-1))
+
+        with pytest.raises(HTTPException) as exc:
+            decode_access_token(token)
+        assert exc.value.status_code == 401
+
+    def test_tampered_token_rejected(self):
+        """A token with a modified signature fails verification."""
+        token = create_access_token(uuid4(), RoleType.PARENT)
+        tampered = token[:-2] + ("AA" if token[-2:] != "AA" else "BB")
+
+        with pytest.raises(HTTPException) as exc:
+            decode_access_token(tampered)
+        assert exc.value.status_code == 401
+
+    def test_garbage_token_rejected(self):
+        with pytest.raises(HTTPException):
+            decode_access_token("not-a-token")
+
+
+class TestUserCache:
+    """Test suite for the cached user lookup."""
+
+    def _make_user(self, engine) -> User:
+        with Session(engine) as session:
+            user = User(email="cache@test.com", password_hash="x", name="Before")
+            session.add(user)
+            session.commit()
+            session.refresh(user)
+            return user
+
+    def test_hit_is_attached_and_writable(self, engine):
+        """A cached user can be modified and committed through a new session."""
+        user_id = self._make_user(engine).id
+        with Session(engine) as session:
+            _load_user(session, user_id)
+
+        with Session(engine) as session:
+            cached = _load_user(session, user_id)
+            assert cached in session
+            cached.name = "After"
+            session.add(cached)
+            session.commit()
+
+        with Session(engine) as session:
+            assert session.get(User, user_id).name == "After"
+
+    def test_invalidate_reloads_from_database(self, engine):
+        user_id = self._make_user(engine).id
+        with Session(engine) as session:
+            _load_user(session, user_id)
+            session.get(User, user_id).role = RoleType.ADJUDICATOR
+            session.commit()
+
+        with Session(engine) as session:
+            assert _load_user(session, user_id).role == RoleType.PARENT
+
+        invalidate_cached_user(user_id)
+        with Session(engine) as session:
+            assert _load_user(session, user_id).role == RoleType.ADJUDICATOR
+
+    def test_invalidate_forgets_old_email(self, engine):
+        """After an email change the old address no longer finds the user."""
+        user_id = self._make_user(engine).id
+        with Session(engine) as session:
+            assert get_user_by_email(session, "Cache@Test.com").id == user_id
+            session.get(User, user_id).email = "moved@test.com"
+            session.commit()
+
+        invalidate_cached_user(user_id)
+        with Session(engine) as session:
+            assert get_user_by_email(session, "cache@test.com") is None
+            assert get_user_by_email(session, "moved@test.com").id == user_id
+
+    def test_email_cache_keeps_exact_case_matches_apart(self, engine):
+        """Legacy accounts differing only in case each resolve to their own row."""
+        with Session(engine) as session:
+            upper = User(email="Twin@test.com", password_hash="x", name="Upper")
+            lower = User(email="twin@test.com", password_hash="x", name="Lower")
+            session.add_all([upper, lower])
+            session.commit()
+            upper_id, lower_id = upper.id, lower.id
+
+        for _ in range(2):  # second pass is served from the cache
+            with Session(engine) as session:
+                assert get_user_by_email(session, "Twin@test.com").id == upper_id
+                assert get_user_by_email(session, "twin@test.com").id == lower_id
+
+    def test_principal_matches_row(self, engine):
+        """A Principal carries the row's fields without an ORM instance."""
+        user = self._make_user(engine)
+        with Session(engine) as session:
+            principal = _load_principal(session, user.id)
+
+        assert principal.id == user.id
+        assert principal.role == RoleType.PARENT
+        assert principal.name == "Before"
+
+
+class TestRateLimit:
+    """Test suite for the sliding-window rate limiter."""
+
+    def test_rejects_after_limit_with_retry_after(self):
+        limiter = SlidingWindowLimiter(limit=2, window_seconds=60)
+        limiter.check("1.2.3.4")
+        limiter.check("1.2.3.4")
+
+        with pytest.raises(HTTPException) as exc:
+            limiter.check("1.2.3.4")
+        assert exc.value.status_code == 429
+        assert 1 <= int(exc.value.headers["Retry-After"]) <= 60
+
+        # Other keys are counted separately
+        limiter.check("5.6.7.8")
+
+    def test_window_slides(self):
+        limiter = SlidingWindowLimiter(limit=1, window_seconds=0.05)
+        assert limiter.hit("key") == 0
+        assert limiter.hit("key") > 0
+
+        time.sleep(0.06)
+        assert limiter.hit("key") == 0
+
+    @staticmethod
+    def _request(peer, forwarded_for=None):
+        headers = [(b"x-forwarded-for", forwarded_for.encode())] if forwarded_for else []
+        return Request({"type": "http", "client": (peer, 40000), "headers": headers})
+
+    @pytest.fixture
+    def behind_caddy(self, monkeypatch):
+        """Trust Caddy's network, as docker-compose.yml does."""
+        monkeypatch.setattr(rate_limit_module, "TRUSTED_PROXIES", [ipaddress.ip_network("172.30.0.0/24")])
+
+    def test_forwarded_clients_get_separate_buckets(self, behind_caddy):
+        limiter = SlidingWindowLimiter(limit=1, window_seconds=60)
+        dependency = rate_limit(limiter, "login")
+
+        # Both requests arrive from Caddy on the Docker network
+        dependency(self._request("172.30.0.2", "203.0.113.5"))
+        dependency(self._request("172.30.0.2", "203.0.113.6"))
+
+        with pytest.raises(HTTPException) as exc:
+            dependency(self._request("172.30.0.2", "203.0.113.5"))
+        assert exc.value.status_code == 429
+
+    def test_client_ip_ignores_forwarded_for_from_untrusted_peers(self, behind_caddy):
+        assert client_ip(self._request("198.51.100.7", "203.0.113.5")) == "198.51.100.7"
+        # A client-supplied entry to the left of the real one is not believed
+        assert client_ip(self._request("172.30.0.2", "10.0.0.1, 203.0.113.5")) == "203.0.113.5"
+        assert client_ip(self._request("172.30.0.2")) == "172.30.0.2"
+
+    def test_docker_bridge_gateway_is_not_trusted_by_default(self):
+        """A published port reaches the app from the bridge gateway; its header is the client's."""
+        assert client_ip(self._request("172.17.0.1", "203.0.113.5")) == "172.17.0.1"
+        assert client_ip(self._request("127.0.0.1", "203.0.113.5")) == "203.0.113.5"
+
+    def test_ensure_allowed_does_not_record(self):
+        limiter = SlidingWindowLimiter(limit=1, window_seconds=60)
+        limiter.ensure_allowed("key")
+        limiter.ensure_allowed("key")
+
+        limiter.hit("key")
+        with pytest.raises(HTTPException) as exc:
+            limiter.ensure_allowed("key")
+        assert exc.value.status_code == 429
+
+    def test_login_email_limit_counts_only_failures(self, engine, monkeypatch):
+        monkeypatch.setattr(auth_router, "LOGIN_EMAIL_LIMITER", SlidingWindowLimiter(limit=2, window_seconds=60))
+        with Session(engine) as session:
+            session.add(User(
+                email="limited@test.com", name="Limited", email_verified=True,
+                password_hash=bcrypt.hashpw(b"right", bcrypt.gensalt(rounds=BCRYPT_ROUNDS)).decode(),
+            ))
+            session.commit()
+
+        def attempt(password):
+            with Session(engine) as session:
+                return auth_router.login(LoginRequest(email="Limited@test.com", password=password), session=session)
+
+        for _ in range(3):
+            assert attempt("right").access_token
+
+        for _ in range(2):
+            with pytest.raises(HTTPException) as exc:
+                attempt("wrong")
+            assert exc.value.status_code == 401
+
+        with pytest.raises(HTTPException) as exc:
+            attempt("right")
+        assert exc.value.status_code == 429
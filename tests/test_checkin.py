@@ -0,0 +1,151 @@
+"""
+Tests for dancer check-in.
+
+Exercises the check-in endpoints the way the router calls them: single and
+by-number check-in, bulk check-in, undo, and the dancer QR code.
+"""
+from datetime import date
+from uuid import uuid4
+
+import pytest
+from fastapi import HTTPException
+from starlette.requests import Request
+
+from backend.api.routers.checkin import (
+    bulk_check_in, check_in_by_number, check_in_dancer, generate_checkin_qr_code,
+    undo_check_in_endpoint
+)
+from backend.api.schemas import BulkCheckInRequest, CheckInRequest
+from backend.scoring_engine.models_platform import (
+    CheckInStatus, Competition, CompetitionCategory, CompetitionLevel, Dancer,
+    DanceType, Entry, Gender, RoleType, ScoringMethod, User
+)
+
+
+@pytest.fixture
+def parent(session):
+    user = User(email="parent@test.com", password_hash="x", name="Parent", role=RoleType.PARENT)
+    session.add(user)
+    session.commit()
+    return user
+
+
+@pytest.fixture
+def entries(session, feis, parent):
+    """Three entries in one competition: numbers 101 and 102, and a scratched 103."""
+    competition = Competition(
+        feis_id=feis.id, name="U8 Reel", min_age=6, max_age=8,
+        level=CompetitionLevel.BEGINNER_1, code="208R",
+        category=CompetitionCategory.SOLO, dance_type=DanceType.REEL,
+        scoring_method=ScoringMethod.SOLO,
+    )
+    dancer = Dancer(
+        parent_id=parent.id, name="Aoife", dob=date(2018, 3, 15),
+        current_level=CompetitionLevel.BEGINNER_1, gender=Gender.FEMALE,
+    )
+    session.add_all([competition, dancer])
+    session.flush()
+    rows = [
+        Entry(dancer_id=dancer.id, competition_id=competition.id, competitor_number=101),
+        Entry(dancer_id=dancer.id, competition_id=competition.id, competitor_number=102),
+        Entry(dancer_id=dancer.id, competition_id=competition.id, competitor_number=103, cancelled=True),
+    ]
+    session.add_all(rows)
+    session.commit()
+    return rows
+
+
+def _qr_request(etag=None):
+    headers = [(b"if-none-match", etag.encode())] if etag else []
+    return Request({"type": "http", "headers": headers})
+
+
+class TestCheckIn:
+    """Test suite for the check-in endpoints."""
+
+    def test_check_in_and_repeat(self, session, organizer, entries):
+        entry = entries[0]
+        response = check_in_dancer(CheckInRequest(entry_id=str(entry.id)), session=session, current_user=organizer)
+
+        assert response.status == CheckInStatus.CHECKED_IN
+        assert response.message == "Successfully checked in"
+        assert response.dancer_name == "Aoife"
+        assert response.competition_name == "U8 Reel"
+        session.refresh(entry)
+        assert entry.check_in_status == CheckInStatus.CHECKED_IN
+        assert entry.checked_in_by == organizer.id
+        assert response.checked_in_at == entry.checked_in_at
+
+        again = check_in_dancer(CheckInRequest(entry_id=str(entry.id)), session=session, current_user=organizer)
+        assert again.message == "Already checked in"
+
+    def test_check_in_rejects_scratched_and_unknown_entries(self, session, organizer, entries):
+        for entry_id in (entries[2].id, uuid4()):
+            with pytest.raises(HTTPException) as exc:
+                check_in_dancer(CheckInRequest(entry_id=str(entry_id)), session=session, current_user=organizer)
+            assert exc.value.status_code == 400
+
+    def test_check_in_by_feis_number(self, session, organizer, entries):
+        feis_id = str(session.get(Competition, entries[0].competition_id).feis_id)
+
+        response = check_in_by_number(feis_id, 102, session=session, current_user=organizer)
+        assert response.entry_id == str(entries[1].id)
+        assert response.competitor_number == 102
+
+        with pytest.raises(HTTPException) as exc:
+            check_in_by_number(feis_id, 999, session=session, current_user=organizer)
+        assert exc.value.status_code == 404
+
+    def test_bulk_check_in_keeps_request_order(self, session, organizer, entries):
+        missing = uuid4()
+        entry_ids = [entries[1].id, missing, entries[2].id, entries[0].id]
+
+        response = bulk_check_in(
+            BulkCheckInRequest(entry_ids=[str(entry_id) for entry_id in entry_ids]),
+            session=session, current_user=organizer,
+        )
+
+        assert (response.successful, response.failed) == (2, 2)
+        assert [result.entry_id for result in response.results] == [str(entry_id) for entry_id in entry_ids]
+        assert [result.status for result in response.results] == [
+            CheckInStatus.CHECKED_IN, CheckInStatus.NOT_CHECKED_IN,
+            CheckInStatus.SCRATCHED, CheckInStatus.CHECKED_IN,
+        ]
+        for entry in entries[:2]:
+            session.refresh(entry)
+            assert entry.check_in_status == CheckInStatus.CHECKED_IN
+
+    def test_undo_check_in(self, session, organizer, entries):
+        entry = entries[0]
+        check_in_dancer(CheckInRequest(entry_id=str(entry.id)), session=session, current_user=organizer)
+
+        response = undo_check_in_endpoint(str(entry.id), session=session, current_user=organizer)
+
+        assert response.status == CheckInStatus.NOT_CHECKED_IN
+        session.refresh(entry)
+        assert entry.check_in_status == CheckInStatus.NOT_CHECKED_IN
+        assert entry.checked_in_at is None
+
+    def test_qr_code_etag(self, session, parent, entries):
+        dancer_id = str(entries[0].dancer_id)
+
+        response = generate_checkin_qr_code(dancer_id, _qr_request(), session=session, current_user=parent)
+        assert response.status_code == 200
+        assert response.media_type == "image/png"
+        assert response.body.startswith(b"\x89PNG")
+        etag = response.headers["etag"]
+
+        cached = generate_checkin_qr_code(dancer_id, _qr_request(etag), session=session, current_user=parent)
+        assert cached.status_code == 304
+        assert cached.headers["etag"] == etag
+
+    def test_qr_code_only_for_own_dancers(self, session, entries):
+        other_parent = User(email="other@test.com", password_hash="x", name="Other", role=RoleType.PARENT)
+        session.add(other_parent)
+        session.commit()
+
+        with pytest.raises(HTTPException) as exc:
+            generate_checkin_qr_code(
+                str(entries[0].dancer_id), _qr_request(), session=session, current_user=other_parent
+            )
+        assert exc.value.status_code == 403
@@ -0,0 +1,60 @@
+"""
+Tests for the demo data generator.
+
+Checks that the bulk-inserted rows line up with the summary it reports,
+that every row links up, and that the demo data can be removed again.
+"""
+import random
+
+import pytest
+from sqlmodel import func, select
+
+from backend.scoring_engine.models_platform import Competition, Dancer, Entry, Feis, User
+from backend.scoring_engine.models import JudgeScore
+from backend.services.demo_data import (
+    DEMO_EMAIL_DOMAIN, delete_demo_data, has_demo_data, populate_demo_data
+)
+
+
+def _count(session, model, *criteria):
+    return session.exec(select(func.count()).select_from(model).where(*criteria)).one()
+
+
+@pytest.fixture
+def summary(session):
+    random.seed(1234)
+    return populate_demo_data(session)
+
+
+class TestDemoData:
+    """Test suite for populate_demo_data and delete_demo_data."""
+
+    def test_rows_match_summary(self, session, summary):
+        assert has_demo_data(session)
+        assert _count(session, Feis) == summary["feiseanna"] == 3
+        assert _count(session, Competition) == summary["competitions"]
+        assert _count(session, Dancer) == summary["dancers"] > 0
+        assert _count(session, Entry) == summary["entries"] > 0
+        assert _count(session, JudgeScore) == summary["scores"] > 0
+
+    def test_bulk_rows_reference_existing_parents_and_dancers(self, session, summary):
+        orphan_dancers = _count(
+            session, Dancer, Dancer.parent_id.not_in(select(User.id))
+        )
+        orphan_entries = _count(
+            session, Entry,
+            Entry.dancer_id.not_in(select(Dancer.id)) | Entry.competition_id.not_in(select(Competition.id))
+        )
+        assert orphan_dancers == 0
+        assert orphan_entries == 0
+        assert _count(session, User, User.email.like(f"demo_parent_%@{DEMO_EMAIL_DOMAIN}")) > 0
+
+    def test_delete_removes_everything(self, session, summary):
+        deleted = delete_demo_data(session)
+
+        assert deleted["feiseanna_deleted"] == 3
+        assert deleted["entries_deleted"] == summary["entries"]
+        assert deleted["scores_deleted"] == summary["scores"]
+        assert not has_demo_data(session)
+        assert _count(session, Dancer) == 0
+        assert _count(session, Entry) == 0
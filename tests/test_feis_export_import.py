@@ -17,9 +17,7 @@ from backend.scoring_engine.models_platform import (
     ScoringMethod, AdjudicatorStatus
 )
 from backend.services.feis_export import export_feis, import_feis
-from passlib.context import CryptContext
-
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+from backend.api.auth import hash_password
 
 
 def create_sample_feis(session: Session) -> tuple[Feis, User]:
@@ -28,7 +26,7 @@ def create_sample_feis(session: Session) -> tuple[Feis, User]:
     organizer = User(
         email="organizer@test.com",
         name="Test Organizer",
-        password_hash=pwd_context.hash("password123"),
+        password_hash=hash_password("password123"),
         role=RoleType.ORGANIZER,
         email_verified=True
     )
@@ -154,7 +152,7 @@ def create_sample_feis(session: Session) -> tuple[Feis, User]:
     parent = User(
         email="parent@test.com",
         name="Test Parent",
-        password_hash=pwd_context.hash("password123"),
+        password_hash=hash_password("password123"),
         role=RoleType.PARENT,
         email_verified=True
     )
@@ -243,7 +241,7 @@ def test_import_feis(session: Session):
     import_organizer = User(
         email="importer@test.com",
         name="Import User",
-        password_hash=pwd_context.hash("password123"),
+        password_hash=hash_password("password123"),
         role=RoleType.ORGANIZER,
         email_verified=True
     )
@@ -251,7 +249,7 @@ def test_import_feis(session: Session):
     session.commit()
     
     # Import the feis
-    report = import_feis(session, export_data, import_organizer, include_orders=True)
+    report = import_feis(session, export_data, import_organizer.id, include_orders=True)
     
     # Verify import success
     assert report["success"] is True
@@ -301,7 +299,7 @@ def test_import_with_existing_users(session: Session):
     users_before = len(session.exec(select(User)).all())
     
     # Import using the original organizer
-    report = import_feis(session, export_data, original_organizer, include_orders=True)
+    report = import_feis(session, export_data, original_organizer.id, include_orders=True)
     
     # Count users after import
     users_after = len(session.exec(select(User)).all())
@@ -0,0 +1,83 @@
+"""
+Tests for the SQLite migration helper.
+
+Runs run_migrations against an in-memory database shaped like one created
+before a migration, and checks the indexes it leaves behind.
+"""
+import pytest
+from sqlalchemy import text
+
+from backend.db import database
+from backend.db.database import run_migrations
+from backend.scoring_engine.models_platform import FeisAdjudicator
+
+
+def _indexes(engine, table):
+    with engine.connect() as conn:
+        return {row[1] for row in conn.execute(text(f'PRAGMA index_list("{table}")'))}
+
+
+def _index_sql(engine, name):
+    with engine.connect() as conn:
+        return conn.execute(
+            text("SELECT sql FROM sqlite_master WHERE type = 'index' AND name = :name"), {"name": name}
+        ).scalar()
+
+
+@pytest.fixture
+def legacy_invite_index(engine, monkeypatch):
+    """A database that still has the plain invite_token index."""
+    monkeypatch.setattr(database, "engine", engine)
+    with engine.connect() as conn:
+        conn.execute(text("DROP INDEX ux_feisadjudicator_invite_token"))
+        conn.execute(text("CREATE INDEX ix_feisadjudicator_invite_token ON feisadjudicator (invite_token)"))
+        conn.commit()
+    return engine
+
+
+class TestInviteTokenIndex:
+    """Test suite for the invite_token index migration."""
+
+    def _add_adjudicators(self, session, feis, *tokens):
+        session.add_all([
+            FeisAdjudicator(feis_id=feis.id, name=f"Judge {i}", invite_token=token)
+            for i, token in enumerate(tokens)
+        ])
+        session.commit()
+
+    def test_replaces_plain_index(self, session, feis, legacy_invite_index):
+        self._add_adjudicators(session, feis, "a", "b", None, None)
+
+        run_migrations()
+
+        indexes = _indexes(legacy_invite_index, "feisadjudicator")
+        assert "ux_feisadjudicator_invite_token" in indexes
+        assert "ix_feisadjudicator_invite_token" not in indexes
+
+    def test_keeps_plain_index_when_tokens_collide(self, session, feis, legacy_invite_index, capsys):
+        self._add_adjudicators(session, feis, "same", "same")
+
+        run_migrations()
+
+        indexes = _indexes(legacy_invite_index, "feisadjudicator")
+        assert "ux_feisadjudicator_invite_token" not in indexes
+        assert "ix_feisadjudicator_invite_token" in indexes
+        assert "adjudicators sharing an invite token" in capsys.readouterr().out
+
+
+class TestUserIndexes:
+    """create_all and run_migrations should build the same user indexes."""
+
+    def test_fresh_schema_has_migrated_indexes(self, engine):
+        assert {"ix_user_email_lower", "ix_user_demo_email"} <= _indexes(engine, "user")
+        assert "WHERE email LIKE '%@openfeis.demo'" in _index_sql(engine, "ix_user_demo_email")
+
+    def test_migration_adds_demo_email_index(self, engine, monkeypatch):
+        monkeypatch.setattr(database, "engine", engine)
+        with engine.connect() as conn:
+            conn.execute(text("DROP INDEX ix_user_demo_email"))
+            conn.commit()
+
+        run_migrations()
+
+        assert "WHERE email LIKE '%@openfeis.demo'" in _index_sql(engine, "ix_user_demo_email")
@@ -0,0 +1,65 @@
+"""
+Tests for the syllabus generator.
+
+Covers the competitions a request produces and re-running the generator on
+a feis that already has part of its syllabus.
+"""
+from collections import Counter
+
+from sqlmodel import select
+
+from backend.api.routers.admin import generate_syllabus
+from backend.api.schemas import SyllabusGenerationRequest
+from backend.scoring_engine.models_platform import Competition, CompetitionLevel, Gender
+
+
+def _generate(session, organizer, feis, **fields):
+    fields.setdefault("levels", [CompetitionLevel.NOVICE])
+    fields.setdefault("dances", ["Reel"])
+    request = SyllabusGenerationRequest(feis_id=feis.id, **fields)
+    return generate_syllabus(request, session=session, current_user=organizer)
+
+
+def _competitions(session, feis):
+    return session.exec(select(Competition).where(Competition.feis_id == feis.id)).all()
+
+
+class TestGenerateSyllabus:
+    """Test suite for generate_syllabus."""
+
+    def test_creates_one_competition_per_age_gender_and_dance(self, session, organizer, feis):
+        response = _generate(
+            session, organizer, feis,
+            selected_ages=["U8", "U10"], genders=[Gender.FEMALE, Gender.MALE],
+            dances=["Reel", "Light Jig"],
+        )
+
+        competitions = _competitions(session, feis)
+        assert response.generated_count == len(competitions) == 8
+        assert {c.gender for c in competitions} == {Gender.FEMALE, Gender.MALE}
+        assert {(c.min_age, c.max_age) for c in competitions} == {(0, 8), (0, 10)}
+
+    def test_rerun_skips_only_existing_competitions(self, session, organizer, feis):
+        _generate(session, organizer, feis, selected_ages=["U10"], genders=[Gender.FEMALE])
+
+        response = _generate(session, organizer, feis, selected_ages=["U10"], genders=[Gender.FEMALE])
+        assert response.generated_count == 0
+        assert "Skipped 1" in response.message
+        assert len(_competitions(session, feis)) == 1
+
+    def test_rerun_with_other_genders_and_ages_keeps_shared_codes(self, session, organizer, feis):
+        _generate(session, organizer, feis, selected_ages=["U10"], genders=[Gender.FEMALE])
+
+        # Open and older-age competitions can share a code with the girls' ones
+        response = _generate(
+            session, organizer, feis,
+            selected_ages=["U10", "O9"],
+            genders=[Gender.FEMALE, Gender.MALE, Gender.OTHER],
+        )
+
+        competitions = _competitions(session, feis)
+        assert response.generated_count == 5
+        assert len(competitions) == 6
+        assert max(Counter(c.code for c in competitions).values()) > 1
+        identities = Counter((c.code, c.gender, c.min_age, c.max_age, c.name) for c in competitions)
+        assert max(identities.values()) == 1